@@ -0,0 +1,154 @@
+"""
+Example Description:
+        This module presents a drift-free pacing clock which can be used to
+        hold a fixed sample rate in the power logging examples.
+
+        Sample deadlines are computed from the start time on an absolute
+        grid using time.monotonic_ns(), so time spent taking a sample or a
+        late wake-up never pushes the following samples back. Overruns are
+        either skipped or caught up, and each run keeps jitter and overrun
+        statistics.
+
+        It is shared by the examples of every series. Scripts that use it
+        add this Common folder to sys.path before importing it.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file acquisition_clock.py
+
+"""
+
+import math
+import time
+from dataclasses import dataclass
+
+SKIP = "skip"
+CATCH_UP = "catch_up"
+
+
+@dataclass
+class ClockStatistics:
+    """Pacing statistics for one run of an AcquisitionClock.
+
+    Attributes:
+        ticks (int): Number of sample slots that have been released.
+        overruns (int): Number of times a sample took longer than its slot.
+        skipped (int): Sample slots dropped by the SKIP policy.
+        mean_jitter (float): Mean lateness of the wake-ups in seconds.
+        std_jitter (float): Standard deviation of the lateness in seconds.
+        max_jitter (float): Worst lateness in seconds.
+    """
+    ticks: int
+    overruns: int
+    skipped: int
+    mean_jitter: float
+    std_jitter: float
+    max_jitter: float
+
+
+class AcquisitionClock:
+    """Paces a sample loop on an absolute, drift-free schedule.
+
+    Args:
+        interval (float): Sample period in seconds.
+        overrun_policy (str, optional): What to do when a sample overruns its
+            slot. SKIP drops the missed slots and waits for the next one on
+            the grid. CATCH_UP releases the missed slots back to back until
+            the loop is on schedule again. Defaults to SKIP.
+    """
+    def __init__(self, interval:float, overrun_policy:str=SKIP):
+        if interval <= 0:
+            raise ValueError("interval must be greater than 0")
+        if overrun_policy not in (SKIP, CATCH_UP):
+            raise ValueError(f"overrun_policy must be {SKIP!r} or {CATCH_UP!r}")
+        self._interval_ns = int(round(interval * 1e9))
+        self._policy = overrun_policy
+        self.start()
+
+    def start(self):
+        """Restarts the schedule and clears the statistics. The first slot is released immediately."""
+        self._start_ns = time.monotonic_ns()
+        self._tick = 0
+        self._overruns = 0
+        self._skipped = 0
+        self._jitter_count = 0
+        self._jitter_mean = 0.0
+        self._jitter_m2 = 0.0
+        self._jitter_max = 0.0
+
+    def elapsed(self)->float:
+        """Returns the seconds since the clock was started.
+
+        Returns:
+            float: Elapsed time in seconds.
+        """
+        return (time.monotonic_ns() - self._start_ns) / 1e9
+
+    def wait(self)->int:
+        """Blocks until the next sample slot on the schedule.
+
+        Returns:
+            int: The index of the slot just released, counted from 0 at start.
+        """
+        self._tick += 1
+        deadline = self._start_ns + self._tick * self._interval_ns
+        now = time.monotonic_ns()
+
+        if now >= deadline:
+            self._overruns += 1
+            if self._policy == CATCH_UP:
+                return self._tick
+            late_slots = (now - deadline) // self._interval_ns + 1
+            self._skipped += late_slots
+            self._tick += late_slots
+            deadline += late_slots * self._interval_ns
+
+        time.sleep((deadline - now) / 1e9)
+        self._record_jitter((time.monotonic_ns() - deadline) / 1e9)
+        return self._tick
+
+    def _record_jitter(self, lateness:float):
+        # Welford's running mean and variance
+        self._jitter_count += 1
+        delta = lateness - self._jitter_mean
+        self._jitter_mean += delta / self._jitter_count
+        self._jitter_m2 += delta * (lateness - self._jitter_mean)
+        self._jitter_max = max(self._jitter_max, lateness)
+
+    def statistics(self)->ClockStatistics:
+        """Returns the jitter and overrun statistics for the current run.
+
+        Returns:
+            ClockStatistics: Statistics since the clock was last started.
+        """
+        std = math.sqrt(self._jitter_m2 / (self._jitter_count - 1)) if self._jitter_count > 1 else 0.0
+        return ClockStatistics(ticks=self._tick + 1 - self._skipped,
+                               overruns=self._overruns,
+                               skipped=self._skipped,
+                               mean_jitter=self._jitter_mean,
+                               std_jitter=std,
+                               max_jitter=self._jitter_max)
@@ -0,0 +1,143 @@
+"""
+Example Description:
+        This module is the one place where the Bird sensor simulators touch
+        pyvisa-sim internals. pyvisa-sim has no public API for changing how
+        a device parses messages, so the simulators hook into private
+        Device attributes. Every such hook is a method of SimulatedDevice,
+        so a pyvisa-sim release that changes them only needs this file
+        updating.
+
+        The hooks were written against pyvisa-sim 0.7.1; install that
+        version with pip install pyvisa-sim==0.7.1. Any other version gives
+        a warning when a device is opened.
+
+        Scripts that use it add this Common folder to sys.path before
+        importing it.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file pyvisa_sim_adapter.py
+
+"""
+
+import time
+import warnings
+from importlib import metadata
+import pyvisa
+# Returned by match() for a command without a reply
+from pyvisa_sim.component import NoResponse
+
+# The pyvisa-sim release the private hooks below were checked against
+TESTED_VERSION = "0.7.1"
+
+
+def open_simulation(definitions:str)->pyvisa.ResourceManager:
+    """Opens a resource manager on the pyvisa-sim backend.
+
+    Args:
+        definitions (str): Path of the YAML device definitions.
+
+    Returns:
+        pyvisa.ResourceManager: The simulated resource manager.
+    """
+    version = metadata.version("pyvisa-sim")
+    if version != TESTED_VERSION:
+        warnings.warn(f"The Bird simulators were tested with pyvisa-sim {TESTED_VERSION}, found {version}")
+    return pyvisa.ResourceManager(f"{definitions}@sim")
+
+
+class SimulatedDevice():
+    """The pyvisa-sim device behind one simulated resource.
+
+    Args:
+        resource_manager (pyvisa.ResourceManager): From open_simulation().
+        resource (str): The resource string of the device, in any form VISA accepts.
+    """
+    def __init__(self, resource_manager:pyvisa.ResourceManager, resource:str):
+        # Devices are registered under the canonical resource name
+        name = resource_manager.resource_info(resource).resource_name
+        self._device = resource_manager.visalib.devices[name]
+
+    @property
+    def query_eom(self)->bytes:
+        """The termination that ends each message written to the device."""
+        return self._device._query_eom
+
+    def get(self, name:str):
+        """Returns the present value of a property from the definitions."""
+        return self._device._properties[name].get_value()
+
+    def initialise(self, name:str, value:str):
+        """Sets a property from the definitions, bypassing its setter."""
+        self._device._properties[name].init_value(value)
+
+    def match(self, query:bytes):
+        """Answers one command from the definitions.
+
+        Returns:
+            The reply bytes, NoResponse for a command without a reply, an
+            error reply for a rejected setter, or None if nothing matched.
+        """
+        return self._device._match(query)
+
+    def push_error(self, error:bytes):
+        """Adds an entry to the SYST:ERR? queue."""
+        for error_queue in self._device._error_queues.values():
+            error_queue._queue.append(error)
+
+    def command_error(self):
+        """Adds the command error of the definitions to the SYST:ERR? queue."""
+        self._device.error_response("command_error")
+
+    def clear_errors(self):
+        """Empties the SYST:ERR? queue."""
+        for error_queue in self._device._error_queues.values():
+            error_queue._queue.clear()
+
+    def send_reply(self, reply:bytes):
+        """Queues a reply, with its termination, for the next read."""
+        self._device._output_buffers.append(bytearray(reply) + self._device._response_eom)
+
+    def intercept_writes(self, handler):
+        """Routes every write to the device through handler(data) instead of
+        the pyvisa-sim parser.
+        """
+        self._device.write = handler
+
+    def delay_replies(self, delay:float):
+        """Makes every complete message take at least delay seconds, modelling
+        the bus round trip.
+        """
+        write = self._device.write
+        eom = self.query_eom
+
+        def delayed_write(data:bytes):
+            write(data)
+            if data.endswith(eom):
+                time.sleep(delay)
+
+        self._device.write = delayed_write
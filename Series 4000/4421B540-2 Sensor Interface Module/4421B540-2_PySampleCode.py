@@ -12,14 +12,11 @@
 
 import serial
 import datetime
+import math
 
 # The following functino is necssary to convert the measurement data from Bird's FP format to the standard IEEE FP format.
 def bird_float_2_IEEE_float(hex):
-    temp = [0, 0, 0, 0]
-    i = 0
-    for h in hex:
-        temp[i] = ord(h)
-        i += 1
+    temp = b''.join(hex)
     mantissa = (temp[1]<<16) + (temp[2]<<8) + (temp[3])
 
     if temp[1] & 0x80:
@@ -34,17 +31,8 @@ def bird_float_2_IEEE_float(hex):
     if (fexp >= 0x80):
         fexp -= 1 << 8
 
-    f = sign*((float(mantissa))/(0x800000))
-
-    if (fexp < 0):
-        while fexp != 0:
-            f = f/2
-            fexp += 1
-
-    else:
-        while fexp != 0:
-            f = f*2
-            fexp -= 1
+    # Apply the exponent in one step rather than doubling/halving once per step.
+    f = sign*math.ldexp(mantissa, fexp - 23)
 
     return f
 
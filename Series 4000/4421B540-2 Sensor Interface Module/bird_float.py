@@ -0,0 +1,144 @@
+"""
+Example Description:
+        This module converts measurement data from Bird's 4-byte floating
+        point format, as returned by the 4421B540-2 sensor interface module,
+        to standard IEEE floating point values.
+
+        A scalar decoder is provided for individual readings along with a
+        NumPy batch decoder for converting whole arrays of raw readings in
+        a single call, for example when reprocessing logged data.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file bird_float.py
+
+"""
+
+import math
+import numpy as np
+
+# The Bird format is laid out as follows:
+#   byte 0      - signed 8-bit binary exponent
+#   bytes 1..3  - 24-bit mantissa, most significant byte first, scaled by 2^-23
+# When the top bit of byte 1 is set the value is negative and 0xff is added
+# to the mantissa before scaling.
+
+
+def bird_float_2_IEEE_float(raw)->float:
+    """Converts one reading from Bird's FP format to the standard IEEE FP format.
+
+    The exponent is applied in a single step with math.ldexp. Every Bird value
+    is exactly representable as a double, so the result is bit-for-bit equal
+    to scaling the mantissa by 2 one exponent step at a time.
+
+    Args:
+        raw (bytes): The four bytes of the reading. A list of four single
+            byte objects, as produced by splitting a serial read, is also
+            accepted.
+
+    Returns:
+        float: The floating point value of the converted data.
+    """
+    if not isinstance(raw, (bytes, bytearray)):
+        raw = b''.join(raw)
+    fexp = raw[0] - 256 if raw[0] >= 0x80 else raw[0]
+    mantissa = (raw[1] << 16) + (raw[2] << 8) + raw[3]
+
+    if raw[1] & 0x80:
+        return -math.ldexp(mantissa + 0xff, fexp - 23)
+    return math.ldexp(mantissa, fexp - 23)
+
+
+def IEEE_float_2_bird_float(value:float)->bytes:
+    """Converts a standard IEEE FP value to Bird's 4-byte FP format.
+
+    This is the inverse of bird_float_2_IEEE_float() and is mainly useful for
+    producing test data. Positive values round-trip to within the 23-bit
+    mantissa resolution. Negative values carry the 0xff mantissa offset, so
+    values very close to a power of two are limited to slightly less
+    resolution.
+
+    Args:
+        value (float): The value to encode.
+
+    Raises:
+        OverflowError: If the value is outside the range of the 8-bit exponent.
+
+    Returns:
+        bytes: The four bytes of the encoded reading.
+    """
+    if value == 0.0:
+        return bytes(4)
+    fraction, fexp = math.frexp(abs(value))
+    if value > 0.0:
+        # fraction is in [0.5, 1), so the mantissa stays below the sign bit
+        mantissa = round(math.ldexp(fraction, 23))
+        if mantissa == 0x800000:
+            mantissa >>= 1
+            fexp += 1
+    else:
+        # Scale into [1, 2) so the sign bit is set, then remove the 0xff offset
+        fexp -= 1
+        mantissa = max(round(math.ldexp(fraction, 24)) - 0xff, 0x800000)
+    if not -128 <= fexp <= 127:
+        raise OverflowError(f"{value} is outside the Bird FP range")
+    return bytes([fexp & 0xff]) + mantissa.to_bytes(3, 'big')
+
+
+def bird_floats_2_IEEE_floats(raw)->np.ndarray:
+    """Converts many readings from Bird's FP format to IEEE FP in one call.
+
+    Args:
+        raw (bytes or np.ndarray): Either a bytes-like object holding a whole
+            number of 4-byte readings back to back, or a uint8 array whose
+            last axis has length 4.
+
+    Returns:
+        np.ndarray: float64 values. For bytes-like input the result is one
+        dimensional, for array input it has the input shape without the
+        last axis.
+    """
+    if isinstance(raw, (bytes, bytearray, memoryview)):
+        data = np.frombuffer(raw, dtype=np.uint8)
+        shape = (data.size // 4,)
+    else:
+        data = np.asarray(raw, dtype=np.uint8)
+        shape = data.shape[:-1] if data.ndim > 1 else (data.size // 4,)
+    if data.size % 4 != 0 or (data.ndim > 1 and data.shape[-1] != 4):
+        raise ValueError("Bird FP data must be made of whole 4-byte readings")
+    data = data.reshape(-1, 4)
+
+    fexp = data[:, 0].astype(np.int8).astype(np.int32)
+    mantissa = ((data[:, 1].astype(np.int64) << 16)
+                | (data[:, 2].astype(np.int64) << 8)
+                | data[:, 3])
+    negative = (data[:, 1] & 0x80) != 0
+    mantissa[negative] += 0xff
+
+    values = np.ldexp(mantissa.astype(np.float64), fexp - 23)
+    values[negative] = -values[negative]
+    return values.reshape(shape)
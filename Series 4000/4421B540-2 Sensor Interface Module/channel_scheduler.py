@@ -0,0 +1,119 @@
+"""
+Example Description:
+        This module presents a multi-rate channel scheduler which can be
+        used on top of the Bird4421B540Class driver.
+
+        Each channel (forward power, reflected power, temperature) is given
+        its own sample period. Channels that are due are sent together in
+        one pipelined exchange, so fast channels keep the 9600 baud link
+        busy while slow channels are only added when they fall due.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file channel_scheduler.py
+
+"""
+
+import math
+import time
+from dataclasses import dataclass
+from interface_module_4421B540_2_serial import MEASUREMENT_CHANNELS
+
+
+@dataclass
+class ChannelSample:
+    """One reading from the merged channel stream.
+
+    Attributes:
+        timestamp (float): Seconds since the scheduler started, estimated for
+            when this channel's reply arrived within its exchange.
+        channel (str): "F", "R" or "T".
+        value (float): Power in watts for F and R, degrees C for T.
+    """
+    timestamp: float
+    channel: str
+    value: float
+
+
+class ChannelScheduler:
+    """Samples each 4421 channel at its own rate over one serial link.
+
+    Args:
+        sensor (Bird4421B540Class): A connected 4421B540-2 driver instance.
+        periods (dict, optional): Sample period in seconds keyed by channel
+            letter. A period of 0 samples the channel in every exchange, i.e.
+            at the maximum link rate. Channels left out are not sampled.
+            Defaults to F and R at the link rate and T every 10 s.
+    """
+    def __init__(self, sensor, periods:dict=None):
+        if periods is None:
+            periods = {"F": 0.0, "R": 0.0, "T": 10.0}
+        if not periods or any(c not in MEASUREMENT_CHANNELS for c in periods):
+            raise ValueError(f"periods must be keyed by {MEASUREMENT_CHANNELS} channel letters")
+        self._sensor = sensor
+        # Keep the command order fixed so replies always map the same way
+        self._periods = {c: float(periods[c]) for c in MEASUREMENT_CHANNELS if c in periods}
+
+    def _due_channels(self, next_due:dict, now:float)->str:
+        return "".join(c for c in self._periods if next_due[c] <= now)
+
+    def samples(self, duration:float=None):
+        """Generates the merged, timestamped stream of channel readings.
+
+        Args:
+            duration (float, optional): Seconds to run for. Defaults to None, which runs until the caller stops iterating.
+
+        Yields:
+            ChannelSample: Readings in time order, each channel carrying its own timestamp.
+        """
+        start = time.monotonic()
+        next_due = {c: start for c in self._periods}
+
+        while duration is None or time.monotonic() - start < duration:
+            now = time.monotonic()
+            due = self._due_channels(next_due, now)
+            if not due:
+                time.sleep(max(0.0, min(next_due.values()) - now))
+                continue
+
+            t1 = time.monotonic()
+            values = self._sensor.measure_all(due)
+            t2 = time.monotonic()
+
+            # Replies arrive back to back, so spread the timestamps across the exchange
+            for i, (channel, value) in enumerate(zip(due, values)):
+                timestamp = t1 + (t2 - t1) * (i + 1) / len(due) - start
+                yield ChannelSample(timestamp, channel, value)
+
+                period = self._periods[channel]
+                if period == 0.0:
+                    next_due[channel] = t2
+                else:
+                    next_due[channel] += period
+                    if next_due[channel] < t2:
+                        # Missed slots are skipped instead of being bunched up
+                        next_due[channel] += period * math.ceil((t2 - next_due[channel]) / period)
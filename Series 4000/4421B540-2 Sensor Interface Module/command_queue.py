@@ -0,0 +1,182 @@
+"""
+Example Description:
+        This module presents a thread-safe command queue which can be used
+        to share one 4421B540-2 sensor interface module between several
+        threads, for example a GUI and a logger.
+
+        A single I/O thread owns the serial port, so replies can never be
+        interleaved between callers. Requests that arrive while the port is
+        busy are merged into one pipelined exchange, and requests for
+        quantities already being read within the coalescing window share
+        that exchange's result instead of going out on the bus again.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file command_queue.py
+
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+from interface_module_4421B540_2_serial import MEASUREMENT_CHANNELS
+
+
+class _Flight:
+    # One serial transaction and everyone waiting on its result
+    def __init__(self, channels:str, waiters:list):
+        self.channels = channels
+        self.started = time.monotonic()
+        self.waiters = waiters
+
+
+class Bird4421B540CommandQueue:
+    """Serialises access to a Bird4421B540Class through one I/O thread.
+
+    Args:
+        sensor (Bird4421B540Class): A connected 4421B540-2 driver instance.
+            Once handed to the queue it should only be used through the queue.
+        coalesce_window (float, optional): Seconds after an exchange starts
+            during which new requests for the same quantities join it rather
+            than triggering another exchange. Defaults to 0.02.
+    """
+    def __init__(self, sensor, coalesce_window:float=0.02):
+        self._sensor = sensor
+        self._coalesce_window = coalesce_window
+        self._cond = threading.Condition()
+        self._pending = []
+        self._inflight = None
+        self._closed = False
+        self._transactions = 0
+        self._thread = threading.Thread(target=self._run, name="4421-io", daemon=True)
+        self._thread.start()
+
+    def submit(self, channels:str="FRT")->Future:
+        """Queues a measurement request without waiting for the result.
+
+        Args:
+            channels (str, optional): Any combination of "F", "R" and "T". Defaults to "FRT".
+
+        Returns:
+            Future: Resolves to a tuple of readings in the same order as channels.
+        """
+        if not channels or any(c not in MEASUREMENT_CHANNELS for c in channels):
+            raise ValueError(f"channels must be made of {MEASUREMENT_CHANNELS}, got {channels!r}")
+        future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("The command queue has been closed")
+            flight = self._inflight
+            if (flight is not None
+                    and set(channels) <= set(flight.channels)
+                    and time.monotonic() - flight.started <= self._coalesce_window):
+                flight.waiters.append((channels, future))
+            else:
+                self._pending.append((channels, future))
+                self._cond.notify()
+        return future
+
+    def measure_all(self, channels:str="FRT", timeout:float=None)->tuple:
+        """Returns several readings, waiting for the I/O thread to get them.
+
+        Args:
+            channels (str, optional): Any combination of "F", "R" and "T". Defaults to "FRT".
+            timeout (float, optional): Seconds to wait for the result. Defaults to None, which waits indefinitely.
+
+        Returns:
+            tuple: The readings in the same order as channels.
+        """
+        return self.submit(channels).result(timeout)
+
+    def measure_forward_power(self, timeout:float=None)->float:
+        """Returns the forward power as measured by the sensor.
+
+        Returns:
+            float: The forward power of the sensor.
+        """
+        return self.measure_all("F", timeout)[0]
+
+    def measure_reflected_power(self, timeout:float=None)->float:
+        """Returns the reflected power as measured by the sensor.
+
+        Returns:
+            float: The reflected power of the sensor.
+        """
+        return self.measure_all("R", timeout)[0]
+
+    def measure_temperature(self, timeout:float=None)->float:
+        """Returns the internal temperature of the sensor.
+
+        Returns:
+            float: The internal temperature of the sensor.
+        """
+        return self.measure_all("T", timeout)[0]
+
+    @property
+    def transaction_count(self)->int:
+        """Returns the number of serial exchanges performed so far.
+
+        Returns:
+            int: Exchange count.
+        """
+        return self._transactions
+
+    def close(self):
+        """Stops the I/O thread once all queued requests have been served.
+        The sensor itself is left open.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                waiters, self._pending = self._pending, []
+                channels = "".join(c for c in MEASUREMENT_CHANNELS if any(c in w[0] for w in waiters))
+                flight = _Flight(channels, waiters)
+                self._inflight = flight
+
+            try:
+                values = dict(zip(channels, self._sensor.measure_all(channels)))
+                error = None
+            except Exception as e:
+                error = e
+
+            with self._cond:
+                self._inflight = None
+                self._transactions += 1
+            for requested, future in flight.waiters:
+                if error is None:
+                    future.set_result(tuple(values[c] for c in requested))
+                else:
+                    future.set_exception(error)
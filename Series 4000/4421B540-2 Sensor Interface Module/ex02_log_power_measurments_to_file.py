@@ -37,6 +37,11 @@ SOFTWARE.
 """
 
 from interface_module_4421B540_2_serial import Bird4421B540Class
+import os
+import sys
+# Make the shared Common folder importable
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Common"))
+from acquisition_clock import AcquisitionClock, SKIP
 import time
 import math
 import csv
@@ -85,43 +90,39 @@ try:
         writer.writerow(header)  # Write the header
 
         log_duration = 10.0
-        elapsed_time = 0.0
         print_interval_flag = 60.0
         debug_print = 1
 
-        t1 = time.time() # Start the timer...
-        start_time = t1
+        clock = AcquisitionClock(interval=1.0, overrun_policy=SKIP) # Start the timer...
         print("Testing started....")
 
-        while elapsed_time < log_duration:
+        while clock.elapsed() < log_duration:
             # Loop to for the expected duration and log data points to file
-            # Fetch readings from the instrument
-            forward_power = birdMod1.measure_forward_power()
-            reflected_power = birdMod1.measure_reflected_power()
+            # Fetch readings from the instrument in a single F/R/T exchange
+            forward_power, reflected_power, temp = birdMod1.measure_all("FRT")
+            elapsed_time = clock.elapsed()
             #vswr = compute_vswr_from_power(forward_power, reflected_power)
             #rl = vswr_to_return_loss(vswr)
-            temp = birdMod1.measure_temperature()
             
             if debug_print == 1:
                 print(f"fwd = {forward_power:0.2f} W, rfl = {reflected_power:0.2f} W, temp = {temp:0.2f} C")
 
-            t2 = time.time()
-            delta_interval = t2-t1
-            if delta_interval < 1.0:
-                time.sleep(1.0 - delta_interval)
-                t2 = time.time()
-                elapsed_time = t2-start_time
             etime = f"{elapsed_time:0.3f}"
-            t1 = t2
 
             data = [etime, forward_power, reflected_power, temp]
 
             writer.writerow(data)   # Write the data
 
             if elapsed_time > print_interval_flag:
-                print(f"Elapsed time: {t2-t1:0.3f} s")
+                print(f"Elapsed time: {elapsed_time:0.3f} s")
                 print_interval_flag += 60.0
 
+            # Sleep until the next 1 s slot on the absolute schedule
+            clock.wait()
+
+        stats = clock.statistics()
+        print(f"Samples: {stats.ticks}, overruns: {stats.overruns}, skipped: {stats.skipped}")
+        print(f"Jitter mean/std/max: {stats.mean_jitter*1e3:0.3f}/{stats.std_jitter*1e3:0.3f}/{stats.max_jitter*1e3:0.3f} ms")
         print("Testing ended!!!")
 
 finally:
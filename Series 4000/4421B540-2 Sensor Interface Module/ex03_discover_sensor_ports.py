@@ -0,0 +1,60 @@
+"""
+Example Description:
+        This example shows how to locate 4421B540-2 sensor interface modules
+        and 5000 Series RS-232 sensors without hard-coding the serial port.
+
+        All serial ports are probed at once, then the first 4421 found is
+        opened. The serial number to port mapping is cached, so later runs
+        can call find_sensor_port() with a known serial number and only
+        confirm the cached port.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file ex03_discover_sensor_ports.py
+ 
+"""
+
+from interface_module_4421B540_2_serial import Bird4421B540Class
+from serial_port_discovery import discover_sensors, SENSOR_4421
+import time
+
+t1 = time.time()
+sensors = discover_sensors()
+t2 = time.time()
+print(f"Discovery took {t2-t1:0.3f} s")
+
+for serial_number, sensor in sensors.items():
+    print(f"{sensor.kind} ({sensor.model}) SN {serial_number} on {sensor.port}")
+
+modules = [s for s in sensors.values() if s.kind == SENSOR_4421]
+if modules:
+    birdMod1 = Bird4421B540Class()
+    try:
+        birdMod1.connect(modules[0].port)
+        print(f"Measured FWD Power (W): {birdMod1.measure_forward_power():0.4}")
+    finally:
+        birdMod1.close()
@@ -0,0 +1,73 @@
+"""
+Example Description:
+        This example shows how to use the 4421B540-2 sensor interface module
+        to log forward and reflected power at the maximum link rate while
+        temperature, which changes slowly, is only sampled every 10 seconds.
+
+        The ChannelScheduler merges the channels into one time-ordered
+        stream and each row in the file carries the time of that channel's
+        own reading. 
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file ex04_log_multi_rate_channels_to_file.py
+ 
+"""
+
+from interface_module_4421B540_2_serial import Bird4421B540Class
+from channel_scheduler import ChannelScheduler
+import time
+import csv
+
+CHANNEL_NAMES = {"F": "Fwd_Power (W)", "R": "Refl_Power (W)", "T": "Temperature (deg C)"}
+
+# Create a file to save data to
+output_data_path = time.strftime("C:\\Temp\\4421B_multi_rate_data_%Y-%m-%d_%H-%M-%S.csv")
+
+birdMod1 = Bird4421B540Class()
+
+try:
+    birdMod1.connect('COM4')
+
+    with open(output_data_path, mode='a', newline='') as file:
+        writer = csv.writer(file)
+
+        # Define the header for the CSV
+        header = ['Time (s)', 'Channel', 'Value']
+
+        writer.writerow(header)  # Write the header
+
+        scheduler = ChannelScheduler(birdMod1, periods={"F": 0.0, "R": 0.0, "T": 10.0})
+        print("Testing started....")
+
+        for sample in scheduler.samples(duration=60.0):
+            writer.writerow([f"{sample.timestamp:0.4f}", CHANNEL_NAMES[sample.channel], sample.value])
+
+        print("Testing ended!!!")
+
+finally:
+    birdMod1.close()
@@ -0,0 +1,72 @@
+"""
+Example Description:
+        This example shows how to poll several 4421B540-2 sensor interface
+        modules at the same time from a single thread using the asyncio
+        version of the driver.
+
+        Every port is kept busy concurrently, so adding modules does not
+        slow down the sample rate of the others. 
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file ex05_poll_many_modules_with_asyncio.py
+ 
+"""
+
+from interface_module_4421B540_2_asyncio import AsyncBird4421B540Class, measure_fleet, poll_fleet
+import asyncio
+
+PORTS = ['COM4', 'COM5', 'COM6']
+
+async def main():
+    modules = []
+    try:
+        for port in PORTS:
+            module = AsyncBird4421B540Class()
+            await module.connect(port)
+            modules.append(module)
+
+        # One reading from every module at once
+        for module, readings in zip(modules, await measure_fleet(modules)):
+            print(f"{module.port}: {readings}")
+
+        # Continuous polling, merged into one stream
+        count = 0
+        async for module, timestamp, readings in poll_fleet(modules, "FR", interval=0.1):
+            if isinstance(readings, Exception):
+                print(f"{module.port}: {readings}")
+                continue
+            fwd_power, rfl_power = readings
+            print(f"{timestamp:0.3f} {module.port}: fwd = {fwd_power:0.2f} W, rfl = {rfl_power:0.2f} W")
+            count += 1
+            if count >= 100:
+                break
+    finally:
+        for module in modules:
+            await module.close()
+
+asyncio.run(main())
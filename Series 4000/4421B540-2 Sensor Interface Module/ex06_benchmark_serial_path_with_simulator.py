@@ -0,0 +1,64 @@
+"""
+Example Description:
+        This example benchmarks the 4421B540-2 serial path against the
+        pseudo-terminal simulator, so no hardware is needed (Linux only).
+
+        It compares one round trip per quantity with the pipelined F/R/T
+        exchange and prints the achievable sample rate of each. 
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file ex06_benchmark_serial_path_with_simulator.py
+ 
+"""
+
+from interface_module_4421B540_2_serial import Bird4421B540Class
+from simulator_4421B540_2 import Simulated4421B540, sine
+import time
+
+SAMPLES = 50
+
+def benchmark(name, read_once):
+    t1 = time.perf_counter()
+    for j in range(SAMPLES):
+        read_once()
+    t2 = time.perf_counter()
+    print(f"{name:<28} {SAMPLES/(t2-t1):8.1f} samples/s  ({(t2-t1)/SAMPLES*1e3:0.2f} ms per reading)")
+
+with Simulated4421B540(turnaround=0.002, profiles={"F": sine(100.0, 5.0, 10.0)}) as sim:
+    birdMod1 = Bird4421B540Class()
+    try:
+        birdMod1.connect(sim.port)
+        print(f"Simulator on {sim.port}: FRT = {birdMod1.measure_all()}")
+
+        benchmark("Separate F, R, T exchanges", lambda: (birdMod1.measure_forward_power(),
+                                                         birdMod1.measure_reflected_power(),
+                                                         birdMod1.measure_temperature()))
+        benchmark("Pipelined FRT exchange", lambda: birdMod1.measure_all("FRT"))
+        benchmark("Pipelined FR exchange", lambda: birdMod1.measure_all("FR"))
+    finally:
+        birdMod1.close()
@@ -0,0 +1,78 @@
+"""
+Example Description:
+        This example shows how to use the 4421B540-2 sensor interface module
+        to log raw F/R/T frames to a compact binary file, then decode the
+        whole file to CSV in one pass once logging has finished.
+
+        The sample loop only reads the 12 reply bytes and hands them to a
+        background writer, so no decoding or formatting happens per sample. 
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file ex07_log_raw_frames_to_binary_file.py
+ 
+"""
+
+from interface_module_4421B540_2_serial import Bird4421B540Class
+import os
+import sys
+# AcquisitionClock comes from the Common folder two levels up
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Common"))
+from acquisition_clock import AcquisitionClock, SKIP
+from raw_frame_log import RawFrameWriter, load_raw_frames, export_csv
+import time
+
+# Create a file to save data to
+output_data_path = time.strftime("C:\\Temp\\4421B_raw_frames_%Y-%m-%d_%H-%M-%S.bin")
+
+birdMod1 = Bird4421B540Class()
+
+try:
+    birdMod1.connect('COM4')
+
+    writer = RawFrameWriter(output_data_path)
+    try:
+        log_duration = 60.0
+        clock = AcquisitionClock(interval=0.1, overrun_policy=SKIP)
+        print("Testing started....")
+
+        while clock.elapsed() < log_duration:
+            raw = birdMod1.read_raw("FRT")
+            writer.append(time.monotonic_ns(), raw)
+            clock.wait()
+
+        print("Testing ended!!!")
+    finally:
+        writer.close()
+
+finally:
+    birdMod1.close()
+
+# Decode the whole file at once
+data = load_raw_frames(output_data_path)
+print(f"{len(data['time'])} records, mean forward power {data['forward_power'].mean():0.3f} W")
+export_csv(output_data_path, output_data_path.replace(".bin", ".csv"))
@@ -0,0 +1,248 @@
+"""
+Example Description:
+        This class code presents an asyncio version of the driver concept
+        for the 4421B540-2 sensor interface module.
+
+        This particular version of the driver uses the pyserial-asyncio
+        module (pip install pyserial-asyncio) for non-blocking serial
+        communications, so many modules can be polled from one thread.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file interface_module_4421B540_2_asyncio.py
+
+"""
+
+import asyncio
+import serial
+import serial_asyncio
+from interface_module_4421B540_2_serial import MEASUREMENT_CHANNELS, REPLY_SIZE, decode_measurements
+
+# Errors poll_fleet() treats as passing, such as a missed reply or a port
+# that dropped out, and retries after retry_delay
+TRANSIENT_ERRORS = (asyncio.TimeoutError, serial.SerialException)
+
+
+class AsyncBird4421B540Class:
+    """asyncio client for one 4421B540-2 sensor interface module.
+
+    Args:
+        timeout (float, optional): Seconds to wait for a full reply. Defaults to 1.0.
+    """
+    # Silence, in seconds, taken to mean no more bytes of a timed out reply are coming
+    DISCARD_QUIET_TIME = 0.05
+
+    def __init__(self, timeout:float=1.0):
+        self.__reader = None
+        self.__writer = None
+        self.__baud = 9600
+        self.__timeout = timeout
+        self.__lock = asyncio.Lock()
+        self.port = None
+
+    async def connect(self, comm='COM7'):
+        self.__reader, self.__writer = await serial_asyncio.open_serial_connection(
+            url=comm,
+            baudrate=self.__baud,
+            bytesize=serial.EIGHTBITS,
+            parity=serial.PARITY_NONE,
+            stopbits=serial.STOPBITS_ONE,
+            xonxoff=False,
+            rtscts=False,
+            dsrdtr=False)
+        self.port = comm
+
+    async def read_raw(self, channels:str="FRT")->bytes:
+        """Sends the commands for several channels in a single transmission
+        and waits for all of the replies without blocking the event loop.
+
+        Args:
+            channels (str, optional): Any combination of "F", "R" and "T". Defaults to "FRT".
+
+        Raises:
+            ValueError: If channels is empty or holds anything other than F, R or T.
+            asyncio.TimeoutError: If the module does not return every reply byte
+                in time. The partial reply is discarded, so the next exchange
+                starts on a frame boundary.
+
+        Returns:
+            bytes: The raw 4-byte Bird float replies, back to back in channel order.
+        """
+        if not channels or any(c not in MEASUREMENT_CHANNELS for c in channels):
+            raise ValueError(f"channels must be made of {MEASUREMENT_CHANNELS}, got {channels!r}")
+        # Only one exchange may be outstanding per port or replies would interleave
+        async with self.__lock:
+            self.__writer.write(channels.encode())
+            await self.__writer.drain()
+            try:
+                return await asyncio.wait_for(self.__reader.readexactly(REPLY_SIZE * len(channels)), self.__timeout)
+            except asyncio.TimeoutError:
+                await self.__discard_input()
+                raise
+
+    async def __discard_input(self):
+        # A timed out readexactly() leaves the partial reply in the stream
+        # buffer, and the rest may still be on the wire. Read until the line
+        # goes quiet, then clear the port's own input buffer as well.
+        while True:
+            try:
+                if not await asyncio.wait_for(self.__reader.read(4096), self.DISCARD_QUIET_TIME):
+                    break
+            except asyncio.TimeoutError:
+                break
+        self.__writer.transport.serial.reset_input_buffer()
+
+    async def measure_all(self, channels:str="FRT")->tuple:
+        """This method returns several readings from one pipelined exchange.
+
+        Args:
+            channels (str, optional): Any combination of "F", "R" and "T". Defaults to "FRT".
+
+        Returns:
+            tuple: The readings in the same order as channels.
+        """
+        return decode_measurements(await self.read_raw(channels), channels)
+
+    async def measure_forward_power(self)->float:
+        """This method returns the forward power as measured by the sensor.
+
+        Returns:
+            float: The forward power of the sensor.
+        """
+        return (await self.measure_all("F"))[0]
+
+    async def measure_reflected_power(self)->float:
+        """This method returns the reflected power as measured by the sensor.
+
+        Returns:
+            float: The reflected power of the sensor.
+        """
+        return (await self.measure_all("R"))[0]
+
+    async def measure_temperature(self)->float:
+        """This method returns the internal temperature of the sensor.
+
+        Returns:
+            float: The internal temperature of the sensor.
+        """
+        return (await self.measure_all("T"))[0]
+
+    async def stream(self, channels:str="FRT", interval:float=0.0):
+        """Yields readings continuously, for use with async for.
+
+        Args:
+            channels (str, optional): Any combination of "F", "R" and "T". Defaults to "FRT".
+            interval (float, optional): Minimum seconds between the starts of
+            consecutive exchanges. Defaults to 0.0, which runs at the link rate.
+
+        Yields:
+            tuple: The readings in the same order as channels.
+        """
+        loop = asyncio.get_running_loop()
+        next_start = loop.time()
+        while True:
+            yield await self.measure_all(channels)
+            next_start += interval
+            delay = next_start - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                next_start = loop.time()
+
+    def __aiter__(self):
+        return self.stream()
+
+    async def close(self):
+        if self.__writer is not None:
+            self.__writer.close()
+            await self.__writer.wait_closed()
+            self.__writer = None
+            self.__reader = None
+
+
+async def measure_fleet(modules:list, channels:str="FRT", return_exceptions:bool=True)->list:
+    """Takes one reading from every module at the same time.
+
+    Args:
+        modules (list): Connected AsyncBird4421B540Class instances.
+        channels (str, optional): Any combination of "F", "R" and "T". Defaults to "FRT".
+        return_exceptions (bool, optional): Return a failing module's exception
+            in its slot instead of raising. Defaults to True.
+
+    Returns:
+        list: One tuple of readings (or exception) per module, in module order.
+    """
+    return await asyncio.gather(*(m.measure_all(channels) for m in modules),
+                                return_exceptions=return_exceptions)
+
+
+async def poll_fleet(modules:list, channels:str="FRT", interval:float=0.0, queue_size:int=1000,
+                     retry_delay:float=1.0):
+    """Polls every module concurrently and yields readings as they arrive.
+
+    Each module runs its own stream task, so every port is kept busy at the
+    same time and a slow or failed module does not hold up the others. A
+    module that raises has the exception yielded in place of its readings.
+    After one of TRANSIENT_ERRORS it is polled again after retry_delay;
+    after any other error, such as a closed port or bad arguments, it is
+    no longer polled. The generator ends once no module is left.
+
+    Args:
+        modules (list): Connected AsyncBird4421B540Class instances.
+        channels (str, optional): Any combination of "F", "R" and "T". Defaults to "FRT".
+        interval (float, optional): Minimum seconds between exchanges on each module. Defaults to 0.0.
+        queue_size (int, optional): Readings buffered before the pollers wait for the consumer. Defaults to 1000.
+        retry_delay (float, optional): Seconds to wait after a transient error
+            before polling the module again. Defaults to 1.0.
+
+    Yields:
+        tuple: (module, loop time, readings) where readings is a tuple in
+        channel order, or the exception raised by that module.
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=queue_size)
+
+    async def _poll(module):
+        while True:
+            try:
+                async for readings in module.stream(channels, interval):
+                    await queue.put((module, loop.time(), readings))
+            except TRANSIENT_ERRORS as e:
+                await queue.put((module, loop.time(), e))
+                await asyncio.sleep(max(retry_delay, interval))
+            except Exception as e:
+                await queue.put((module, loop.time(), e))
+                return
+
+    tasks = [asyncio.create_task(_poll(m)) for m in modules]
+    try:
+        while any(not t.done() for t in tasks) or not queue.empty():
+            yield await queue.get()
+    finally:
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
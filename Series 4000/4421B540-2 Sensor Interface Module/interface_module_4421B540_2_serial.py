@@ -37,6 +37,33 @@ SOFTWARE.
 """
 
 import serial
+from bird_float import bird_float_2_IEEE_float
+
+# Single byte measurement commands, each answered with one 4-byte Bird float.
+MEASUREMENT_CHANNELS = "FRT"
+POWER_CHANNELS = "FR"
+REPLY_SIZE = 4
+
+
+def decode_measurements(raw:bytes, channels:str="FRT")->tuple:
+    """Decodes the concatenated replies to a multi-channel measurement exchange.
+
+    Args:
+        raw (bytes): 4 reply bytes per channel, in the order the commands were sent.
+        channels (str, optional): The channel letters that were sent. Defaults to "FRT".
+
+    Returns:
+        tuple: One float per channel, in the same order as channels. Forward (F)
+        and reflected (R) readings are squared to give power in watts.
+    """
+    values = []
+    for i, channel in enumerate(channels):
+        value = bird_float_2_IEEE_float(raw[i*REPLY_SIZE:(i + 1)*REPLY_SIZE])
+        if channel in POWER_CHANNELS:
+            value = value * value                                   # result needs to be squared to get power reading
+        values.append(value)
+    return tuple(values)
+
 
 class Bird4421B540Class:
 
@@ -77,6 +104,43 @@ class Bird4421B540Class:
         except KeyError:
             return
 
+    def read_raw(self, channels:str="FRT")->bytes:
+        """Sends the commands for several channels in a single transmission
+        and reads all of the replies back in one call.
+
+        Args:
+            channels (str, optional): Any combination of "F", "R" and "T". Defaults to "FRT".
+
+        Raises:
+            ValueError: If channels is empty or holds anything other than F, R or T.
+            serial.SerialTimeoutException: If the module does not return every reply byte.
+
+        Returns:
+            bytes: The raw 4-byte Bird float replies, back to back in channel order.
+        """
+        if not channels or any(c not in MEASUREMENT_CHANNELS for c in channels):
+            raise ValueError(f"channels must be made of {MEASUREMENT_CHANNELS}, got {channels!r}")
+        self.__sensor.write(channels.encode())
+        expected = REPLY_SIZE * len(channels)
+        raw = self.__sensor.read(expected)
+        if len(raw) != expected:
+            raise serial.SerialTimeoutException(f"Expected {expected} reply bytes for {channels!r}, got {len(raw)}")
+        return raw
+
+    def measure_all(self, channels:str="FRT")->tuple:
+        """This method returns several readings from one pipelined exchange.
+        Writing "FRT" at once and reading the 12 reply bytes together avoids
+        paying the 9600 baud turnaround latency once per quantity. 
+
+        Args:
+            channels (str, optional): Any combination of "F" (forward power),
+            "R" (reflected power) and "T" (temperature). Defaults to "FRT".
+
+        Returns:
+            tuple: The readings in the same order as channels. 
+        """
+        return decode_measurements(self.read_raw(channels), channels)
+
     def measure_forward_power(self)->float:
         """This method returns the forward power as measured by the sensor. 
 
@@ -120,36 +184,7 @@ class Bird4421B540Class:
         Returns:
             float: The floating point value of the converted hex data. 
         """
-        temp = [0, 0, 0, 0]
-        i = 0
-        for h in hex:
-            temp[i] = ord(h)
-            i += 1
-        mantissa = (temp[1]<<16) + (temp[2]<<8) + (temp[3])
-
-        if temp[1] & 0x80:
-            mantissa = mantissa + 0xff
-            sign = -1
-        else:
-            sign = 1
-
-        fexp = temp[0]
-
-        if (fexp >= 0x80):
-            fexp -= 1 << 8
-
-        f = sign*((float(mantissa))/(0x800000))
-
-        if (fexp < 0):
-            while fexp != 0:
-                f = f/2
-                fexp += 1
-        else:
-            while fexp != 0:
-                f = f*2
-                fexp -= 1
-
-        return f
+        return bird_float_2_IEEE_float(hex)
     
     def close(self):
         self.__sensor.close()
\ No newline at end of file
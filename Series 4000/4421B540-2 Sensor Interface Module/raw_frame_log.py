@@ -0,0 +1,192 @@
+"""
+Example Description:
+        This module presents a compact binary log format for the 4421B540-2
+        sensor interface module along with a bulk offline decoder.
+
+        Each record holds a timestamp and the three raw 4-byte F/R/T replies
+        exactly as received, so the sample loop does no decoding or
+        formatting. Records are written by a background thread
+        through a large file buffer. The exporter decodes a whole file to
+        NumPy arrays or CSV in one vectorised pass.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file raw_frame_log.py
+
+"""
+
+import os
+import queue
+import struct
+import threading
+import time
+import numpy as np
+from bird_float import bird_floats_2_IEEE_floats
+
+# File layout: a 16 byte header followed by fixed-width records.
+#   header - 8 byte magic, uint16 version, uint16 record size, 4 reserved bytes
+#   record - int64 timestamp in ns, then the raw F, R and T replies
+# Version 1 timestamps are raw time.monotonic_ns() values. Version 2
+# timestamps are nanoseconds since the UNIX epoch: each writer session adds
+# one wall-clock offset, taken when it opens the file, to the monotonic
+# timestamps, so times stay monotonic within a session and comparable
+# across the sessions appended to one file.
+MAGIC = b"BIRD4421"
+VERSION = 2
+READABLE_VERSIONS = (1, 2)
+HEADER = struct.Struct("<8sHH4x")
+RECORD = struct.Struct("<q12s")
+RECORD_DTYPE = np.dtype([("t_ns", "<i8"), ("raw", "u1", (3, 4))])
+
+
+class RawFrameWriter:
+    """Appends raw F/R/T frames to a binary log file from a background thread.
+
+    Args:
+        path (str): The log file. A header is written if the file is new or
+            empty. An existing log is appended to, after dropping a partly
+            written record at its end.
+        buffer_size (int, optional): File buffer size in bytes. Defaults to 1 MiB.
+
+    Raises:
+        ValueError: If the file exists but is not a version 2 raw frame log.
+    """
+    def __init__(self, path:str, buffer_size:int=1 << 20):
+        _prepare_for_append(path)
+        self._file = open(path, mode='ab', buffering=buffer_size)
+        if self._file.tell() == 0:
+            self._file.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+        # Anchors this session's monotonic timestamps to the wall clock
+        self._offset_ns = time.time_ns() - time.monotonic_ns()
+        self._queue = queue.SimpleQueue()
+        self._error = None
+        self.records_written = 0
+        self._thread = threading.Thread(target=self._run, name="raw-frame-writer", daemon=True)
+        self._thread.start()
+
+    def append(self, t_ns:int, raw:bytes):
+        """Queues one frame for writing. This never touches the disk.
+
+        Args:
+            t_ns (int): Timestamp from time.monotonic_ns().
+            raw (bytes): The 12 reply bytes from Bird4421B540Class.read_raw("FRT").
+        """
+        if self._error is not None:
+            raise self._error
+        self._queue.put((t_ns, raw))
+
+    def _run(self):
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                t_ns, raw = item
+                self._file.write(RECORD.pack(t_ns + self._offset_ns, raw))
+                self.records_written += 1
+        except Exception as e:
+            self._error = e
+        finally:
+            self._file.close()
+
+    def close(self):
+        """Writes any queued frames, then flushes and closes the file."""
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+
+def _prepare_for_append(path:str):
+    # Checks the header of an existing log and cuts the file back to the last
+    # whole record, since appending after a torn record would misalign every
+    # record that follows it
+    try:
+        file = open(path, mode='r+b')
+    except FileNotFoundError:
+        return
+    with file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return
+        header = file.read(HEADER.size)
+        if len(header) < HEADER.size or HEADER.unpack(header) != (MAGIC, VERSION, RECORD.size):
+            raise ValueError(f"{path} is not a version {VERSION} 4421 raw frame log; start a new file")
+        whole = HEADER.size + (size - HEADER.size) // RECORD.size * RECORD.size
+        if whole != size:
+            file.truncate(whole)
+
+
+def load_raw_frames(path:str)->dict:
+    """Decodes a whole raw frame log in one vectorised pass.
+
+    A partly written record at the end of the file, for example after a power
+    cut, is ignored.
+
+    Args:
+        path (str): The log file written by RawFrameWriter.
+
+    Raises:
+        ValueError: If the file is not a raw frame log of a supported version.
+
+    Returns:
+        dict: NumPy arrays keyed by "time" (seconds since the first record),
+        "unix_time" (seconds since the UNIX epoch, NaN for version 1 files),
+        "forward_power" and "reflected_power" (W) and "temperature" (deg C).
+    """
+    with open(path, mode='rb') as file:
+        header = file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f"{path} is not a 4421 raw frame log")
+        magic, version, record_size = HEADER.unpack(header)
+        if magic != MAGIC or version not in READABLE_VERSIONS or record_size != RECORD_DTYPE.itemsize:
+            raise ValueError(f"{path} is not a version {' or '.join(map(str, READABLE_VERSIONS))} 4421 raw frame log")
+        count = (os.fstat(file.fileno()).st_size - HEADER.size) // RECORD_DTYPE.itemsize
+        records = np.fromfile(file, dtype=RECORD_DTYPE, count=count)
+
+    values = bird_floats_2_IEEE_floats(records["raw"])
+    t_ns = records["t_ns"]
+    return {
+        "time": (t_ns - t_ns[0]) / 1e9 if count else np.empty(0),
+        "unix_time": t_ns / 1e9 if version >= 2 else np.full(count, np.nan),
+        "forward_power": np.square(values[:, 0]),               # result needs to be squared to get power reading
+        "reflected_power": np.square(values[:, 1]),             # result needs to be squared to get power reading
+        "temperature": values[:, 2],
+    }
+
+
+def export_csv(path:str, csv_path:str):
+    """Converts a raw frame log to a CSV file.
+
+    Args:
+        path (str): The log file written by RawFrameWriter.
+        csv_path (str): The CSV file to create.
+    """
+    data = load_raw_frames(path)
+    table = np.column_stack([data["time"], data["forward_power"], data["reflected_power"], data["temperature"]])
+    np.savetxt(csv_path, table, delimiter=',', fmt=("%.6f", "%.6g", "%.6g", "%.3f"), comments='',
+               header="Time (s),Fwd_Power (W),Refl_Power (W),Temperature (deg C)")
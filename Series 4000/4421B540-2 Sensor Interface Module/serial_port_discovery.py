@@ -0,0 +1,255 @@
+"""
+Example Description:
+        This module presents a serial port discovery routine which can be
+        used to locate 4421B540-2 sensor interface modules and 5000 Series
+        Wideband Power Sensors (RS-232) without hard-coding port names.
+
+        All candidate ports are probed at the same time with short timeouts
+        and the serial number to port mapping is cached on disk so that
+        later runs can confirm a single cached port instead of probing
+        every adapter on the host.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file serial_port_discovery.py
+
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import serial
+from serial.tools import list_ports
+from bird_float import bird_float_2_IEEE_float
+
+SENSOR_4421 = "4421B540-2"
+SENSOR_5000 = "5000"
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".bird_rf_sensors", "serial_ports.json")
+
+
+@dataclass
+class DiscoveredSensor:
+    """Describes a sensor that answered on a serial port.
+
+    Attributes:
+        port (str): The serial port name, for example /dev/ttyUSB0 or COM4.
+        kind (str): SENSOR_4421 or SENSOR_5000.
+        serial_number (str): The sensor serial number. The 4421 reports its
+            identity as four raw bytes, which are used here in hex form.
+        model (str): The model string reported by the sensor.
+    """
+    port: str
+    kind: str
+    serial_number: str
+    model: str
+
+
+def _open_port(port:str, timeout:float)->serial.Serial:
+    return serial.Serial(port=port,
+                         baudrate=9600,
+                         bytesize=serial.EIGHTBITS,
+                         parity=serial.PARITY_NONE,
+                         stopbits=serial.STOPBITS_ONE,
+                         timeout=timeout,
+                         write_timeout=timeout,
+                         xonxoff=False,
+                         rtscts=False,
+                         dsrdtr=False)
+
+
+def _plausible_4421_temperature(raw:bytes)->bool:
+    if len(raw) != 4:
+        return False
+    return -55.0 <= bird_float_2_IEEE_float(raw) <= 150.0
+
+
+def _probe_4421(sp:serial.Serial)->DiscoveredSensor:
+    sp.reset_input_buffer()
+    sp.write(b'T')
+    if not _plausible_4421_temperature(sp.read(4)):
+        return None
+    sp.write(b'I')
+    ident = sp.read(4)
+    if len(ident) != 4:
+        return None
+    return DiscoveredSensor(sp.port, SENSOR_4421, ident.hex().upper(), SENSOR_4421)
+
+
+def _end_4421_probe(sp:serial.Serial):
+    # A 5000 buffers the 'T' byte of the 4421 probe as the start of a command
+    # line, which would turn the following 'I' into "TI". Terminate that line,
+    # let the sensor answer it, and drop the answer and anything left over.
+    sp.reset_output_buffer()
+    sp.write(b'\r\n')
+    sp.flush()
+    sp.read_until(b'\r\n')
+    sp.reset_input_buffer()
+
+
+def _probe_5000(sp:serial.Serial)->DiscoveredSensor:
+    sp.reset_input_buffer()
+    sp.write(b'I\r\n')
+    temp = sp.read_until(b'rs232\r\n').decode("utf-8", errors="ignore").split(',')
+    if ("501" in temp[0]) is False or len(temp) < 3:
+        return None
+    smodel = temp[0].strip()
+
+    # Now get the serial number....
+    sp.write(b'S\r\n')
+    temp = sp.read_until(b'\r\n').decode("utf-8", errors="ignore").split(',')
+    if len(temp) < 2:
+        return None
+    return DiscoveredSensor(sp.port, SENSOR_5000, temp[1].rstrip(), smodel)
+
+
+def probe_port(port:str, timeout:float=0.2)->DiscoveredSensor:
+    """Opens a single serial port and classifies whatever answers on it.
+
+    The 4421 single byte 'T' probe is sent first, since the line oriented
+    5000 sensor ignores a command until it sees the line terminator. The 5000
+    'I' identity command is only sent if the 4421 probe gets no valid reply,
+    after a line terminator has flushed the 'T' out of the sensor's input.
+
+    Args:
+        port (str): The serial port name.
+        timeout (float, optional): Read timeout in seconds for each probe. Defaults to 0.2.
+
+    Returns:
+        DiscoveredSensor: The sensor found on the port, or None if nothing recognizable answered.
+    """
+    try:
+        with _open_port(port, timeout) as sp:
+            found = _probe_4421(sp)
+            if found is None:
+                _end_4421_probe(sp)
+                found = _probe_5000(sp)
+            return found
+    except (serial.SerialException, OSError):
+        return None
+
+
+def candidate_ports()->list:
+    """Lists the serial ports present on the host.
+
+    Returns:
+        list: Port names, for example ['/dev/ttyUSB0', '/dev/ttyUSB1'].
+    """
+    return [p.device for p in list_ports.comports()]
+
+
+def discover_sensors(ports:list=None, timeout:float=0.2, max_workers:int=16, cache_path:str=DEFAULT_CACHE_PATH)->dict:
+    """Probes all candidate serial ports concurrently and returns what answered.
+
+    Each port is probed on its own worker thread, so discovery takes about as
+    long as the slowest single port rather than the sum over all ports. The
+    result is written to the port cache unless cache_path is None.
+
+    Args:
+        ports (list, optional): Ports to probe. Defaults to all ports found on the host.
+        timeout (float, optional): Read timeout in seconds for each probe. Defaults to 0.2.
+        max_workers (int, optional): Maximum number of ports probed at once. Defaults to 16.
+        cache_path (str, optional): Location of the JSON port cache. Defaults to DEFAULT_CACHE_PATH.
+
+    Returns:
+        dict: DiscoveredSensor entries keyed by serial number, covering only
+        the ports probed in this call.
+    """
+    if ports is None:
+        ports = candidate_ports()
+    found = {}
+    if ports:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(ports))) as pool:
+            for sensor in pool.map(lambda p: probe_port(p, timeout), ports):
+                if sensor is not None:
+                    found[sensor.serial_number] = sensor
+    if cache_path is not None:
+        # Keep entries for ports that were not probed this time
+        cached = {sn: s for sn, s in load_port_cache(cache_path).items() if s.port not in ports}
+        cached.update(found)
+        save_port_cache(cached, cache_path)
+    return found
+
+
+def load_port_cache(cache_path:str=DEFAULT_CACHE_PATH)->dict:
+    """Reads the serial number to port cache written by a previous run.
+
+    Args:
+        cache_path (str, optional): Location of the JSON port cache. Defaults to DEFAULT_CACHE_PATH.
+
+    Returns:
+        dict: DiscoveredSensor entries keyed by serial number. Empty if no usable cache exists.
+    """
+    try:
+        with open(cache_path, mode='r') as file:
+            entries = json.load(file)
+        return {sn: DiscoveredSensor(**entry) for sn, entry in entries.items()}
+    except (OSError, ValueError, TypeError):
+        return {}
+
+
+def save_port_cache(sensors:dict, cache_path:str=DEFAULT_CACHE_PATH):
+    """Writes the serial number to port cache.
+
+    Args:
+        sensors (dict): DiscoveredSensor entries keyed by serial number.
+        cache_path (str, optional): Location of the JSON port cache. Defaults to DEFAULT_CACHE_PATH.
+    """
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, mode='w') as file:
+        json.dump({sn: vars(s) for sn, s in sensors.items()}, file, indent=2)
+    os.replace(tmp_path, cache_path)
+
+
+def find_sensor_port(serial_number:str, timeout:float=0.2, cache_path:str=DEFAULT_CACHE_PATH)->str:
+    """Returns the port a given sensor is attached to.
+
+    The cached port is confirmed first with a single probe. A full concurrent
+    discovery only runs when the sensor is not cached or has moved, which
+    happens when the /dev/ttyUSB* numbering changes after a reboot.
+
+    Args:
+        serial_number (str): The sensor serial number, as reported in DiscoveredSensor.serial_number.
+        timeout (float, optional): Read timeout in seconds for each probe. Defaults to 0.2.
+        cache_path (str, optional): Location of the JSON port cache. Defaults to DEFAULT_CACHE_PATH.
+
+    Returns:
+        str: The port name, or None if the sensor could not be found.
+    """
+    cached = load_port_cache(cache_path) if cache_path is not None else {}
+    if serial_number in cached:
+        sensor = probe_port(cached[serial_number].port, timeout)
+        if sensor is not None and sensor.serial_number == serial_number:
+            return sensor.port
+
+    found = discover_sensors(timeout=timeout, cache_path=cache_path)
+    if serial_number in found:
+        return found[serial_number].port
+    return None
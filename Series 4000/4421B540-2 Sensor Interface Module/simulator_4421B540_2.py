@@ -0,0 +1,188 @@
+"""
+Example Description:
+        This module presents a simulator for the 4421B540-2 sensor interface
+        module which answers on a Linux pseudo-terminal, so the driver and
+        the examples can be exercised without hardware.
+
+        The simulator answers the I, F, R and T commands with correctly
+        encoded 4-byte Bird floats, models the 9600 baud byte timing and a
+        configurable turnaround latency, and takes programmable signal
+        profiles for each channel. Its port path can be passed straight to
+        Bird4421B540Class.connect().
+
+        Run this file directly to start a simulator and print its port.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file simulator_4421B540_2.py
+
+"""
+
+import math
+import os
+import random
+import select
+import threading
+import time
+import tty
+from bird_float import IEEE_float_2_bird_float
+
+
+def constant(value:float):
+    """Returns a signal profile that always reads value."""
+    return lambda t: value
+
+
+def sine(mean:float, amplitude:float, period:float):
+    """Returns a signal profile that swings around mean with the given period in seconds."""
+    return lambda t: mean + amplitude * math.sin(2.0 * math.pi * t / period)
+
+
+def ramp(start:float, stop:float, duration:float):
+    """Returns a signal profile that moves linearly from start to stop over duration seconds, then holds."""
+    return lambda t: start + (stop - start) * min(t / duration, 1.0)
+
+
+def noisy(profile, sigma:float, seed:int=None):
+    """Returns profile with Gaussian noise of standard deviation sigma added to it."""
+    rng = random.Random(seed)
+    return lambda t: profile(t) + rng.gauss(0.0, sigma)
+
+
+class Simulated4421B540:
+    """Pseudo-terminal simulator of a 4421B540-2 sensor interface module.
+
+    Args:
+        baud (int, optional): Line rate used to model byte timing. Defaults to 9600.
+        turnaround (float, optional): Seconds between the end of a command
+            byte and the start of its reply. Defaults to 0.002.
+        profiles (dict, optional): Signal profile per channel letter. Each is
+            a callable taking seconds since start. F and R give power in
+            watts, T gives degrees C. Defaults to 100 W forward, 1 W
+            reflected and 25 C.
+        identity (bytes, optional): The 4 bytes returned for the I command.
+            Defaults to b'\\x44\\x21\\xB5\\x40'.
+    """
+    def __init__(self, baud:int=9600, turnaround:float=0.002, profiles:dict=None, identity:bytes=b'\x44\x21\xB5\x40'):
+        self._byte_time = 10.0 / baud                 # start + 8 data + stop bits
+        self._turnaround = turnaround
+        self._profiles = {"F": constant(100.0), "R": constant(1.0), "T": constant(25.0)}
+        if profiles is not None:
+            self._profiles.update(profiles)
+        self._identity = bytes(identity)
+        self._master = None
+        self._slave = None
+        self._thread = None
+        self._running = False
+        self._start = 0.0
+        self.commands_served = 0
+
+    def start(self):
+        """Opens the pseudo-terminal and starts answering commands."""
+        self._master, self._slave = os.openpty()
+        tty.setraw(self._master)
+        tty.setraw(self._slave)
+        self._start = time.monotonic()
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, name="4421-sim", daemon=True)
+        self._thread.start()
+        return self
+
+    @property
+    def port(self)->str:
+        """Returns the device path to pass to Bird4421B540Class.connect().
+
+        Returns:
+            str: The pseudo-terminal path, for example /dev/pts/3.
+        """
+        return os.ttyname(self._slave)
+
+    def _reply(self, command:int)->bytes:
+        t = time.monotonic() - self._start
+        if command == ord('I'):
+            return self._identity
+        if command in (ord('F'), ord('R')):
+            # The module reports the square root of power
+            return IEEE_float_2_bird_float(math.sqrt(max(self._profiles[chr(command)](t), 0.0)))
+        if command == ord('T'):
+            return IEEE_float_2_bird_float(self._profiles["T"](t))
+        return b''
+
+    def _serve(self):
+        rx_free = tx_free = time.monotonic()
+        while self._running:
+            ready, _, _ = select.select([self._master], [], [], 0.05)
+            if not ready:
+                continue
+            try:
+                data = os.read(self._master, 256)
+            except OSError:
+                break
+            now = time.monotonic()
+            rx_free = max(rx_free, now)
+            for command in data:
+                # Command bytes arrive one byte time apart; each reply starts a
+                # turnaround after its command, once the transmit line is free.
+                rx_free += self._byte_time
+                reply = self._reply(command)
+                if not reply:
+                    continue
+                tx_start = max(rx_free + self._turnaround, tx_free)
+                tx_free = tx_start + self._byte_time * len(reply)
+                delay = tx_free - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                os.write(self._master, reply)
+                self.commands_served += 1
+
+    def close(self):
+        """Stops the simulator and releases the pseudo-terminal."""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for fd in (self._master, self._slave):
+            if fd is not None:
+                os.close(fd)
+        self._master = self._slave = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+if __name__ == "__main__":
+    sim = Simulated4421B540(profiles={"F": noisy(sine(100.0, 10.0, 60.0), 0.5), "T": ramp(25.0, 35.0, 600.0)})
+    with sim:
+        print(f"Simulated 4421B540-2 listening on {sim.port} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(1.0)
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,105 @@
+"""
+Example Description:
+        Equivalence tests for bird_float.py against the original loop-based
+        decoder from Bird4421B540Class. Every 8-bit exponent is checked with
+        a set of representative mantissas, through both the scalar and the
+        NumPy batch decoder.
+
+        Run with: python -m pytest test_bird_float.py
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file test_bird_float.py
+
+"""
+
+import random
+import numpy as np
+from bird_float import bird_float_2_IEEE_float, bird_floats_2_IEEE_floats
+
+# Sign bit clear and set, the ends of each half, values whose 0xff offset
+# carries into higher bytes, and a spread of random patterns
+MANTISSAS = [0x000000, 0x000001, 0x0000ff, 0x000100, 0x400000, 0x555555, 0x7fff00, 0x7fffff,
+             0x800000, 0x800001, 0x8000ff, 0x80ff01, 0xaaaaaa, 0xffff00, 0xffff01, 0xffffff]
+MANTISSAS += random.Random(4421).sample(range(1 << 24), 48)
+
+
+def reference_bird_float_2_IEEE_float(hex)->float:
+    # The original Bird4421B540Class.__bird_float_2_IEEE_float, kept verbatim
+    temp = [0, 0, 0, 0]
+    i = 0
+    for h in hex:
+        temp[i] = ord(h)
+        i += 1
+    mantissa = (temp[1]<<16) + (temp[2]<<8) + (temp[3])
+
+    if temp[1] & 0x80:
+        mantissa = mantissa + 0xff
+        sign = -1
+    else:
+        sign = 1
+
+    fexp = temp[0]
+
+    if (fexp >= 0x80):
+        fexp -= 1 << 8
+
+    f = sign*((float(mantissa))/(0x800000))
+
+    if (fexp < 0):
+        while fexp != 0:
+            f = f/2
+            fexp += 1
+    else:
+        while fexp != 0:
+            f = f*2
+            fexp -= 1
+
+    return f
+
+
+def all_readings()->list:
+    return [bytes([exponent]) + mantissa.to_bytes(3, 'big') for exponent in range(256) for mantissa in MANTISSAS]
+
+
+def test_scalar_decoder_matches_reference():
+    for raw in all_readings():
+        expected = reference_bird_float_2_IEEE_float([raw[i:i + 1] for i in range(4)])
+        assert bird_float_2_IEEE_float(raw) == expected, raw.hex()
+
+
+def test_scalar_decoder_accepts_byte_lists():
+    for raw in all_readings()[::97]:
+        assert bird_float_2_IEEE_float([raw[i:i + 1] for i in range(4)]) == bird_float_2_IEEE_float(raw)
+
+
+def test_batch_decoder_matches_reference():
+    readings = all_readings()
+    expected = np.array([reference_bird_float_2_IEEE_float([raw[i:i + 1] for i in range(4)]) for raw in readings])
+    np.testing.assert_array_equal(bird_floats_2_IEEE_floats(b"".join(readings)), expected)
+    array = np.frombuffer(b"".join(readings), dtype=np.uint8).reshape(256, len(MANTISSAS), 4)
+    np.testing.assert_array_equal(bird_floats_2_IEEE_floats(array), expected.reshape(256, len(MANTISSAS)))
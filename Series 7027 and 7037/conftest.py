@@ -0,0 +1,65 @@
+"""
+Example Description:
+        pytest fixtures that connect Series_7027 to the pyvisa-sim simulator
+        of simulator_7027_7037.py. A test takes simulated_7027 and calls it
+        with the simulator's delays and measurement period; every sensor it
+        connects is disconnected, and its simulator closed, afterwards.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file conftest.py
+
+"""
+
+import os
+import sys
+# The simulator reaches pyvisa-sim through the adapter in the Common folder
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Common"))
+import pytest
+from simulator_7027_7037 import Simulated7027
+
+
+@pytest.fixture
+def simulated_7027():
+    """Returns a function that connects a Series_7027 to a new simulator.
+
+    The function takes the arguments of Simulated7027 plus timeout and fast,
+    which go to Simulated7027.connect().
+    """
+    opened = []
+
+    def connect(timeout:int=None, fast:bool=False, **kwargs):
+        sim = Simulated7027(**kwargs).start()
+        sensor = sim.connect(timeout, fast)
+        opened.append((sim, sensor))
+        return sensor
+
+    yield connect
+    for sim, sensor in opened:
+        sensor.disconnect()
+        sim.close()
+
@@ -0,0 +1,287 @@
+"""
+Example Description:
+        This module presents a benchmark harness for CW measurement speed on
+        the 7027 and 7037 sensors.
+
+        It sweeps the settings that decide how fast new results can be read:
+        instrument averaging state and count, reflected power measurement,
+        automatic frequency detection, continuous versus single trigger, and
+        one query per quantity versus one batched query. For every
+        combination it reports samples per second, latency percentiles and
+        the fraction of reads that returned the same values as the read
+        before, as a table and as JSON.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file cw_speed_benchmark.py
+
+"""
+
+import itertools
+import json
+import time
+from dataclasses import asdict, dataclass
+import numpy as np
+
+CONTINUOUS = "continuous"
+SINGLE = "single"
+SEPARATE = "separate"
+BATCHED = "batched"
+
+# (averaging state, averaging count) pairs; the count is ignored when averaging is off
+DEFAULT_AVERAGING = ((0, 1), (1, 4), (1, 16))
+
+
+@dataclass
+class BenchmarkCase:
+    """One combination of settings to benchmark.
+
+    Attributes:
+        average_state (int): CALC:AVER:STAT, 0 or 1.
+        average_count (int): CALC:AVER:COUN, used when average_state is 1.
+        reflected_enable (int): SENS:REFL:ENAB, 0 or 1. Reflected power is
+            only fetched when enabled.
+        frequency_auto (int): SENS:FREQ:AUTO, 0 or 1.
+        trigger (str): CONTINUOUS fetches whatever result is current, SINGLE
+            triggers a measurement and waits for it with *OPC? before each fetch.
+        fetch (str): SEPARATE sends one query per quantity, BATCHED reads
+            them all with one compound query.
+    """
+    average_state: int
+    average_count: int
+    reflected_enable: int
+    frequency_auto: int
+    trigger: str
+    fetch: str
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing for one BenchmarkCase.
+
+    Attributes:
+        case (BenchmarkCase): The settings that were measured.
+        model (str): Sensor model number from *IDN?.
+        firmware (str): Sensor firmware version from *IDN?.
+        samples (int): Number of timed samples.
+        samples_per_second (float): Samples divided by the total loop time.
+        latency_p50 (float): Median seconds per sample.
+        latency_p90 (float): 90th percentile seconds per sample.
+        latency_p99 (float): 99th percentile seconds per sample.
+        latency_max (float): Worst seconds per sample.
+        duplicate_rate (float): Fraction of samples identical to the one before.
+    """
+    case: BenchmarkCase
+    model: str
+    firmware: str
+    samples: int
+    samples_per_second: float
+    latency_p50: float
+    latency_p90: float
+    latency_p99: float
+    latency_max: float
+    duplicate_rate: float
+
+
+def build_cases(averaging=DEFAULT_AVERAGING, reflected_enable=(0, 1), frequency_auto=(0, 1),
+                trigger=(CONTINUOUS, SINGLE), fetch=(SEPARATE, BATCHED))->list:
+    """Returns every combination of the given settings as BenchmarkCase objects.
+
+    Args:
+        averaging (tuple, optional): (state, count) pairs. Defaults to DEFAULT_AVERAGING.
+        reflected_enable (tuple, optional): SENS:REFL:ENAB values. Defaults to (0, 1).
+        frequency_auto (tuple, optional): SENS:FREQ:AUTO values. Defaults to (0, 1).
+        trigger (tuple, optional): CONTINUOUS and/or SINGLE. Defaults to both.
+        fetch (tuple, optional): SEPARATE and/or BATCHED. Defaults to both.
+
+    Returns:
+        list: The cases, averaging varying slowest.
+    """
+    return [BenchmarkCase(state, count, refl, auto, trig, how)
+            for (state, count), refl, auto, trig, how
+            in itertools.product(averaging, reflected_enable, frequency_auto, trigger, fetch)]
+
+
+def configure(sensor, case:BenchmarkCase, frequency:float=None):
+    """Applies the settings of a case in one transaction.
+
+    Args:
+        sensor (Series_7027): A connected sensor.
+        case (BenchmarkCase): The settings to apply.
+        frequency (float, optional): Frequency in Hz to set when frequency_auto
+            is 0. Defaults to None, which keeps the present frequency.
+    """
+    with sensor.transaction():
+        sensor.write(f"CALC:AVER:STAT {case.average_state}")
+        if case.average_state:
+            sensor.write(f"CALC:AVER:COUN {case.average_count}")
+        sensor.write(f"SENS:REFL:ENAB {case.reflected_enable}")
+        sensor.write(f"SENS:FREQ:AUTO {case.frequency_auto}")
+        if not case.frequency_auto and frequency is not None:
+            sensor.write(f"SENS:FREQ {frequency}")
+        sensor.write(f"INIT:CONT {1 if case.trigger == CONTINUOUS else 0}")
+        sensor.write("CALC:AVER:CLE")
+
+
+def run_case(sensor, case:BenchmarkCase, samples:int=100, warmup:int=5, frequency:float=None)->BenchmarkResult:
+    """Configures the sensor for one case and times a fetch loop.
+
+    Args:
+        sensor (Series_7027): A connected sensor.
+        case (BenchmarkCase): The settings to measure.
+        samples (int, optional): Timed samples. Defaults to 100.
+        warmup (int, optional): Untimed samples taken first, for example while
+            the average fills. Defaults to 5.
+        frequency (float, optional): See configure(). Defaults to None.
+
+    Returns:
+        BenchmarkResult: The timing for the case.
+    """
+    configure(sensor, case, frequency)
+    fields = ["forward_power", "reflected_power"] if case.reflected_enable else ["forward_power"]
+    queries = ["FETC:AVER?", "FETC:REFL:AVER?"] if case.reflected_enable else ["FETC:AVER?"]
+
+    def sample()->tuple:
+        if case.trigger == SINGLE:
+            sensor.wait_for_measurement(method="opc")
+        if case.fetch == BATCHED:
+            return tuple(sensor.fetch.snapshot(fields))
+        return tuple(float(sensor.query(q)) for q in queries)
+
+    for _ in range(warmup):
+        sample()
+
+    latencies = np.empty(samples)
+    duplicates = 0
+    previous = None
+    start = time.perf_counter()
+    for j in range(samples):
+        t1 = time.perf_counter()
+        reading = sample()
+        latencies[j] = time.perf_counter() - t1
+        duplicates += reading == previous
+        previous = reading
+    elapsed = time.perf_counter() - start
+
+    p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+    return BenchmarkResult(case=case,
+                           model=sensor.model_number,
+                           firmware=sensor.firmware_version,
+                           samples=samples,
+                           samples_per_second=samples / elapsed,
+                           latency_p50=float(p50),
+                           latency_p90=float(p90),
+                           latency_p99=float(p99),
+                           latency_max=float(latencies.max()),
+                           duplicate_rate=duplicates / max(samples - 1, 1))
+
+
+def run_benchmark(sensor, cases:list=None, samples:int=100, warmup:int=5, frequency:float=None, progress=None)->list:
+    """Runs every case and puts the sensor settings back afterwards.
+
+    Args:
+        sensor (Series_7027): A connected sensor.
+        cases (list, optional): BenchmarkCase objects. Defaults to build_cases().
+        samples (int, optional): Timed samples per case. Defaults to 100.
+        warmup (int, optional): Untimed samples per case. Defaults to 5.
+        frequency (float, optional): See configure(). Defaults to None.
+        progress (callable, optional): Called with each BenchmarkResult as it completes.
+
+    Returns:
+        list: One BenchmarkResult per case.
+    """
+    cases = build_cases() if cases is None else cases
+    saved = {cmd: sensor.query(f"{cmd}?").strip()
+             for cmd in ("CALC:AVER:STAT", "CALC:AVER:COUN", "SENS:REFL:ENAB", "SENS:FREQ:AUTO", "SENS:FREQ", "INIT:CONT")}
+    results = []
+    try:
+        for case in cases:
+            result = run_case(sensor, case, samples, warmup, frequency)
+            results.append(result)
+            if progress is not None:
+                progress(result)
+    finally:
+        with sensor.transaction():
+            for cmd, value in saved.items():
+                sensor.write(f"{cmd} {value}")
+    return results
+
+
+def format_table(results:list)->str:
+    """Formats results as a fixed-width text table, fastest case first.
+
+    Args:
+        results (list): BenchmarkResult objects.
+
+    Returns:
+        str: The table.
+    """
+    header = (f"{'model':>6} {'firmware':>9} {'avg':>5} {'refl':>4} {'fauto':>5} {'trigger':>10} {'fetch':>8} "
+              f"{'S/s':>8} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8} {'dup %':>6}")
+    lines = [header, "-" * len(header)]
+    for r in sorted(results, key=lambda r: r.samples_per_second, reverse=True):
+        c = r.case
+        avg = str(c.average_count) if c.average_state else "off"
+        lines.append(f"{r.model:>6} {r.firmware:>9} {avg:>5} {c.reflected_enable:>4} {c.frequency_auto:>5} {c.trigger:>10} {c.fetch:>8} "
+                     f"{r.samples_per_second:8.1f} {r.latency_p50*1e3:8.2f} {r.latency_p90*1e3:8.2f} "
+                     f"{r.latency_p99*1e3:8.2f} {r.latency_max*1e3:8.2f} {r.duplicate_rate*100:6.1f}")
+    return "\n".join(lines)
+
+
+def save_json(results:list, path:str, identity:str=""):
+    """Writes results to a JSON file.
+
+    Args:
+        results (list): BenchmarkResult objects.
+        path (str): The file to create.
+        identity (str, optional): The sensor *IDN? string, stored with the results. Defaults to "".
+    """
+    with open(path, mode='w') as file:
+        json.dump({"identity": identity,
+                   "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                   "results": [asdict(r) for r in results]}, file, indent=2)
+
+
+def save_jsonl(results:list, path:str):
+    """Appends results to a JSON Lines file, one flat record per case. Runs
+    against sensors with different firmware can share one file, and each
+    record carries the model and firmware to group them by.
+
+    Args:
+        results (list): BenchmarkResult objects.
+        path (str): The file to append to. Created if it does not exist.
+    """
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+    with open(path, mode='a') as file:
+        for r in results:
+            record = asdict(r)
+            case = record.pop("case")
+            file.write(json.dumps({"time": stamp,
+                                   "model": record.pop("model"),
+                                   "firmware": record.pop("firmware"),
+                                   **case,
+                                   **record}) + "\n")
@@ -43,13 +43,14 @@ mysensor.trigger.once()
 fwd = mysensor.fetch.forward_power()
 refl = mysensor.fetch.reflected_power()
 
-# Configure for continuous trigger then loop to query new
-# readings.
+# Configure for continuous trigger then print each new reading
+# as soon as the sensor reports that it is ready.
 mysensor.trigger.continuous = 1
-for j in range(10):
-    time.sleep(0.5)
-    print(f"FWD = {mysensor.fetch.forward_power()}")
-    print(f"RFL = {mysensor.fetch.reflected_power()}")
+for j, reading in enumerate(mysensor.measurements(["forward_power", "reflected_power"], timeout=5.0)):
+    print(f"FWD = {reading.forward_power}")
+    print(f"RFL = {reading.reflected_power}")
+    if j >= 9:
+        break
 
 # Disable continuous trigger
 mysensor.trigger.continuous = 0
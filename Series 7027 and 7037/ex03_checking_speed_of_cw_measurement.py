@@ -38,12 +38,14 @@ import time
 mysensor = Series_7027()
 mysensor.connect("USB0::0x1422::0x7029::242104838::INSTR", 20000)
 
-mysensor.write("CALC:AVER:STAT 1")
-mysensor.write("CALCulate:AVERage:COUNt 1")
-mysensor.write("SENSe:REFLected:ENABle 1")
-mysensor.write("SENSe:FREQuency:AUTO 0")
-mysensor.write("SENSe:FREQuency 60E6")
-mysensor.write("INITiate:CONTinuous 1")
+# Send the whole configuration as one command with a single error check
+with mysensor.transaction():
+    mysensor.write("CALC:AVER:STAT 1")
+    mysensor.write("CALCulate:AVERage:COUNt 1")
+    mysensor.write("SENSe:REFLected:ENABle 1")
+    mysensor.write("SENSe:FREQuency:AUTO 0")
+    mysensor.write("SENSe:FREQuency 60E6")
+    mysensor.write("INITiate:CONTinuous 1")
 
 t1 = time.time()
 for j in range(100):
@@ -0,0 +1,60 @@
+"""
+Example Description:
+    This example benchmarks the time it takes to connect to a 7027/7037,
+    comparing the default connect(), which resets the sensor and queries
+    its identity, with the fast-connect mode used by short-lived jobs.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+Copyright (c) Bird
+
+"""
+from series_7027_7037 import Series_7027
+import statistics
+import time
+
+RESOURCE = "USB0::0x1422::0x7037::202100121::INSTR"
+REPEATS = 20
+
+def time_connects(fast:bool):
+    times = []
+    for j in range(REPEATS):
+        mysensor = Series_7027()
+        t1 = time.perf_counter()
+        mysensor.connect(RESOURCE, 20000, fast=fast)
+        fwd = mysensor.fetch.forward_power()
+        t2 = time.perf_counter()
+        times.append(t2 - t1)
+        mysensor.disconnect()
+    return times
+
+for fast in (False, True):
+    times = time_connects(fast)
+    label = "fast connect" if fast else "default connect"
+    print(f"{label:<16} mean {statistics.mean(times)*1e3:8.2f} ms, "
+          f"median {statistics.median(times)*1e3:8.2f} ms, "
+          f"max {max(times)*1e3:8.2f} ms (connect + first fetch)")
@@ -0,0 +1,75 @@
+"""
+Example Description:
+    This example runs the CW measurement speed benchmark on a 7027/7037,
+    sweeping averaging, reflected power, automatic frequency, trigger mode
+    and batched versus separate fetches. The results are printed as a table
+    and saved as JSON, and appended to a JSON Lines file so runs on
+    different sensors and firmware versions can be compared.
+
+    Set SIMULATE to True to run against the pyvisa-sim simulator instead
+    of hardware.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+Copyright (c) Bird
+
+"""
+from series_7027_7037 import Series_7027
+from cw_speed_benchmark import build_cases, run_benchmark, format_table, save_json, save_jsonl
+
+RESOURCE = "USB0::0x1422::0x7029::242104838::INSTR"
+SIMULATE = False
+SAMPLES = 100
+
+if SIMULATE:
+    import os
+    import sys
+    # The simulator reaches pyvisa-sim through the adapter in the Common folder
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Common"))
+    from simulator_7027_7037 import Simulated7027
+    mysensor = Simulated7027(delay=0.001).connect(timeout=20000)
+else:
+    mysensor = Series_7027()
+    mysensor.connect(RESOURCE, 20000)
+
+cases = build_cases()
+print(f"Running {len(cases)} cases of {SAMPLES} samples on {mysensor._general}")
+
+def show_progress(result):
+    c = result.case
+    print(f"  avg {c.average_state}/{c.average_count} refl {c.reflected_enable} fauto {c.frequency_auto} "
+          f"{c.trigger} {c.fetch}: {result.samples_per_second:.1f} S/s")
+
+results = run_benchmark(mysensor, cases, samples=SAMPLES, frequency=60e6, progress=show_progress)
+
+print()
+print(format_table(results))
+save_json(results, "cw_speed_benchmark.json", mysensor._general)
+# Accumulates runs across sensors and firmware versions for comparison
+save_jsonl(results, "cw_speed_benchmark.jsonl")
+
+mysensor.disconnect()
@@ -0,0 +1,80 @@
+"""
+Example Description:
+    This example turns off the instrument averaging on a 7027/7037 and
+    keeps several rolling windows of forward and reflected power on the
+    client instead, so fast, slow and time-based averages all come from
+    one stream of raw readings.
+
+    Set SIMULATE to True to run against the pyvisa-sim simulator instead
+    of hardware.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+Copyright (c) Bird
+
+"""
+from series_7027_7037 import Series_7027
+from rolling_statistics import RollingWindow, RollingStatistics, stream_statistics
+
+RESOURCE = "USB0::0x1422::0x7029::242104838::INSTR"
+SIMULATE = False
+READINGS = 200
+
+if SIMULATE:
+    import os
+    import sys
+    # The simulator reaches pyvisa-sim through the adapter in the Common folder
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Common"))
+    from simulator_7027_7037 import Simulated7027
+    mysensor = Simulated7027().connect(timeout=20000)
+else:
+    mysensor = Series_7027()
+    mysensor.connect(RESOURCE, 20000)
+
+# Raw, un-averaged results as fast as the sensor makes them
+with mysensor.transaction():
+    mysensor.write("CALC:AVER:STAT 0")
+    mysensor.write("SENS:REFL:ENAB 1")
+    mysensor.write("INIT:CONT 1")
+
+def windows():
+    return RollingStatistics({"last 4": RollingWindow(size=4),
+                              "last 64": RollingWindow(size=64),
+                              "last 1 s": RollingWindow(duration=1.0)})
+
+quantities = {"forward_power": windows(), "reflected_power": windows()}
+
+for j, reading in enumerate(stream_statistics(mysensor, quantities, timeout=5.0)):
+    if j % 20 == 19:
+        print(f"Reading {j + 1}: FWD = {reading.forward_power:.4f} W")
+        for name, stats in quantities["forward_power"].statistics().items():
+            print(f"    {name:>8}: n = {stats.count:3d}, mean = {stats.mean:.4f}, std = {stats.std:.4f}, "
+                  f"min = {stats.minimum:.4f}, max = {stats.maximum:.4f}")
+    if j + 1 >= READINGS:
+        break
+
+mysensor.disconnect()
@@ -0,0 +1,72 @@
+"""
+Example Description:
+    This example sweeps the correction frequency of a 7027/7037 across its
+    calibrated range, measuring forward and reflected power at each point,
+    and saves the table to a CSV file.
+
+    Set SIMULATE to True to run against the pyvisa-sim simulator instead
+    of hardware.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+Copyright (c) Bird
+
+"""
+from series_7027_7037 import Series_7027
+import numpy as np
+import time
+
+RESOURCE = "USB0::0x1422::0x7029::242104838::INSTR"
+SIMULATE = False
+POINTS = 50
+
+if SIMULATE:
+    import os
+    import sys
+    # The simulator reaches pyvisa-sim through the adapter in the Common folder
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Common"))
+    from simulator_7027_7037 import Simulated7027
+    mysensor = Simulated7027().connect(timeout=20000)
+else:
+    mysensor = Series_7027()
+    mysensor.connect(RESOURCE, 20000)
+
+freq = mysensor.sense.frequency
+frequencies = np.geomspace(freq.range_lower, freq.range_upper, POINTS)
+
+t1 = time.perf_counter()
+table = freq.sweep(frequencies)
+t2 = time.perf_counter()
+print(f"Swept {POINTS} points in {t2-t1:.3f} s")
+
+for row in table:
+    print(f"{row['frequency']/1e6:10.3f} MHz  FWD = {row['forward_power']:.4f} W  RFL = {row['reflected_power']:.4f} W")
+
+np.savetxt("frequency_sweep.csv", table, delimiter=',', fmt="%.6g", comments='',
+           header="Frequency (Hz),Fwd_Power (W),Refl_Power (W)")
+
+mysensor.disconnect()
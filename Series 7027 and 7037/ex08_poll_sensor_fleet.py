@@ -0,0 +1,66 @@
+"""
+Example Description:
+    This example polls every 7027/7037 sensor found on the bus at the same
+    time with a FleetPoller, logs the merged readings to a CSV file, and
+    prints a health report for each sensor at the end.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+Copyright (c) Bird
+
+"""
+import os
+import sys
+# fleet_poller paces each sensor with acquisition_clock from the Common folder
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Common"))
+from series_7027_7037 import shared_resource_manager
+from fleet_poller import FleetPoller
+import time
+
+DURATION = 60.0
+INTERVAL = 0.1
+
+resources = [r for r in shared_resource_manager().list_resources("USB?*::0x1422::?*::INSTR")]
+print(f"Polling {len(resources)} sensors every {INTERVAL} s for {DURATION} s")
+
+with FleetPoller(resources, interval=INTERVAL, queue_size=10000) as poller, \
+        open("fleet_log.csv", mode='w') as logfile:
+    logfile.write("Time,Resource,Fwd_Power (W),Refl_Power (W),Latency (ms),Error\n")
+    t_end = time.time() + DURATION
+    for sample in poller.samples(timeout=5.0):
+        if sample.error is None:
+            logfile.write(f"{sample.time:.6f},{sample.resource},{sample.snapshot.forward_power},"
+                          f"{sample.snapshot.reflected_power},{sample.latency*1e3:.3f},\n")
+        else:
+            logfile.write(f"{sample.time:.6f},{sample.resource},,,{sample.latency*1e3:.3f},{sample.error}\n")
+        if sample.time >= t_end:
+            break
+
+    for resource, health in poller.health().items():
+        print(f"{resource}: {health.samples} samples, {health.errors} errors, {health.reconnects} reconnects, "
+              f"{health.skipped} skipped, latency p50 {health.latency_p50*1e3:.2f} ms, "
+              f"p99 {health.latency_p99*1e3:.2f} ms")
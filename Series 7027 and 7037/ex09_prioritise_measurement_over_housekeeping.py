@@ -0,0 +1,83 @@
+"""
+Example Description:
+    This example shares one sensor between a fast measurement loop and
+    slower housekeeping reads through a SessionScheduler. Forward and
+    reflected power are fetched at measurement priority while
+    temperature and gate statistics are read at housekeeping priority,
+    capped at a share of the bus time, and the wait each class saw is
+    printed at the end.
+
+    Set SIMULATE to True to run against the pyvisa-sim simulator instead
+    of hardware.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+Copyright (c) Bird
+
+"""
+from series_7027_7037 import Series_7027
+from session_scheduler import SessionScheduler, HOUSEKEEPING
+import time
+
+RESOURCE = "USB0::0x1422::0x7029::242104838::INSTR"
+SIMULATE = False
+DURATION = 10.0
+
+if SIMULATE:
+    import os
+    import sys
+    # The simulator reaches pyvisa-sim through the adapter in the Common folder
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Common"))
+    from simulator_7027_7037 import Simulated7027
+    mysensor = Simulated7027(delay=0.001).connect(timeout=20000)
+else:
+    mysensor = Series_7027()
+    mysensor.connect(RESOURCE, 20000)
+
+with SessionScheduler(mysensor, housekeeping_share=0.1) as scheduler:
+    housekeeping = []
+    readings = 0
+    t_end = time.monotonic() + DURATION
+    while time.monotonic() < t_end:
+        # Keep a few housekeeping reads queued; they only run when the bus budget allows
+        if len(housekeeping) < 4:
+            housekeeping.append(scheduler.submit(lambda s: (s.fetch.temperature(), s.fetch.gate_count()),
+                                                 HOUSEKEEPING))
+        reading = scheduler.measure(["forward_power", "reflected_power"])
+        readings += 1
+        for future in [f for f in housekeeping if f.done()]:
+            housekeeping.remove(future)
+            temperature, gates = future.result()
+            print(f"FWD = {reading.forward_power:.4f} W, REFL = {reading.reflected_power:.4f} W, "
+                  f"TEMP = {temperature:.1f} C, gates = {gates}")
+
+    print(f"{readings / DURATION:.1f} readings per second")
+    for name, stats in scheduler.statistics().items():
+        print(f"{name:>12}: {stats.completed} served, mean wait {stats.mean_wait*1e3:.2f} ms, "
+              f"max wait {stats.max_wait*1e3:.2f} ms, bus time {stats.bus_time:.3f} s")
+
+mysensor.disconnect()
@@ -0,0 +1,328 @@
+"""
+Example Description:
+        This module presents a poller for a fleet of 7027 and 7037 sensors
+        monitored from one host.
+
+        Every sensor is opened on the one process-wide ResourceManager and
+        polled by its own worker thread, paced by its own AcquisitionClock,
+        so a slow or failing sensor never holds up the others. Timestamped
+        snapshots from all sensors are merged into one bounded queue; when
+        the consumer falls behind, the workers block on the queue and their
+        clocks skip the missed slots rather than building up a backlog.
+        Per-sensor health and latency statistics are kept as it runs, and
+        sensors that drop off the bus are reconnected.
+
+        acquisition_clock is imported from the Common folder at the top of
+        the repository, which scripts using this module put on sys.path.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file fleet_poller.py
+
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+import numpy as np
+from acquisition_clock import AcquisitionClock, SKIP
+from series_7027_7037 import Series_7027
+
+
+@dataclass
+class FleetSample:
+    """One result from one sensor in the fleet.
+
+    Attributes:
+        resource (str): VISA resource string of the sensor.
+        time (float): time.time() when the fetch completed.
+        latency (float): Seconds the fetch took.
+        snapshot (FetchSnapshot): The readings, or None if the fetch failed.
+        error (Exception): The failure, or None.
+    """
+    resource: str
+    time: float
+    latency: float
+    snapshot: object = None
+    error: Exception = None
+
+
+@dataclass
+class InstrumentHealth:
+    """Health and latency of one sensor in the fleet.
+
+    Attributes:
+        resource (str): VISA resource string of the sensor.
+        connected (bool): Whether the worker currently holds an open session.
+        samples (int): Successful fetches.
+        errors (int): Failed connects and fetches.
+        consecutive_errors (int): Failures since the last success.
+        reconnects (int): Sessions reopened after a failure.
+        skipped (int): Pacing slots dropped because a fetch or the queue ran late.
+        last_error (str): Text of the most recent failure, or "".
+        last_sample (float): time.time() of the most recent success, or 0.0.
+        latency_mean (float): Mean fetch latency in seconds over the recent window.
+        latency_p50 (float): Median fetch latency over the recent window.
+        latency_p99 (float): 99th percentile fetch latency over the recent window.
+        latency_max (float): Worst fetch latency over the recent window.
+    """
+    resource: str
+    connected: bool
+    samples: int
+    errors: int
+    consecutive_errors: int
+    reconnects: int
+    skipped: int
+    last_error: str
+    last_sample: float
+    latency_mean: float
+    latency_p50: float
+    latency_p99: float
+    latency_max: float
+
+
+class _Worker:
+    # Owns one sensor: connects it, polls it on its own clock and keeps its health
+    def __init__(self, poller, resource:str, interval:float):
+        self.poller = poller
+        self.resource = resource
+        self.interval = interval
+        self.sensor = None
+        self.lock = threading.Lock()
+        self.latencies = deque(maxlen=poller.latency_window)
+        self.samples = 0
+        self.errors = 0
+        self.consecutive_errors = 0
+        self.reconnects = 0
+        self.skipped = 0
+        self._skipped_before = 0
+        self.last_error = ""
+        self.last_sample = 0.0
+        self.thread = threading.Thread(target=self.run, name=f"fleet-{resource}", daemon=True)
+
+    def _fail(self, error:Exception):
+        with self.lock:
+            self.errors += 1
+            self.consecutive_errors += 1
+            self.last_error = f"{type(error).__name__}: {error}"
+
+    def _disconnect(self):
+        with self.lock:
+            sensor, self.sensor = self.sensor, None
+        if sensor is not None:
+            try:
+                sensor.disconnect()
+            except Exception:
+                pass
+
+    def run(self):
+        poller = self.poller
+        clock = None
+        while not poller._stop.is_set():
+            if self.sensor is None:
+                try:
+                    sensor = poller._connect(self.resource)
+                except Exception as e:
+                    self._fail(e)
+                    poller._stop.wait(poller.reconnect_delay)
+                    continue
+                with self.lock:
+                    self.sensor = sensor
+                    if clock is not None:
+                        self.reconnects += 1
+                        self._skipped_before = self.skipped
+                clock = AcquisitionClock(self.interval, SKIP)
+
+            start = time.perf_counter()
+            try:
+                snapshot = self.sensor.fetch.snapshot(poller.fields)
+                error = None
+            except Exception as e:
+                snapshot, error = None, e
+            latency = time.perf_counter() - start
+
+            if error is None:
+                with self.lock:
+                    self.samples += 1
+                    self.consecutive_errors = 0
+                    self.last_sample = time.time()
+                    self.latencies.append(latency)
+            else:
+                self._fail(error)
+            if not poller._put(FleetSample(self.resource, time.time(), latency, snapshot, error)):
+                break
+            if error is not None:
+                # Reopen the session in case the sensor was unplugged or reset
+                self._disconnect()
+                poller._stop.wait(poller.reconnect_delay)
+                continue
+
+            clock.wait()
+            with self.lock:
+                self.skipped = self._skipped_before + clock.statistics().skipped
+        self._disconnect()
+
+    def health(self)->InstrumentHealth:
+        with self.lock:
+            latencies = np.array(self.latencies)
+            if latencies.size:
+                mean, p50, p99, worst = latencies.mean(), *np.percentile(latencies, [50, 99]), latencies.max()
+            else:
+                mean = p50 = p99 = worst = float("nan")
+            return InstrumentHealth(self.resource, self.sensor is not None, self.samples, self.errors,
+                                    self.consecutive_errors, self.reconnects, self.skipped, self.last_error,
+                                    self.last_sample, float(mean), float(p50), float(p99), float(worst))
+
+
+class FleetPoller:
+    """Polls many 7027/7037 sensors concurrently into one queue.
+
+    Args:
+        resources (dict or list): VISA resource strings. Pass a dict of
+            resource string to poll interval in seconds to pace each sensor
+            differently.
+        interval (float, optional): Poll interval in seconds for resources
+            given without one. Defaults to 1.0.
+        fields (list, optional): Fetch.snapshot() fields read from every
+            sensor in one query. Defaults to forward and reflected power.
+        queue_size (int, optional): Samples buffered before the workers wait
+            for the consumer. Defaults to 1000.
+        timeout (int, optional): VISA timeout in milliseconds. Defaults to 5000.
+        reconnect_delay (float, optional): Seconds to wait before reopening a
+            failed session. Defaults to 2.0.
+        latency_window (int, optional): Recent fetches kept per sensor for the
+            latency statistics. Defaults to 1000.
+        connect (callable, optional): Called with a resource string to open a
+            sensor, returning a connected Series_7027. Defaults to opening it
+            on the shared ResourceManager without resetting it.
+    """
+    def __init__(self, resources, interval:float=1.0, fields:list=None, queue_size:int=1000,
+                 timeout:int=5000, reconnect_delay:float=2.0, latency_window:int=1000, connect=None):
+        if not isinstance(resources, dict):
+            resources = {resource: interval for resource in resources}
+        self.fields = ["forward_power", "reflected_power"] if fields is None else list(fields)
+        self.timeout = timeout
+        self.reconnect_delay = reconnect_delay
+        self.latency_window = latency_window
+        self._connect_hook = connect
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._stop = threading.Event()
+        self._workers = {resource: _Worker(self, resource, period or interval)
+                         for resource, period in resources.items()}
+        self._started = False
+
+    def _connect(self, resource:str)->Series_7027:
+        if self._connect_hook is not None:
+            return self._connect_hook(resource)
+        # Fast connects share one ResourceManager and leave the sensor configuration alone
+        sensor = Series_7027()
+        try:
+            sensor.connect(resource, self.timeout, fast=True, raise_errors=True)
+        except Exception:
+            # Do not leak a half-opened session on every retry
+            try:
+                sensor.disconnect()
+            except Exception:
+                pass
+            raise
+        return sensor
+
+    def _put(self, sample:FleetSample)->bool:
+        # Blocks while the queue is full, so a slow consumer throttles the workers
+        while not self._stop.is_set():
+            try:
+                self._queue.put(sample, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def start(self):
+        """Starts one worker thread per sensor. Sensors are connected by their workers in parallel."""
+        if not self._started:
+            self._started = True
+            for worker in self._workers.values():
+                worker.thread.start()
+        return self
+
+    def get(self, timeout:float=None)->FleetSample:
+        """Returns the next sample from any sensor.
+
+        Args:
+            timeout (float, optional): Seconds to wait. Defaults to None, which waits indefinitely.
+
+        Raises:
+            queue.Empty: If no sample arrived in time.
+
+        Returns:
+            FleetSample: The sample.
+        """
+        return self._queue.get(timeout=timeout)
+
+    def samples(self, timeout:float=None):
+        """Yields samples from all sensors in the order they complete.
+
+        Args:
+            timeout (float, optional): Stop if no sample arrives within this
+                many seconds. Defaults to None, which waits indefinitely.
+
+        Yields:
+            FleetSample: Each sample.
+        """
+        while True:
+            try:
+                yield self._queue.get(timeout=timeout)
+            except queue.Empty:
+                return
+
+    def health(self)->dict:
+        """Returns the health of every sensor.
+
+        Returns:
+            dict: InstrumentHealth keyed by resource string.
+        """
+        return {resource: worker.health() for resource, worker in self._workers.items()}
+
+    @property
+    def backlog(self)->int:
+        """Returns the number of samples waiting in the output queue."""
+        return self._queue.qsize()
+
+    def stop(self):
+        """Stops the workers and closes every session."""
+        self._stop.set()
+        for worker in self._workers.values():
+            if worker.thread.is_alive():
+                worker.thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
@@ -0,0 +1,247 @@
+"""
+Example Description:
+        This module presents client-side rolling statistics for readings
+        streamed from a 7027 or 7037 sensor.
+
+        Several windows can be kept over one stream at the same time, each
+        covering the last N samples or the last T seconds, so consumers that
+        need different averaging can share one un-averaged stream instead of
+        reconfiguring CALC:AVER on the sensor and waiting for it to refill.
+        Every update is O(1) amortised: the mean and standard deviation come
+        from running sums, and the minimum and maximum from monotonic deques.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file rolling_statistics.py
+
+"""
+
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+
+
+@dataclass
+class WindowStatistics:
+    """Statistics of the samples currently in one window.
+
+    Attributes:
+        count (int): Samples in the window.
+        mean (float): Mean of the samples.
+        std (float): Sample standard deviation, 0.0 with fewer than two samples.
+        minimum (float): Smallest sample.
+        maximum (float): Largest sample.
+    """
+    count: int
+    mean: float
+    std: float
+    minimum: float
+    maximum: float
+
+
+class RollingWindow:
+    """Rolling statistics over the last size samples or the last duration seconds.
+
+    Args:
+        size (int, optional): Number of samples to keep.
+        duration (float, optional): Seconds of samples to keep, measured on the
+            timestamps passed to add().
+
+    Exactly one of size and duration must be given.
+    """
+    # Recompute the running sums from scratch after this many removals to
+    # stop rounding error building up over long runs
+    RESUM_INTERVAL = 100000
+
+    def __init__(self, size:int=None, duration:float=None):
+        if (size is None) == (duration is None):
+            raise ValueError("Give exactly one of size and duration")
+        if size is not None and size < 1:
+            raise ValueError("size must be at least 1")
+        if duration is not None and duration <= 0:
+            raise ValueError("duration must be greater than 0")
+        self.size = size
+        self.duration = duration
+        self.clear()
+
+    def clear(self):
+        """Empties the window."""
+        self._samples = deque()          # (index, time, value)
+        self._min = deque()              # (index, value), values increasing
+        self._max = deque()              # (index, value), values decreasing
+        self._index = 0
+        self._shift = 0.0
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._removed = 0
+
+    def add(self, value:float, t:float=None):
+        """Adds one sample and drops the samples that have left the window.
+
+        Args:
+            value (float): The sample.
+            t (float, optional): Timestamp in seconds. Defaults to time.monotonic().
+        """
+        t = time.monotonic() if t is None else t
+        if not self._samples:
+            # Sums are kept relative to a recent value to limit cancellation
+            self._shift = value
+            self._sum = self._sum_sq = 0.0
+        index = self._index
+        self._index += 1
+        self._samples.append((index, t, value))
+        d = value - self._shift
+        self._sum += d
+        self._sum_sq += d * d
+
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((index, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((index, value))
+
+        self._expire(t)
+
+    def _expire(self, now:float):
+        samples = self._samples
+        while samples and ((self.size is not None and len(samples) > self.size) or
+                           (self.duration is not None and now - samples[0][1] > self.duration)):
+            index, _, value = samples.popleft()
+            d = value - self._shift
+            self._sum -= d
+            self._sum_sq -= d * d
+            if self._min[0][0] == index:
+                self._min.popleft()
+            if self._max[0][0] == index:
+                self._max.popleft()
+            self._removed += 1
+        if self._removed >= self.RESUM_INTERVAL and samples:
+            self._removed = 0
+            self._shift = samples[-1][2]
+            self._sum = math.fsum(v - self._shift for _, _, v in samples)
+            self._sum_sq = math.fsum((v - self._shift) ** 2 for _, _, v in samples)
+
+    @property
+    def count(self)->int:
+        """Returns the number of samples in the window."""
+        return len(self._samples)
+
+    @property
+    def mean(self)->float:
+        """Returns the mean of the window, or NaN if it is empty."""
+        n = len(self._samples)
+        return self._shift + self._sum / n if n else math.nan
+
+    @property
+    def std(self)->float:
+        """Returns the sample standard deviation of the window."""
+        n = len(self._samples)
+        if n < 2:
+            return 0.0
+        return math.sqrt(max(self._sum_sq - self._sum * self._sum / n, 0.0) / (n - 1))
+
+    @property
+    def minimum(self)->float:
+        """Returns the smallest sample in the window, or NaN if it is empty."""
+        return self._min[0][1] if self._min else math.nan
+
+    @property
+    def maximum(self)->float:
+        """Returns the largest sample in the window, or NaN if it is empty."""
+        return self._max[0][1] if self._max else math.nan
+
+    def statistics(self, now:float=None)->WindowStatistics:
+        """Returns the statistics of the window.
+
+        Args:
+            now (float, optional): For duration windows, first drop samples older
+                than duration before this time. Defaults to None, which leaves
+                the window as of the last add().
+
+        Returns:
+            WindowStatistics: Count, mean, standard deviation, minimum and maximum.
+        """
+        if now is not None:
+            self._expire(now)
+        return WindowStatistics(self.count, self.mean, self.std, self.minimum, self.maximum)
+
+
+class RollingStatistics:
+    """Feeds one stream of samples to several named windows.
+
+    Args:
+        windows (dict): RollingWindow objects keyed by name, for example
+            {"fast": RollingWindow(size=10), "1 min": RollingWindow(duration=60.0)}.
+    """
+    def __init__(self, windows:dict):
+        self.windows = dict(windows)
+
+    def add(self, value:float, t:float=None):
+        """Adds one sample to every window.
+
+        Args:
+            value (float): The sample.
+            t (float, optional): Timestamp in seconds. Defaults to time.monotonic().
+        """
+        t = time.monotonic() if t is None else t
+        for window in self.windows.values():
+            window.add(value, t)
+
+    def statistics(self)->dict:
+        """Returns the statistics of every window.
+
+        Returns:
+            dict: WindowStatistics keyed by window name.
+        """
+        return {name: window.statistics() for name, window in self.windows.items()}
+
+
+def stream_statistics(sensor, quantities:dict, method:str="status", timeout:float=None):
+    """Feeds every new reading from a sensor into rolling statistics.
+
+    Each quantity gets its own RollingStatistics, all filled from one
+    batched fetch per measurement, so one stream serves every window.
+
+    Args:
+        sensor (Series_7027): A connected sensor, usually with CALC:AVER:STAT 0.
+        quantities (dict): RollingStatistics keyed by Fetch.snapshot() field
+            name, for example {"forward_power": RollingStatistics({...})}.
+        method (str, optional): See Series_7027.wait_for_measurement(). Defaults to "status".
+        timeout (float, optional): Stop if no new measurement arrives within this
+            many seconds. Defaults to None, which waits indefinitely.
+
+    Yields:
+        FetchSnapshot: Each reading, after it has been added to the statistics.
+    """
+    fields = list(quantities)
+    for reading in sensor.measurements(fields, method, timeout):
+        t = time.monotonic()
+        for name in fields:
+            quantities[name].add(getattr(reading, name), t)
+        yield reading
@@ -31,15 +31,698 @@ Copyright (c) Bird
 
 @author Josh Brown
 """
+import json
+import os
+import re
+import struct
+import threading
+import time
+from contextlib import contextmanager
 import pyvisa
+from pyvisa import constants, util
+import numpy as np
+from bisect import bisect_right
+from collections import deque, namedtuple
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".bird_rf_sensors")
+
+_shared_rm = None
+_shared_rm_lock = threading.Lock()
+
+
+def shared_resource_manager()->pyvisa.ResourceManager:
+    """Returns the process-wide ResourceManager used by fast connects,
+    creating it on first use.
+
+    Returns:
+        pyvisa.ResourceManager: The shared resource manager.
+    """
+    global _shared_rm
+    with _shared_rm_lock:
+        if _shared_rm is None:
+            _shared_rm = pyvisa.ResourceManager()
+        return _shared_rm
+
+
+def _identity_cache_path()->str:
+    return os.path.join(DEFAULT_CACHE_DIR, "identity.json")
+
+
+def _load_identity(resource:str)->str:
+    try:
+        with open(_identity_cache_path(), mode='r') as file:
+            return json.load(file).get(resource)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_identity(resource:str, idn:str):
+    try:
+        path = _identity_cache_path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            with open(path, mode='r') as file:
+                identities = json.load(file)
+        except (OSError, ValueError):
+            identities = {}
+        if identities.get(resource) == idn:
+            return
+        identities[resource] = idn
+        with open(path + f".{os.getpid()}.tmp", mode='w') as file:
+            json.dump(identities, file, indent=2)
+        os.replace(path + f".{os.getpid()}.tmp", path)
+    except OSError:
+        pass
+
+
+class SCPIError(Exception):
+    """Raised when the instrument reports an error for a command that was sent.
+
+    Attributes:
+        command (str): The command that caused the error, or None if it could
+            not be singled out.
+        errors (list): (code, message) tuples read from the error queue.
+    """
+    def __init__(self, command:str, errors:list):
+        self.command = command
+        self.errors = errors
+        detail = "; ".join(f"{code},\"{message}\"" for code, message in errors)
+        super().__init__(f"{command!r} failed: {detail}" if command is not None else detail)
+
+
+def _short_form(header:str)->str:
+    """Reduces a SCPI command header to its short form so that, for example,
+    "CALCulate:AVERage:COUNt" and "CALC:AVER:COUN" map to the same setting.
+    Mnemonics sent all in upper case are taken as already being short form.
+    """
+    mnemonics = []
+    for mnemonic in header.strip().lstrip(":").split(":"):
+        if mnemonic.upper() != mnemonic:
+            mnemonic = "".join(c for c in mnemonic if not c.islower())
+        mnemonics.append(mnemonic.upper())
+    return ":".join(mnemonics)
+
+
+class _SettingsCache():
+    """Per-connection cache of instrument settings, keyed by the short form of
+    the query that reads them. Writing a setting drops it and the settings
+    it affects, so the next read asks the instrument once and caches what
+    the instrument reports, including any clamping or rounding. The other
+    cached settings are kept. Static values, such as the calibrated
+    frequency range, are held for the whole session.
+    """
+    # Commands that do not change any cached setting
+    _NO_SETTING_CHANGE = ("INIT", "INIT:IMM", "CALC:AVER:CLE", "PNP:ITR", "PNP:FILE:BLOC:NUMB", "*OPC", "*WAI", "*TRG",
+                          "STAT:MEAS:ENAB", "*SRE", "*ESE")
+    # Commands that return settings to an unknown state
+    _RESETS = ("*RST", "*CLS", "*RCL")
+    # Setting headers which only change their own value and their
+    # _DEPENDENTS. Any other command may have side effects, so it drops
+    # every cached setting.
+    _SETTINGS = ("CALC:AVER:COUN", "CALC:AVER:STAT", "CALC:GATE:BEG:DEL", "CALC:GATE:BEG:LEV:HIGH",
+                 "CALC:GATE:BEG:LEV:LOW", "CALC:GATE:END:DEL", "CALC:GATE:END:LEV:HIGH", "CALC:GATE:END:LEV:LOW",
+                 "INIT:CONT", "SENS:SWE:TIME", "SENS:SWE:TIME:AUTO", "SENS:SWE:TIME:AUTO:PER", "SENS:SWE:DEL",
+                 "SENS:FREQ", "SENS:FREQ:AUTO", "SENS:REFL:ENAB")
+    _STATE_SETTING = re.compile(r"CALC:STAT[1-4]:(ENAB|BEG|END)$")
+    # Cached settings that writing a header may change as a side effect
+    _DEPENDENTS = {
+        "SENS:SWE:TIME": ("SENS:SWE:TIME:AUTO?",),
+        "SENS:SWE:TIME:AUTO": ("SENS:SWE:TIME?",),
+        "SENS:SWE:TIME:AUTO:PER": ("SENS:SWE:TIME?",),
+        "SENS:FREQ": ("SENS:FREQ:AUTO?",),
+        "SENS:FREQ:AUTO": ("SENS:FREQ?",),
+    }
+    # Settings the instrument changes on its own while the automatic mode in
+    # the second query is on. They are only served from the cache while that
+    # mode is known to be off.
+    VOLATILE = {
+        "SENS:SWE:TIME?": "SENS:SWE:TIME:AUTO?",
+        "SENS:FREQ?": "SENS:FREQ:AUTO?",
+    }
+
+    def __init__(self):
+        self._settings = {}
+        self._static = {}
+
+    def get(self, query:str, static:bool=False):
+        if static:
+            return self._static.get(query)
+        control = self.VOLATILE.get(query)
+        if control is not None and not _is_off(self._settings.get(control)):
+            return None
+        return self._settings.get(query)
+
+    def put(self, query:str, value:str, static:bool=False):
+        (self._static if static else self._settings)[query] = value
+
+    def keys(self, static:bool=False):
+        return list((self._static if static else self._settings).keys())
+
+    def invalidate(self):
+        """Drops the cached settings. Static values are kept."""
+        self._settings.clear()
+
+    def clear(self):
+        """Drops the cached settings and static values."""
+        self._settings.clear()
+        self._static.clear()
+
+    def written(self, message:str):
+        """Updates the cache for every command in a message that was written
+        to the instrument.
+
+        Args:
+            message (str): The message as sent, possibly several commands joined with semicolons.
+        """
+        for cmd in message.split(";"):
+            header = cmd.strip().partition(" ")[0]
+            if not header:
+                continue
+            header = _short_form(header)
+            if header in self._RESETS:
+                self.invalidate()
+            elif header in self._SETTINGS or self._STATE_SETTING.match(header):
+                for dependent in self._DEPENDENTS.get(header, ()):
+                    self._settings.pop(dependent, None)
+                # Read back on next use, as the instrument may clamp or round it
+                self._settings.pop(header + "?", None)
+            elif header not in self._NO_SETTING_CHANGE:
+                # An unknown command may have side effects on the cached settings
+                self.invalidate()
+
+
+def _is_off(value:str)->bool:
+    try:
+        return value is not None and float(value) == 0
+    except ValueError:
+        return False
+
+
+def _query_block(resource, cmd:str, segment_size:int, on_segment=None)->bytearray:
+    """Sends a query answered by one IEEE 488.2 definite length block and
+    reads the data segment_size bytes at a time.
+
+    Args:
+        resource: The VISA resource.
+        cmd (str): The query.
+        segment_size (int): Bytes read per segment.
+        on_segment (callable, optional): Called as on_segment(data, received)
+            after each segment, with the block buffer and the bytes filled so far.
+
+    Returns:
+        bytearray: The data bytes of the block, without header or terminator.
+    """
+    resource.write(cmd)
+    header = resource.read_bytes(2)
+    if header[:1] != b"#" or not header[1:2].isdigit() or header[1:2] == b"0":
+        raise ValueError(f"Expected a definite length block from {cmd!r}, got {header!r}")
+    length = int(resource.read_bytes(int(header[1:2])))
+    data = bytearray(length)
+    view = memoryview(data)
+    received = 0
+    while received < length:
+        n = min(segment_size, length - received)
+        view[received:received + n] = resource.read_bytes(n)
+        received += n
+        if on_segment is not None:
+            on_segment(data, received)
+    if resource.read_termination:
+        resource.read_bytes(len(resource.read_termination))
+    return data
+
+
+# reply_size is the reply length in bytes for every kind of exchange, with
+# the termination character removed
+IORecord = namedtuple("IORecord", ["time", "model", "firmware", "kind", "command", "reply_size", "seconds"])
+
+
+class IOLog():
+    """Bounded log of the SCPI traffic on one session, with per-command
+    latency histograms. Attach it with Series_7027.start_io_log().
+
+    Commands are grouped by their short-form headers with arguments removed,
+    so "SENS:FREQ 1E6" and "SENSe:FREQuency 2E6" share one histogram. Each
+    record, summary row and exported line carries the model and firmware
+    version of the sensor, so logs from several sensors can be compared.
+
+    Args:
+        maxlen (int, optional): Most recent records kept. Defaults to 10000.
+        echo (bool, optional): Print each command as it completes. Defaults to False.
+    """
+    # Histogram bin edges in seconds, 10 us to 10 s with 5 bins per decade
+    BIN_EDGES = tuple(10.0 ** (e / 5) for e in range(-25, 6))
+
+    def __init__(self, maxlen:int=10000, echo:bool=False):
+        self.records = deque(maxlen=maxlen)
+        self.echo = echo
+        self.model = ""
+        self.firmware = ""
+        self._stats = {}
+
+    def set_identity(self, model:str, firmware:str):
+        """Sets the sensor model and firmware version stamped on new records.
+        Series_7027 calls this whenever it reads the sensor identity.
+        """
+        self.model = model
+        self.firmware = firmware
+
+    @staticmethod
+    def command_key(cmd:str)->str:
+        """Returns the grouping key for a command, for example
+        "CALC:AVER:COUN;:FETC:AVER?" for "CALCulate:AVERage:COUNt 4;:FETC:AVER?".
+        """
+        return ";:".join(_short_form(part.strip().split(" ")[0]) for part in cmd.strip().split(";") if part.strip())
+
+    def record(self, kind:str, cmd:str, reply_size:int, seconds:float):
+        """Adds one completed exchange to the log."""
+        self.records.append(IORecord(time.time(), self.model, self.firmware, kind, cmd.strip(), reply_size, seconds))
+        key = (self.model, self.firmware, self.command_key(cmd))
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = [0, 0.0, 0.0, [0] * (len(self.BIN_EDGES) + 1)]
+        stats[0] += 1
+        stats[1] += seconds
+        stats[2] = max(stats[2], seconds)
+        stats[3][bisect_right(self.BIN_EDGES, seconds)] += 1
+        if self.echo:
+            print(f"{kind} {cmd.strip()!r}: {reply_size} bytes in {seconds * 1e3:.3f} ms")
+
+    def histogram(self, cmd:str, firmware:str=None)->tuple:
+        """Returns the latency histogram for a command.
+
+        Args:
+            cmd (str): The command or its grouping key.
+            firmware (str, optional): Only count exchanges with sensors running
+                this firmware version. Defaults to None, which counts all.
+
+        Returns:
+            tuple: (edges, counts). counts has one more entry than edges;
+            counts[i] holds exchanges shorter than edges[i] and at least
+            edges[i-1] seconds, and counts[-1] those of BIN_EDGES[-1] or more.
+        """
+        key = self.command_key(cmd)
+        counts = [0] * (len(self.BIN_EDGES) + 1)
+        for (_, fw, command), stats in self._stats.items():
+            if command == key and firmware in (None, fw):
+                counts = [a + b for a, b in zip(counts, stats[3])]
+        return self.BIN_EDGES, counts
+
+    def summary(self)->list:
+        """Returns per-command totals for each sensor model and firmware
+        version, the most expensive command first.
+
+        Returns:
+            list: One dict per command and firmware version with "model",
+            "firmware", "command", "count", "total_seconds", "mean_seconds"
+            and "max_seconds".
+        """
+        rows = [{"model": model, "firmware": firmware, "command": key, "count": n,
+                 "total_seconds": total, "mean_seconds": total / n, "max_seconds": worst}
+                for (model, firmware, key), (n, total, worst, _) in self._stats.items()]
+        return sorted(rows, key=lambda row: row["total_seconds"], reverse=True)
+
+    def to_jsonl(self, path:str):
+        """Writes the logged records to a JSON Lines file, one exchange per line.
+
+        Args:
+            path (str): The file to create.
+        """
+        with open(path, mode='w') as file:
+            for rec in self.records:
+                file.write(json.dumps(rec._asdict()) + "\n")
+
+    def clear(self):
+        """Discards the records and histograms."""
+        self.records.clear()
+        self._stats.clear()
+
+
+class _TracedResource():
+    # Stands in for the VISA resource while an IOLog is attached, so that the
+    # untraced path pays nothing for tracing.
+    def __init__(self, resource, log:IOLog):
+        self.resource = resource
+        self.log = log
+
+    def __getattr__(self, name):
+        return getattr(self.resource, name)
+
+    def write(self, cmd:str):
+        start = time.perf_counter()
+        result = self.resource.write(cmd)
+        self.log.record("write", cmd, 0, time.perf_counter() - start)
+        return result
+
+    def query(self, cmd:str)->str:
+        start = time.perf_counter()
+        reply = self.resource.query(cmd)
+        self.log.record("query", cmd, len(reply), time.perf_counter() - start)
+        return reply
+
+    def query_ascii_values(self, cmd:str, converter="f", separator=",", container=list, delay:float=None):
+        # Read as text and parse here, so the reply size is in bytes as for query()
+        start = time.perf_counter()
+        reply = self.resource.query(cmd, delay)
+        values = util.from_ascii_block(reply, converter, separator, container)
+        self.log.record("query_ascii_values", cmd, len(reply), time.perf_counter() - start)
+        return values
+
+    def query_binary_values(self, cmd:str, datatype="f", **kwargs):
+        start = time.perf_counter()
+        values = self.resource.query_binary_values(cmd, datatype=datatype, **kwargs)
+        # The IEEE 488.2 block: "#", the digit count, the length digits, then the data
+        data_size = struct.calcsize(datatype) * len(values)
+        self.log.record("query_binary_values", cmd, 2 + len(str(data_size)) + data_size, time.perf_counter() - start)
+        return values
+
+    def query_block(self, cmd:str, segment_size:int, on_segment=None)->bytearray:
+        start = time.perf_counter()
+        data = _query_block(self.resource, cmd, segment_size, on_segment)
+        self.log.record("query_block", cmd, 2 + len(str(len(data))) + len(data), time.perf_counter() - start)
+        return data
+
+
+class FetchCache():
+    """Cache of FETCh query replies for the current measurement cycle. Turn it
+    on with Series_7027.enable_fetch_cache().
+
+    A fetch that misses is sent together with STAT:MEAS:EVEN?, so the same
+    round trip tells whether a new measurement has completed. When one has,
+    all replies from the earlier cycle are dropped. A cached reply is
+    returned without any bus traffic for up to check_interval seconds after
+    the last event check. After that the query is sent again.
+    Any command written to the sensor, such as INIT or a setting change,
+    also drops the cached replies.
+
+    Reading STAT:MEAS:EVEN? clears the event for everyone, so the cache
+    remembers, per thread, the newest measurement that thread has fetched
+    or been told about. A waiter is woken for a measurement another thread's
+    fetch detected, but never for one its own fetch already returned.
+
+    Args:
+        check_interval (float, optional): Longest time in seconds a cached reply is
+            trusted without asking the sensor for a new measurement. Defaults to 0.01.
+        event_mask (int, optional): STAT:MEAS event bits that mark a new
+            measurement. Defaults to Series_7027.MEASUREMENT_EVENT_MASK.
+
+    Attributes:
+        hits (int): Queries answered from memory.
+        misses (int): Queries sent to the sensor.
+        cycles (int): New measurements detected.
+    """
+    def __init__(self, check_interval:float=0.01, event_mask:int=15):
+        self.check_interval = check_interval
+        self.event_mask = event_mask
+        self.hits = 0
+        self.misses = 0
+        self.cycles = 0
+        self._replies = {}
+        self._checked = None
+        self._readers = threading.local()
+
+    @staticmethod
+    def key(cmd:str)->str:
+        """Returns the cache key for a message made only of FETCh queries, or None."""
+        parts = [part.strip() for part in cmd.strip().split(";")]
+        if not all(part.endswith("?") for part in parts):
+            return None
+        headers = [_short_form(part.rstrip("?")) for part in parts]
+        if not all(header.startswith("FETC") for header in headers):
+            return None
+        return ";:".join(headers)
+
+    def query(self, resource, cmd:str)->str:
+        """Answers a query from the cache where possible, otherwise from resource.
+
+        Args:
+            resource: The VISA resource to send misses and other queries to.
+            cmd (str): The query.
+
+        Returns:
+            str: The reply.
+        """
+        key = self.key(cmd)
+        if key is None:
+            if any(not part.strip().endswith("?") for part in cmd.strip().split(";")):
+                # The message carries a command, for example INIT:IMM;*OPC?
+                self.invalidate()
+            return resource.query(cmd)
+
+        now = time.monotonic()
+        reply = self._replies.get(key)
+        if reply is not None and now - self._checked < self.check_interval:
+            self.hits += 1
+            self._readers.cycle = self.cycles
+            return reply
+        self.misses += 1
+        event, _, reply = resource.query(f"STAT:MEAS:EVEN?;:{cmd.strip()}").partition(";")
+        self.observed_event(int(event), now)
+        self._replies[key] = reply
+        # The reply belongs to the newest measurement, so this thread has it
+        self._readers.cycle = self.cycles
+        return reply
+
+    def observed_event(self, event:int, now:float=None):
+        """Records a STAT:MEAS:EVEN? reply read by the cache or by anyone else,
+        dropping the cached replies if it reports a new measurement.
+        """
+        self._checked = time.monotonic() if now is None else now
+        if event & self.event_mask:
+            self.invalidate()
+            self.cycles += 1
+
+    def take_event(self)->bool:
+        """Returns True if the cache has seen a measurement newer than the
+        last one the calling thread fetched or was told about, then marks it
+        as told about.
+        """
+        seen = getattr(self._readers, "cycle", 0)
+        self._readers.cycle = self.cycles
+        return self.cycles > seen
+
+    def invalidate(self):
+        """Drops every cached reply."""
+        self._replies.clear()
+
+
+class _InstrumentSession():
+    """Wraps the VISA resource that Series_7027 and its subsystems talk to.
+    Every write and query passes through here, which keeps the settings cache
+    in step with what has been sent and lets an optional FetchCache answer
+    repeated fetches. Anything not defined here is passed on to the
+    underlying pyvisa resource.
+    """
+    # Longest joined command sent in one message during a transaction
+    MAX_COMMAND_LENGTH = 512
+    # One SYST:ERR? reply, as read back after each command of a transaction
+    ERROR_REPLY = re.compile(r'([+-]?\d+),"((?:[^"]|"")*)"')
+    # Upper bound on SYST:ERR? reads when draining the error queue
+    MAX_ERROR_QUEUE = 32
+
+    def __init__(self, resource):
+        self._resource = resource
+        self._lock = threading.RLock()
+        self.settings = _SettingsCache()
+        self._batch = None
+        self._batch_failures = []
+        self.fetches = None
+
+    def __getattr__(self, name):
+        return getattr(self._resource, name)
+
+    def write(self, cmd:str):
+        with self._lock:
+            if self._batch is not None:
+                self._batch.append(cmd.strip())
+                return
+            self._resource.write(cmd)
+            self.settings.written(cmd)
+            if self.fetches is not None:
+                self.fetches.invalidate()
+
+    def query(self, cmd:str)->str:
+        with self._lock:
+            self._flush()
+            if self.fetches is not None:
+                return self.fetches.query(self._resource, cmd)
+            return self._resource.query(cmd)
+
+    def query_ascii_values(self, cmd:str, **kwargs):
+        with self._lock:
+            self._flush()
+            if self.fetches is not None and FetchCache.key(cmd) is not None:
+                kwargs.pop("delay", None)
+                return pyvisa.util.from_ascii_block(self.fetches.query(self._resource, cmd), **kwargs)
+            return self._resource.query_ascii_values(cmd, **kwargs)
+
+    def query_binary_values(self, cmd:str, **kwargs):
+        with self._lock:
+            self._flush()
+            return self._resource.query_binary_values(cmd, **kwargs)
+
+    def query_block(self, cmd:str, segment_size:int, on_segment=None)->bytearray:
+        """Sends a query answered by one IEEE 488.2 definite length block and
+        reads the block in segments, see _query_block().
+        """
+        with self._lock:
+            self._flush()
+            if self.fetches is not None and FetchCache.key(cmd) is None:
+                # The message may carry a command, for example INIT:IMM
+                self.fetches.invalidate()
+            if isinstance(self._resource, _TracedResource):
+                return self._resource.query_block(cmd, segment_size, on_segment)
+            return _query_block(self._resource, cmd, segment_size, on_segment)
+
+    def attach_io_log(self, log:IOLog):
+        """Routes all I/O on this session through log, replacing any log already attached."""
+        with self._lock:
+            self.detach_io_log()
+            self._resource = _TracedResource(self._resource, log)
+
+    def detach_io_log(self):
+        """Stops logging I/O on this session."""
+        with self._lock:
+            if isinstance(self._resource, _TracedResource):
+                self._resource = self._resource.resource
+
+    def _flush(self):
+        # Sends the writes buffered so far in a transaction, joined into as few
+        # messages as MAX_COMMAND_LENGTH allows. Each command is followed by
+        # SYST:ERR? in the same message, so the one reply per message tells
+        # which commands failed without sending any of them twice. Failures
+        # are raised on commit.
+        if not self._batch:
+            return
+        pending, self._batch = self._batch, []
+        if self.fetches is not None:
+            self.fetches.invalidate()
+        while pending:
+            message = ""
+            count = 0
+            for cmd in pending:
+                part = (cmd if cmd.startswith((":", "*")) else ":" + cmd) + ";:SYST:ERR?"
+                if message and len(message) + 1 + len(part) > self.MAX_COMMAND_LENGTH:
+                    break
+                message = f"{message};{part}" if message else part
+                count += 1
+            sent, pending = pending[:count], pending[count:]
+            checks = self.ERROR_REPLY.findall(self._resource.query(message))
+            for cmd, (code, text) in zip(sent, checks):
+                self.settings.written(cmd)
+                if int(code) != 0:
+                    self._batch_failures.append((cmd, [(int(code), text.replace('""', '"'))]))
+            if len(checks) < len(sent):
+                # The sensor dropped the rest of the message at the command
+                # without a check. Those after it never ran, so send them next.
+                failed = sent[len(checks)]
+                self._batch_failures.append((failed, self.drain_errors()))
+                pending = sent[len(checks) + 1:] + pending
+
+    def measurement_event(self, event_mask:int)->bool:
+        """Reads and clears the measurement event register.
+
+        Args:
+            event_mask (int): STAT:MEAS event bits that mark a new measurement.
+
+        Returns:
+            bool: True if a new measurement has completed since the last read.
+            With a fetch cache, True if one has completed that the calling
+            thread has not yet fetched or been told about.
+        """
+        with self._lock:
+            event = int(self.query("STAT:MEAS:EVEN?").strip())
+            if self.fetches is None:
+                return bool(event & event_mask)
+            self.fetches.observed_event(event)
+            return self.fetches.take_event()
+
+    def drain_errors(self)->list:
+        """Reads the instrument error queue until it is empty.
+
+        Returns:
+            list: (code, message) tuples, oldest first.
+        """
+        errors = []
+        with self._lock:
+            for _ in range(self.MAX_ERROR_QUEUE):
+                code, _, message = self._resource.query("SYST:ERR?").strip().partition(",")
+                if int(code) == 0:
+                    break
+                errors.append((int(code), message.strip('"')))
+        return errors
+
+    @contextmanager
+    def transaction(self):
+        """Buffers writes and sends them as joined commands followed by one
+        error check, see Series_7027.transaction().
+        """
+        with self._lock:
+            if self._batch is not None:
+                # Nested transactions join the outer one
+                yield
+                return
+            self._batch = []
+            self._batch_failures = []
+            try:
+                yield
+            except BaseException:
+                # Writes not yet sent are dropped
+                self._batch = None
+                raise
+            try:
+                self._flush()
+            finally:
+                self._batch = None
+            failures, self._batch_failures = self._batch_failures, []
+            if failures:
+                # A command can queue more than the one error its check read
+                errors = [error for _, cmd_errors in failures for error in cmd_errors] + self.drain_errors()
+                self.settings.clear()
+                raise SCPIError(failures[0][0], errors)
+
+    def cached_query(self, cmd:str, static:bool=False)->str:
+        """Returns the cached reply for a settings query, only querying the
+        instrument when the value is not cached yet.
+
+        Args:
+            cmd (str): The settings query, for example "CALC:AVER:COUN?".
+            static (bool, optional): Cache for the whole session, ignoring
+                writes and resets. Defaults to False.
+
+        Returns:
+            str: The reply, as returned by query().
+        """
+        key = _short_form(cmd.strip().rstrip("?")) + "?"
+        with self._lock:
+            self._flush()
+        control = None if static else self.settings.VOLATILE.get(key)
+        if control is not None and not _is_off(self.cached_query(control)):
+            # The instrument is setting this value itself, so read it live
+            return self.query(cmd)
+        value = self.settings.get(key, static)
+        if value is None:
+            value = self.query(cmd)
+            self.settings.put(key, value, static)
+        return value
+
+    def refresh(self):
+        """Re-reads every cached setting and static value from the instrument."""
+        for static in (False, True):
+            for key in self.settings.keys(static):
+                self.settings.put(key, self.query(key), static)
+
 
 class Series_7027():
     """_summary_
     """
-    def __init__(self, instrument_resource_string=None):
+    def __init__(self, instrument_resource_string=None, resource_manager:pyvisa.ResourceManager=None):
         self._instrument_resource_string = instrument_resource_string
         self._rm = None
+        # A resource manager given here is used by every connect, fast or not
+        self._given_resource_manager = resource_manager
+        self._resource_manager = resource_manager
         self._instr_obj = None
+        self._session = None
         self._timeout = 5000
         self._echo_cmds = False
         self._mfg_id = ""
@@ -47,26 +730,35 @@ class Series_7027():
         self._sn = ""
         self._fw = ""
         self._general = ""
+        self._subsystems = {}
+        self._identity_thread = None
+        self._io_log = None
+        self._fetch_cache = None
 
-        self.calculate = None
-        self.sense = None
-        self.trigger = None
-        self.fetch = None
-        self.format = None
-        self.pnp = None
-
-        try:
-            if self._rm is None:
-                self._resource_manager = pyvisa.ResourceManager()
-        except pyvisa.VisaIOError as visaerror:
-            print(f"{visaerror}")
-        except pyvisa.VisaIOWarning as visawarning:
-            print(f"{visawarning}")
+    def connect(self, instrument_resource_string:str=None, timeout:int=None, fast:bool=False, raise_errors:bool=False):
+        """Opens the connection to the sensor.
 
-    def connect(self, instrument_resource_string:str=None, timeout:int=None):
+        Args:
+            instrument_resource_string (str, optional): VISA resource string. Defaults to the one given to the constructor.
+            timeout (int, optional): VISA timeout in milliseconds. Defaults to 5000.
+            fast (bool, optional): Fast-connect mode. Skips the *CLS;*RST so the
+                sensor keeps its current configuration, uses one process-wide
+                ResourceManager unless one was given to the constructor, and takes the identity from the on-disk cache
+                while it is re-checked in the background. Defaults to False.
+            raise_errors (bool, optional): Raise VISA errors instead of printing
+                them, so the caller can tell that the connection failed.
+                Defaults to False.
+        """
         try:
             if instrument_resource_string != None:
                 self._instrument_resource_string = instrument_resource_string
+
+            if self._given_resource_manager is not None:
+                self._resource_manager = self._given_resource_manager
+            elif fast:
+                self._resource_manager = shared_resource_manager()
+            elif self._resource_manager is None:
+                self._resource_manager = pyvisa.ResourceManager()
                 
             self._instr_obj = self._resource_manager.open_resource(
                 self._instrument_resource_string
@@ -82,31 +774,288 @@ class Series_7027():
             self._instr_obj.write_termination = "\n"
             self._instr_obj.read_termination = "\n"
 
-            #self._instr_obj.write("*CLS;*RST\n")
-            self.write("*CLS;*RST")
-
-            # Ensure sub-classes are updated properly
-            self.calculate = self.Calculate(self._instr_obj)
-            self.fetch = self.Fetch(self._instr_obj)
-            self.format = self.Format(self._instr_obj)
-            self.sense = self.Sense(self._instr_obj)
-            self.trigger = self.Trigger(self._instr_obj)
-            self.pnp = self.PnP(self._instr_obj)
-
-            # Extract the instrument ID string and populate attributes
-            self._general = self.query("*IDN?")
-            self._general = self._general.rstrip()
-            self._mfg_id, self._model, self._sn, self._fw = self._general.split(',')
+            # A new session starts with an empty settings cache, and the
+            # reset below would invalidate it anyway
+            self._session = _InstrumentSession(self._instr_obj)
+
+            # Sub-classes are built on first use against the new session
+            self._subsystems = {}
+            if self._echo_cmds and self._io_log is None:
+                self._io_log = IOLog(echo=True)
+            if self._io_log is not None:
+                self._session.attach_io_log(self._io_log)
+            if self._fetch_cache is not None:
+                self._fetch_cache.invalidate()
+                self._session.fetches = self._fetch_cache
+
+            if not fast:
+                #self._instr_obj.write("*CLS;*RST\n")
+                self.write("*CLS;*RST")
+
+            cached_identity = _load_identity(self._instrument_resource_string) if fast else None
+            if cached_identity is not None:
+                self._set_identity(cached_identity)
+                self._identity_thread = threading.Thread(target=self._revalidate_identity, daemon=True)
+                self._identity_thread.start()
+            else:
+                # Extract the instrument ID string and populate attributes
+                self._set_identity(self.query("*IDN?"))
+                _save_identity(self._instrument_resource_string, self._general)
 
         except pyvisa.VisaIOError as visaerr:
+            if raise_errors:
+                raise
             print(f"{visaerr}")
         return
+
+    def _set_identity(self, idn:str):
+        fields = idn.rstrip().split(',')
+        if len(fields) != 4:
+            # Nothing that answers like a sensor is on the other end
+            raise ConnectionError(f"No valid *IDN? reply from {self._instrument_resource_string}: {idn!r}")
+        self._general = idn.rstrip()
+        self._mfg_id, self._model, self._sn, self._fw = fields
+        if self._io_log is not None:
+            self._io_log.set_identity(self._model, self._fw)
+
+    def _revalidate_identity(self):
+        session = self._session
+        if session is None:
+            return
+        with session._lock:
+            # disconnect() closes the session under the same lock
+            if self._session is not session:
+                return
+            try:
+                idn = session.query("*IDN?\n").rstrip()
+                if idn != self._general:
+                    self._set_identity(idn)
+            except Exception:
+                # Keep the cached identity; a full connect reads it again
+                return
+        _save_identity(self._instrument_resource_string, idn)
+
+    def _connected_session(self)->_InstrumentSession:
+        if self._session is None:
+            raise ConnectionError("Not connected to a sensor; call connect() first")
+        return self._session
+
+    def _subsystem(self, name:str, factory):
+        subsystem = self._subsystems.get(name)
+        if subsystem is None:
+            self._connected_session()
+            subsystem = factory()
+            self._subsystems[name] = subsystem
+        return subsystem
+
+    @property
+    def calculate(self):
+        return self._subsystem("calculate", lambda: self.Calculate(self._session))
+
+    @property
+    def fetch(self):
+        return self._subsystem("fetch", lambda: self.Fetch(self._session))
+
+    @property
+    def format(self):
+        return self._subsystem("format", lambda: self.Format(self._session))
+
+    @property
+    def sense(self):
+        return self._subsystem("sense", lambda: self.Sense(self._session))
+
+    @property
+    def trigger(self):
+        return self._subsystem("trigger", lambda: self.Trigger(self._session))
+
+    @property
+    def pnp(self):
+        return self._subsystem("pnp", lambda: self.PnP(self._session, identity=lambda: (self._model, self._sn, self._fw)))
+
+    @property
+    def trace(self):
+        return self._subsystem("trace", lambda: self.Trace(self._session))
     
     def write(self, cmd):
-        self._instr_obj.write(f"{cmd}\n")
+        self._connected_session().write(f"{cmd}\n")
 
     def query(self, cmd):
-        return self._instr_obj.query(f"{cmd}\n")
+        return self._connected_session().query(f"{cmd}\n")
+
+    def start_io_log(self, maxlen:int=10000, echo:bool=None)->IOLog:
+        """Starts recording every command sent to the sensor with its reply
+        size and round trip time. The log stays attached across reconnects.
+
+        Args:
+            maxlen (int, optional): Most recent exchanges kept. Defaults to 10000.
+            echo (bool, optional): Print each exchange. Defaults to None, which
+                follows the echo commands setting of this instance.
+
+        Returns:
+            IOLog: The new log, also available as io_log.
+        """
+        self._io_log = IOLog(maxlen, self._echo_cmds if echo is None else echo)
+        self._io_log.set_identity(self._model, self._fw)
+        if self._session is not None:
+            self._session.attach_io_log(self._io_log)
+        return self._io_log
+
+    def stop_io_log(self)->IOLog:
+        """Stops recording I/O.
+
+        Returns:
+            IOLog: The log that was attached, or None.
+        """
+        log, self._io_log = self._io_log, None
+        if self._session is not None:
+            self._session.detach_io_log()
+        return log
+
+    @property
+    def io_log(self)->IOLog:
+        """Returns the attached I/O log, or None when I/O is not being recorded."""
+        return self._io_log
+
+    def enable_fetch_cache(self, check_interval:float=0.01)->FetchCache:
+        """Answers repeated fetches of the same result from memory until the
+        sensor completes a new measurement, so several readers polling one
+        sensor do not each send the same query. The cache stays on across
+        reconnects.
+
+        Args:
+            check_interval (float, optional): Longest time in seconds a cached
+                reply is returned without asking the sensor whether a new
+                measurement has completed, and so the most a reply can lag
+                the sensor. Defaults to 0.01.
+
+        Returns:
+            FetchCache: The cache, also available as fetch_cache.
+        """
+        self._fetch_cache = FetchCache(check_interval, self.MEASUREMENT_EVENT_MASK)
+        if self._session is not None:
+            self._session.fetches = self._fetch_cache
+        return self._fetch_cache
+
+    def disable_fetch_cache(self)->FetchCache:
+        """Sends every fetch to the sensor again.
+
+        Returns:
+            FetchCache: The cache that was in use, or None.
+        """
+        cache, self._fetch_cache = self._fetch_cache, None
+        if self._session is not None:
+            self._session.fetches = None
+        return cache
+
+    @property
+    def fetch_cache(self)->FetchCache:
+        """Returns the fetch cache, or None when fetches are not cached."""
+        return self._fetch_cache
+
+    def transaction(self):
+        """Returns a context manager which batches every setter and write()
+        made inside it. On leaving the block the writes are sent joined with
+        ";", split only where they would exceed MAX_COMMAND_LENGTH, each
+        followed by SYST:ERR? in the same message, so one reply per message
+        reports every command's outcome and no command is ever sent twice.
+        A query inside the block sends the writes buffered so far first. If
+        the block raises, unsent writes are dropped.
+
+        Example:
+            with sensor.transaction():
+                sensor.calculate.average.count = 16
+                sensor.sense.frequency.auto = 0
+
+        Raises:
+            SCPIError: On leaving the block, if the instrument reported an
+                error. Its command attribute names the first command that failed.
+        """
+        return self._connected_session().transaction()
+
+    # Bits of the measurement status register (STAT:MEAS) that are treated as
+    # "new measurement ready". 15 is the enable mask used by the Series_7022
+    # zero calibration example.
+    MEASUREMENT_EVENT_MASK = 15
+
+    def _measurement_event(self)->bool:
+        # Reading the event register also clears it
+        return self._connected_session().measurement_event(self.MEASUREMENT_EVENT_MASK)
+
+    def _wait_for_operation_complete(self, timeout:float)->bool:
+        session = self._connected_session()
+        if timeout is None:
+            session.query("INIT:IMM;*OPC?")
+            return True
+        with session._lock:
+            self._instr_obj.timeout = max(1, int(timeout * 1000))
+            try:
+                session.query("INIT:IMM;*OPC?")
+            except pyvisa.VisaIOError as visaerr:
+                if visaerr.error_code != constants.StatusCode.error_timeout:
+                    raise
+                # Drop the *OPC? reply still to come, so the next query does not read it
+                self._instr_obj.clear()
+                return False
+            finally:
+                self._instr_obj.timeout = self._timeout
+        return True
+
+    def wait_for_measurement(self, timeout:float=None, method:str="status", poll_interval:float=0.001)->bool:
+        """Blocks until the sensor has a new measurement ready.
+
+        Args:
+            timeout (float, optional): Seconds to wait. Defaults to None, which waits indefinitely.
+            method (str, optional): How completion is detected.
+                "opc" - trigger a single measurement and wait on *OPC? in the same
+                    query. For use with continuous trigger off. The VISA timeout is
+                    set to timeout for the query; None keeps the session's VISA timeout.
+                "status" - poll the measurement event register (STAT:MEAS:EVEN?).
+                Defaults to "status". There is no service request method, as
+                the status register chain that would route a measurement
+                event to the status byte has not been confirmed for these
+                sensors.
+            poll_interval (float, optional): Seconds between polls for "status". Defaults to 0.001.
+
+        Returns:
+            bool: True when a new measurement is ready, False on timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if method == "opc":
+            return self._wait_for_operation_complete(timeout)
+        if method != "status":
+            raise ValueError(f"Unknown wait method {method!r}")
+        while not self._measurement_event():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(poll_interval)
+        return True
+
+    def measurements(self, fields:list=None, method:str="status", timeout:float=None):
+        """Yields each new measurement exactly once, as soon as it is ready,
+        instead of sleeping between fetches.
+
+        Args:
+            fields (list, optional): Fields to fetch, see Fetch.snapshot(). Defaults to DEFAULT_SNAPSHOT_FIELDS.
+            method (str, optional): "opc" or "status", see wait_for_measurement(). Defaults to "status".
+            timeout (float, optional): Stop if no new measurement arrives within this
+                many seconds. Defaults to None, which waits indefinitely.
+
+        Yields:
+            FetchSnapshot: The results of each new measurement.
+        """
+        if method != "opc":
+            # Discard any completion that happened before iteration started
+            self._measurement_event()
+        while self.wait_for_measurement(timeout, method):
+            yield self.fetch.snapshot(fields)
+
+    def refresh(self):
+        """Forces every cached setting, including the static calibration
+        limits, to be read again from the instrument. Use this if the
+        instrument may have been reconfigured by something other than this
+        driver.
+        """
+        self._connected_session().refresh()
 
     def disconnect(self):
         """
@@ -118,8 +1067,15 @@ class Series_7027():
         Returns:
             None
         """
+        session, self._session = self._session, None
+        self._subsystems = {}
         try:
-            self._instr_obj.close()
+            if session is None:
+                self._instr_obj.close()
+            else:
+                # Waits for any exchange in progress, such as the background identity check
+                with session._lock:
+                    self._instr_obj.close()
         except pyvisa.VisaIOError as visaerr:
             print(f"{visaerr}")
         return
@@ -161,8 +1117,9 @@ class Series_7027():
         return self._sn
     
     class PnP():
-        def __init__(self, instrobj):
+        def __init__(self, instrobj, identity=None):
             self._instr_obj = instrobj
+            self._identity = identity
             self.file = self.File(self._instr_obj)
 
         def initiate_transfer(self):
@@ -171,6 +1128,81 @@ and updates the file size and total number of blocks fields. The command is issu
             """
             self._instr_obj.write("PNP:ITRansfer")
 
+        def cache_path(self, cache_dir:str=DEFAULT_CACHE_DIR)->str:
+            """Gets the file the Plug and Play data for this sensor is cached in.
+
+            Args:
+                cache_dir (str, optional): Base cache directory. Defaults to DEFAULT_CACHE_DIR.
+
+            Returns:
+                str: The cache file path, or None if the sensor identity is not known.
+            """
+            if self._identity is None or not all(self._identity()):
+                return None
+            name = "_".join(re.sub(r"[^A-Za-z0-9.-]", "-", part.strip()) for part in self._identity())
+            return os.path.join(cache_dir, "pnp", f"{name}.pnp")
+
+        def download(self, progress=None, cache_dir:str=DEFAULT_CACHE_DIR, use_cache:bool=True)->bytes:
+            """Transfers the whole Plug and Play file.
+
+            The file is cached on disk keyed by model, serial number and firmware
+            version, so later connects to the same sensor never transfer it again.
+            Otherwise the size and block count are read in one query and each
+            block is selected and read in a single round trip.
+
+            Each PNP:FILE:BLOCk:DATA? reply is read as an IEEE 488.2 definite
+            length block of raw file bytes. That transfer format has not yet
+            been confirmed on hardware, so File.Block.data() still returns
+            the reply as text.
+
+            Args:
+                progress (callable, optional): Called as progress(bytes_received, total_bytes)
+                    after each block. Defaults to None.
+                cache_dir (str, optional): Base cache directory, or None to disable
+                    the disk cache. Defaults to DEFAULT_CACHE_DIR.
+                use_cache (bool, optional): Return the cached file if there is one.
+                    Pass False to force a transfer and refresh the cache. Defaults to True.
+
+            Raises:
+                ValueError: If the transferred data does not match PNP:FILE:SIZE?.
+
+            Returns:
+                bytes: The Plug and Play file contents.
+            """
+            path = self.cache_path(cache_dir) if cache_dir is not None else None
+            if use_cache and path is not None and os.path.exists(path):
+                with open(path, mode='rb') as file:
+                    data = file.read()
+                if progress is not None:
+                    progress(len(data), len(data))
+                return data
+
+            self.initiate_transfer()
+            size, total = self._instr_obj.query("PNP:FILE:SIZE?;:PNP:FILE:BLOCk:TOTal?").strip().split(";")
+            size, total = int(size), int(total)
+
+            blocks = []
+            received = 0
+            for number in range(1, total + 1):
+                block = self._instr_obj.query_binary_values(f"PNP:FILE:BLOCk:NUMBer {number};:PNP:FILE:BLOCk:DATA?",
+                                                            datatype='B',
+                                                            container=bytes)
+                blocks.append(block)
+                received += len(block)
+                if progress is not None:
+                    progress(received, size)
+
+            data = b"".join(blocks)
+            if len(data) != size:
+                raise ValueError(f"Plug and Play transfer returned {len(data)} bytes, expected {size}")
+
+            if path is not None:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path + ".tmp", mode='wb') as file:
+                    file.write(data)
+                os.replace(path + ".tmp", path)
+            return data
+
         class File():
             def __init__(self, instrobj):
                 self._instr_obj = instrobj
@@ -256,7 +1288,7 @@ and updates the file size and total number of blocks fields. The command is issu
                 Returns:
                     int: Number of measurements to average.
                 """
-                return int(self._instr_obj.query("CALC:AVER:COUN?").rstrip())
+                return int(self._instr_obj.cached_query("CALC:AVER:COUN?").rstrip())
             
             @count.setter
             def count(self, count:int=1):
@@ -274,7 +1306,7 @@ and updates the file size and total number of blocks fields. The command is issu
                 Returns:
                     int: 1 for enabled, 0 for disabled.
                 """
-                return int(self._instr_obj.query("CALC:AVER:STAT?").rstrip())
+                return int(self._instr_obj.cached_query("CALC:AVER:STAT?").rstrip())
             
             @state.setter
             def state(self, enabled:int=0):
@@ -308,7 +1340,7 @@ and updates the file size and total number of blocks fields. The command is issu
                     Returns:
                         float: Delay in seconds. 
                     """
-                    return float(self._instr_obj.query("CALC:GATE:BEG:DEL?").rstrip())
+                    return float(self._instr_obj.cached_query("CALC:GATE:BEG:DEL?").rstrip())
                 
                 @delay.setter
                 def delay(self, secs:float=0.0):
@@ -330,7 +1362,7 @@ and updates the file size and total number of blocks fields. The command is issu
                         Returns:
                             float: High threshold as a percent.
                         """
-                        return float(self._instr_obj.query("CALC:GATE:BEG:LEV:HIGH?").rstrip())
+                        return float(self._instr_obj.cached_query("CALC:GATE:BEG:LEV:HIGH?").rstrip())
                     
                     @high.setter
                     def high(self, value:float=90.0):
@@ -348,7 +1380,7 @@ and updates the file size and total number of blocks fields. The command is issu
                         Returns:
                             float: Low threshold as a percent.
                         """
-                        return float(self._instr_obj.query("CALC:GATE:BEG:LEV:LOW?").rstrip())
+                        return float(self._instr_obj.cached_query("CALC:GATE:BEG:LEV:LOW?").rstrip())
                     
                     @low.setter
                     def low(self, value:float=10.0):
@@ -371,7 +1403,7 @@ and updates the file size and total number of blocks fields. The command is issu
                     Returns:
                         float: Delay in seconds. 
                     """
-                    return float(self._instr_obj.query("CALC:GATE:END:DEL?").rstrip())
+                    return float(self._instr_obj.cached_query("CALC:GATE:END:DEL?").rstrip())
                 
                 @delay.setter
                 def delay(self, secs:float=0.0):
@@ -393,7 +1425,7 @@ and updates the file size and total number of blocks fields. The command is issu
                         Returns:
                             float: High threshold as a percent.
                         """
-                        return float(self._instr_obj.query("CALC:GATE:END:LEV:HIGH?").rstrip())
+                        return float(self._instr_obj.cached_query("CALC:GATE:END:LEV:HIGH?").rstrip())
                     
                     @high.setter
                     def high(self, value:float=90.0):
@@ -411,7 +1443,7 @@ and updates the file size and total number of blocks fields. The command is issu
                         Returns:
                             float: Low threshold as a percent.
                         """
-                        return float(self._instr_obj.query("CALC:GATE:BEG:LEV:LOW?").rstrip())
+                        return float(self._instr_obj.cached_query("CALC:GATE:BEG:LEV:LOW?").rstrip())
                     
                     @low.setter
                     def low(self, value:float=10.0):
@@ -441,7 +1473,7 @@ and updates the file size and total number of blocks fields. The command is issu
                 Returns:
                     int: 0 for OFF or 1 for ON.
                 """
-                tmpval = self._instr_obj.query(f"CALC:STAT{statenum}:ENAB?").rstrip()
+                tmpval = self._instr_obj.cached_query(f"CALC:STAT{statenum}:ENAB?").rstrip()
                 intval = 0
                 if "OFF" in tmpval:
                     intval = 0
@@ -472,7 +1504,7 @@ and updates the file size and total number of blocks fields. The command is issu
                 Returns:
                     float: Delay in seconds from the trigger point.
                 """
-                return float(self._instr_obj.query(f"CALC:STAT{statenum}:BEG?").rstrip())
+                return float(self._instr_obj.cached_query(f"CALC:STAT{statenum}:BEG?").rstrip())
             
             @begin_delay.setter
             def begin_delay(self, statenum:int=1, delay:float=0.0):
@@ -494,7 +1526,7 @@ and updates the file size and total number of blocks fields. The command is issu
                 Returns:
                     float: Delay in seconds from the trigger point.
                 """
-                return float(self._instr_obj.query(f"CALC:STAT{statenum}:END?").rstrip())
+                return float(self._instr_obj.cached_query(f"CALC:STAT{statenum}:END?").rstrip())
             
             @begin_delay.setter
             def end_delay(self, statenum:int=1, delay:float=0.0):
@@ -512,10 +1544,69 @@ and updates the file size and total number of blocks fields. The command is issu
         Returns:
             _type_: _description_
         """
+        # SCPI query and result type for each field available to snapshot()
+        SNAPSHOT_FIELDS = {
+            "forward_power": ("FETC:AVER?", float),
+            "reflected_power": ("FETC:REFL:AVER?", float),
+            "temperature": ("FETC:TEMP?", float),
+            "duty_cycle": ("FETC:DCYC?", float),
+            "frequency": ("FETC:FREQ?", float),
+            "gate_count": ("FETC:GATE:COUN?", int),
+            "gate_maximum": ("FETC:GATE:MAX?", float),
+            "gate_minimum": ("FETC:GATE:MIN?", float),
+            "gate_mean": ("FETC:GATE:MEAN?", float),
+            "period": ("FETC:PER?", float),
+            "pulse_repetition_frequency": ("FETC:PRF?", float),
+            "pulse_width": ("FETC:WID?", float),
+        }
+        for _state in range(1, 5):
+            SNAPSHOT_FIELDS[f"state{_state}_mean"] = (f"FETC:STAT{_state}:MEAN?", float)
+            SNAPSHOT_FIELDS[f"state{_state}_maximum"] = (f"FETC:STAT{_state}:MAX?", float)
+            SNAPSHOT_FIELDS[f"state{_state}_minimum"] = (f"FETC:STAT{_state}:MIN?", float)
+        del _state
+
+        DEFAULT_SNAPSHOT_FIELDS = ("forward_power", "reflected_power", "temperature", "duty_cycle",
+                                   "frequency", "gate_count", "gate_maximum", "gate_minimum",
+                                   "gate_mean", "period", "pulse_repetition_frequency", "pulse_width")
+
         def __init__(self, instrobj):
             self._instr_obj = instrobj
             self.state = self.State(instrobj)
             self.temp = None
+            self._snapshot_types = {}
+
+        def snapshot(self, fields:list=None):
+            """
+            Gets several results from the most recent measurement in a single
+            round trip. All queries are joined into one SCPI message and the
+            combined reply is parsed in one pass, so every value comes from
+            the same measurement cycle. This does not initiate a new
+            measurement.
+
+            Args:
+                fields (list, optional): Names from Fetch.SNAPSHOT_FIELDS, for
+                    example ["forward_power", "reflected_power", "state1_mean"].
+                    Defaults to DEFAULT_SNAPSHOT_FIELDS.
+
+            Returns:
+                FetchSnapshot: A named tuple with one attribute per requested
+                field, in the requested order.
+            """
+            fields = tuple(self.DEFAULT_SNAPSHOT_FIELDS if fields is None else fields)
+            unknown = [f for f in fields if f not in self.SNAPSHOT_FIELDS]
+            if unknown or not fields:
+                raise ValueError(f"Unknown snapshot fields: {unknown}")
+
+            record_type = self._snapshot_types.get(fields)
+            if record_type is None:
+                record_type = namedtuple("FetchSnapshot", fields)
+                self._snapshot_types[fields] = record_type
+
+            cmd = ";:".join(self.SNAPSHOT_FIELDS[f][0] for f in fields)
+            values = self._instr_obj.query_ascii_values(cmd, separator=";", container=np.array)
+            if len(values) != len(fields):
+                raise ValueError(f"Expected {len(fields)} values from {cmd}, got {len(values)}")
+            return record_type._make(self.SNAPSHOT_FIELDS[f][1](v) for f, v in zip(fields, values))
         
         def forward_power(self):
             """
@@ -695,6 +1786,120 @@ and updates the file size and total number of blocks fields. The command is issu
             def __init__(self, instrobj):
                 self._instr_obj = instrobj
 
+    class Trace():
+        """Reads time-domain power traces straight into NumPy arrays.
+
+        The trace covers SENSe:SWEep:TIME seconds starting SENSe:SWEep:DELay
+        seconds from the trigger reference point. Both are read through the
+        settings cache, which reads the sweep time live while automatic
+        sweep time is on, so the axis always matches the sweep the sensor ran.
+
+        A trace is one binary block. By default it is read whole, and
+        read_chunk_size only sets how many bytes each VISA read requests.
+        Long sweeps can instead be read in segments of segment_points
+        points, straight into the result array, with each segment handed to
+        a callback as soon as it arrives.
+        """
+        def __init__(self, instrobj):
+            self._instr_obj = instrobj
+            self.is_big_endian = True
+            self._time_axis = None
+
+        def time_axis(self, points:int)->np.ndarray:
+            """Builds the time axis for a trace with the given number of points.
+
+            Args:
+                points (int): Number of points in the trace.
+
+            Returns:
+                np.ndarray: Seconds relative to the trigger reference point, one per point.
+            """
+            # Cached only while SENS:SWE:TIME:AUTO is off, otherwise read live
+            sweep_time = float(self._instr_obj.cached_query("SENS:SWE:TIME?").rstrip())
+            delay = float(self._instr_obj.cached_query("SENS:SWE:DEL?").rstrip())
+            key = (points, sweep_time, delay)
+            if self._time_axis is None or self._time_axis[0] != key:
+                axis = delay + np.arange(points, dtype=np.float64) * (sweep_time / points)
+                self._time_axis = (key, axis)
+            return self._time_axis[1]
+
+        def data(self, trigger:bool=False, read_chunk_size:int=None, segment_points:int=None, on_segment=None)->np.ndarray:
+            """Gets the power trace from the most recent measurement as a binary block.
+
+            Args:
+                trigger (bool, optional): Initiate a new measurement and wait for it
+                    to complete before reading, all in the same query. Defaults to False.
+                read_chunk_size (int, optional): Bytes requested by each VISA read
+                    while the block is received. Larger values mean fewer reads for
+                    long sweeps; the trace is still one block. Defaults to the pyvisa chunk size.
+                    Not used when reading in segments.
+                segment_points (int, optional): Read the trace this many points at
+                    a time. Defaults to None, which reads it in one go.
+                on_segment (callable, optional): With segment_points, called as
+                    on_segment(start, values) after each segment, where values
+                    holds the float32 points from index start on. Defaults to None.
+
+            Returns:
+                np.ndarray: float32 power values.
+            """
+            cmd = "INIT:IMM;*WAI;:TRAC:TIME:DATA?" if trigger else "TRAC:TIME:DATA?"
+            if segment_points is not None:
+                return self._segmented_data(cmd, segment_points, on_segment)
+            values = self._instr_obj.query_binary_values(cmd,
+                                                         datatype='f',
+                                                         is_big_endian=self.is_big_endian,
+                                                         container=np.ndarray,
+                                                         chunk_size=read_chunk_size)
+            return values.astype(np.float32, copy=False)
+
+        def _segmented_data(self, cmd:str, segment_points:int, on_segment)->np.ndarray:
+            dtype = np.dtype(np.float32).newbyteorder(">" if self.is_big_endian else "<")
+            done = [0]
+
+            def segment(data:bytearray, received:int):
+                end = received // dtype.itemsize
+                if on_segment is not None:
+                    values = np.frombuffer(data, dtype, count=end - done[0], offset=done[0] * dtype.itemsize)
+                    on_segment(done[0], values.astype(np.float32))
+                done[0] = end
+
+            data = self._instr_obj.query_block(cmd, segment_points * dtype.itemsize, segment)
+            return np.frombuffer(data, dtype).astype(np.float32)
+
+        def read(self, trigger:bool=False, read_chunk_size:int=None, segment_points:int=None):
+            """Gets the most recent trace along with its time axis.
+
+            Args:
+                trigger (bool, optional): Initiate a new measurement first. Defaults to False.
+                read_chunk_size (int, optional): Bytes requested by each VISA read. Defaults to the pyvisa chunk size.
+                segment_points (int, optional): Read the trace this many points at a time, see data().
+                    Defaults to None.
+
+            Returns:
+                tuple: (time axis in seconds, float32 power values).
+            """
+            values = self.data(trigger, read_chunk_size, segment_points)
+            return self.time_axis(len(values)), values
+
+        def stream(self, count:int=None, trigger:bool=True, read_chunk_size:int=None, segment_points:int=None):
+            """Yields traces back to back for as long as the caller iterates.
+
+            Args:
+                count (int, optional): Number of traces to read. Defaults to None, which never stops.
+                trigger (bool, optional): Initiate and wait for a fresh measurement
+                    for each trace. Use False with continuous triggering. Defaults to True.
+                read_chunk_size (int, optional): Bytes requested by each VISA read. Defaults to the pyvisa chunk size.
+                segment_points (int, optional): Read each trace this many points at a time, see data().
+                    Defaults to None.
+
+            Yields:
+                tuple: (time axis in seconds, float32 power values).
+            """
+            n = 0
+            while count is None or n < count:
+                yield self.read(trigger, read_chunk_size, segment_points)
+                n += 1
+
     class Format():
         def __init__(self, instrobj):
             self._instr_obj = instrobj
@@ -724,7 +1929,7 @@ and updates the file size and total number of blocks fields. The command is issu
             Returns:
                 int: 0 for OFF, 1 for ON
             """
-            return int(self._instr_obj.query("INIT:CONT?").rstrip())
+            return int(self._instr_obj.cached_query("INIT:CONT?").rstrip())
         
         @continuous.setter
         def continuous(self, state:int=0):
@@ -790,7 +1995,7 @@ and updates the file size and total number of blocks fields. The command is issu
                             Returns:
                                 int: Minimum of 1, maximum of 8.
                             """
-                            return self._instr_obj.query("SENS:SWE:TIME:AUTO:PER?")
+                            return self._instr_obj.cached_query("SENS:SWE:TIME:AUTO:PER?")
                         
                         @value.setter
                         def value(self, count:int=1):
@@ -808,7 +2013,7 @@ and updates the file size and total number of blocks fields. The command is issu
                         Returns:
                             int: 1 for enabled, 0 for disabled. 
                         """
-                        return self._instr_obj.query("SENS:SWE:TIME:AUTO?")
+                        return self._instr_obj.cached_query("SENS:SWE:TIME:AUTO?")
                     
                     @value.setter
                     def value(self, enabled:int=0):
@@ -826,7 +2031,7 @@ and updates the file size and total number of blocks fields. The command is issu
                         Returns:
                             float: Seconds (s).
                         """
-                        return self._instr_obj.query("SENS:SWE:TIME?")
+                        return self._instr_obj.cached_query("SENS:SWE:TIME?")
                     
                     @value.setter
                     def value(self, secs:float=0.0):
@@ -844,7 +2049,7 @@ and updates the file size and total number of blocks fields. The command is issu
                 Returns:
                     float: Value in seconds.
                 """
-                return self._instr_obj.query("SENS:SWE:DEL?")
+                return self._instr_obj.cached_query("SENS:SWE:DEL?")
             
             @delay.setter
             def delay(self, secs:float=0.0):
@@ -871,7 +2076,7 @@ and updates the file size and total number of blocks fields. The command is issu
                 Args:
                     None
                 """
-                return float(self._instr_obj.query(f"SENS:FREQ?\n").rstrip())
+                return float(self._instr_obj.cached_query(f"SENS:FREQ?\n").rstrip())
 
             @frequency.setter
             def frequency(self, frequency:float=1.0):
@@ -891,7 +2096,7 @@ and updates the file size and total number of blocks fields. The command is issu
                 Args:
                     None
                 """
-                return int(self._instr_obj.query(f"SENS:FREQ:AUTO?\n").rstrip())
+                return int(self._instr_obj.cached_query(f"SENS:FREQ:AUTO?\n").rstrip())
 
             @auto.setter
             def auto(self, state:int=True):
@@ -910,7 +2115,7 @@ and updates the file size and total number of blocks fields. The command is issu
                 Returns:
                     float: Min cal frequency.
                 """
-                return float(self._instr_obj.query(f"SENS:FREQ:RANG:LOW?\n").rstrip())
+                return float(self._instr_obj.cached_query(f"SENS:FREQ:RANG:LOW?\n", static=True).rstrip())
             
             @property
             def range_upper(self):
@@ -919,7 +2124,74 @@ and updates the file size and total number of blocks fields. The command is issu
                 Returns:
                     float: Max cal frequency.
                 """
-                return float(self._instr_obj.query(f"SENS:FREQ:RANG:UPP?\n").rstrip())
+                return float(self._instr_obj.cached_query(f"SENS:FREQ:RANG:UPP?\n", static=True).rstrip())
+
+            SWEEP_DTYPE = np.dtype([("frequency", "f8"), ("forward_power", "f8"), ("reflected_power", "f8")])
+
+            def sweep(self, frequencies, settle:float=0.0, progress=None)->np.ndarray:
+                """Measures forward and reflected power with the correction
+                frequency set to each point of a list in turn.
+
+                The points are checked against the calibrated range before
+                anything is sent. Each point then takes a single round trip
+                which sets the frequency, triggers one measurement, waits for
+                it with *OPC? and fetches the results. Automatic frequency
+                correction and continuous trigger are turned off for the sweep
+                and, with the frequency, restored afterwards.
+
+                Args:
+                    frequencies (array_like): Correction frequencies in Hz.
+                    settle (float, optional): Seconds to wait between setting the
+                        frequency and triggering. Defaults to 0.0, which sends
+                        each point as one message.
+                    progress (callable, optional): Called with (points done, total)
+                        after each point. Defaults to None.
+
+                Raises:
+                    ValueError: If the list is empty or a point is outside
+                        range_lower to range_upper.
+
+                Returns:
+                    np.ndarray: Structured array with fields "frequency",
+                    "forward_power" and "reflected_power", one row per point.
+                    reflected_power is NaN when reflected measurement is disabled.
+                """
+                frequencies = np.asarray(frequencies, dtype=np.float64).ravel()
+                if frequencies.size == 0:
+                    raise ValueError("No frequencies to sweep")
+                lower, upper = self.range_lower, self.range_upper
+                outside = (frequencies < lower) | (frequencies > upper)
+                if outside.any():
+                    raise ValueError(f"{frequencies[outside][0]} Hz is outside the calibrated range "
+                                     f"{lower} Hz to {upper} Hz")
+
+                reflected = int(self._instr_obj.cached_query("SENS:REFL:ENAB?").rstrip())
+                fetch = "FETC:AVER?;:FETC:REFL:AVER?" if reflected else "FETC:AVER?"
+                saved = {"SENS:FREQ": self._instr_obj.cached_query("SENS:FREQ?").strip(),
+                         "SENS:FREQ:AUTO": self._instr_obj.cached_query("SENS:FREQ:AUTO?").strip(),
+                         "INIT:CONT": self._instr_obj.cached_query("INIT:CONT?").strip()}
+
+                table = np.full(frequencies.size, np.nan, dtype=self.SWEEP_DTYPE)
+                table["frequency"] = frequencies
+                self._instr_obj.write("SENS:FREQ:AUTO 0;:INIT:CONT 0")
+                try:
+                    for j, frequency in enumerate(frequencies):
+                        if settle > 0:
+                            self._instr_obj.write(f"SENS:FREQ {frequency:.10g}")
+                            time.sleep(settle)
+                            reply = self._instr_obj.query(f"INIT:IMM;*OPC?;:{fetch}")
+                        else:
+                            reply = self._instr_obj.query(f"SENS:FREQ {frequency:.10g};:INIT:IMM;*OPC?;:{fetch}")
+                        values = reply.strip().split(";")[1:]
+                        table["forward_power"][j] = float(values[0])
+                        if reflected:
+                            table["reflected_power"][j] = float(values[1])
+                        if progress is not None:
+                            progress(j + 1, frequencies.size)
+                finally:
+                    # Written rather than queried so the settings cache is brought up to date
+                    self._instr_obj.write(";:".join(f"{cmd} {value}" for cmd, value in saved.items()))
+                return table
         
         @property
         def reflected_enable(self)->int:
@@ -928,7 +2200,7 @@ and updates the file size and total number of blocks fields. The command is issu
             Returns:
                 int: 1 for enabled, 0 for disabled.
             """
-            return int(self._instr_obj.query(f"SENS:REFL:ENAB?\n").rstrip())
+            return int(self._instr_obj.cached_query(f"SENS:REFL:ENAB?\n").rstrip())
         
         @reflected_enable.setter
         def reflected_enable(self, state:int=1):
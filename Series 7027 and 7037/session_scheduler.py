@@ -0,0 +1,268 @@
+"""
+Example Description:
+        This module presents a priority scheduler for sharing one 7027 or
+        7037 sensor between a fast measurement loop and slower housekeeping
+        such as temperature, gate counts, status or Plug and Play reads.
+
+        A single I/O thread owns the sensor, so callers never interleave on
+        the bus. Queued requests are served by priority class: measurement
+        fetches go ahead of any housekeeping that is waiting, and
+        housekeeping is limited to a share of the bus time by a token
+        bucket, so the primary sample rate stays stable while diagnostics
+        still run. A request already on the bus is always allowed to finish.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file session_scheduler.py
+
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+
+# Priority classes, served lowest value first
+MEASUREMENT = 0
+CONTROL = 1
+HOUSEKEEPING = 2
+
+_CLASS_NAMES = {MEASUREMENT: "measurement", CONTROL: "control", HOUSEKEEPING: "housekeeping"}
+
+
+@dataclass
+class ClassStatistics:
+    """Service statistics for one priority class.
+
+    Attributes:
+        completed (int): Requests served.
+        failed (int): Requests that raised.
+        queued (int): Requests waiting now.
+        mean_wait (float): Mean seconds from submit to the start of service.
+        max_wait (float): Longest wait in seconds.
+        bus_time (float): Total seconds spent executing the class's requests.
+    """
+    completed: int
+    failed: int
+    queued: int
+    mean_wait: float
+    max_wait: float
+    bus_time: float
+
+
+class _Request:
+    def __init__(self, function, priority:int):
+        self.function = function
+        self.priority = priority
+        self.future = Future()
+        self.submitted = time.monotonic()
+
+
+class SessionScheduler:
+    """Serves requests for one Series_7027 instance from one I/O thread, by priority.
+
+    Args:
+        sensor (Series_7027): A connected sensor. Once handed to the scheduler
+            it should only be used through the scheduler.
+        housekeeping_share (float, optional): Largest fraction of bus time
+            housekeeping may use over the long run. Defaults to 0.2.
+        housekeeping_burst (float, optional): Seconds of bus time housekeeping
+            may use back to back after an idle spell. Defaults to 0.05.
+    """
+    def __init__(self, sensor, housekeeping_share:float=0.2, housekeeping_burst:float=0.05):
+        if not 0 < housekeeping_share <= 1:
+            raise ValueError("housekeeping_share must be greater than 0 and at most 1")
+        self._sensor = sensor
+        self._share = housekeeping_share
+        self._burst = housekeeping_burst
+        self._tokens = housekeeping_burst
+        self._refilled = time.monotonic()
+        self._cond = threading.Condition()
+        self._heap = []
+        self._sequence = itertools.count()
+        self._closed = False
+        self._stats = {p: [0, 0, 0.0, 0.0, 0.0] for p in _CLASS_NAMES}     # completed, failed, wait sum, max wait, bus time
+        self._thread = threading.Thread(target=self._run, name="7027-scheduler", daemon=True)
+        self._thread.start()
+
+    def submit(self, function, priority:int=MEASUREMENT)->Future:
+        """Queues a request without waiting for it.
+
+        Args:
+            function (callable): Called with the sensor on the I/O thread, for
+                example lambda s: s.fetch.forward_power().
+            priority (int, optional): MEASUREMENT, CONTROL or HOUSEKEEPING. Defaults to MEASUREMENT.
+
+        Returns:
+            Future: Resolves to what function returns, or to the exception it raises.
+        """
+        if priority not in _CLASS_NAMES:
+            raise ValueError(f"Unknown priority class {priority!r}")
+        request = _Request(function, priority)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("The scheduler has been closed")
+            heapq.heappush(self._heap, (priority, next(self._sequence), request))
+            self._cond.notify()
+        return request.future
+
+    def call(self, function, priority:int=MEASUREMENT, timeout:float=None):
+        """Runs a request and waits for its result.
+
+        Args:
+            function (callable): Called with the sensor on the I/O thread.
+            priority (int, optional): MEASUREMENT, CONTROL or HOUSEKEEPING. Defaults to MEASUREMENT.
+            timeout (float, optional): Seconds to wait. Defaults to None, which waits indefinitely.
+
+        Returns:
+            The value returned by function.
+        """
+        return self.submit(function, priority).result(timeout)
+
+    def query(self, cmd:str, priority:int=HOUSEKEEPING, timeout:float=None)->str:
+        """Sends a query through the scheduler.
+
+        Args:
+            cmd (str): The SCPI query.
+            priority (int, optional): Defaults to HOUSEKEEPING.
+            timeout (float, optional): Seconds to wait. Defaults to None.
+
+        Returns:
+            str: The reply.
+        """
+        return self.call(lambda s: s.query(cmd), priority, timeout)
+
+    def write(self, cmd:str, priority:int=CONTROL, timeout:float=None):
+        """Sends a command through the scheduler and waits until it has been sent.
+
+        Args:
+            cmd (str): The SCPI command.
+            priority (int, optional): Defaults to CONTROL.
+            timeout (float, optional): Seconds to wait. Defaults to None.
+        """
+        self.call(lambda s: s.write(cmd), priority, timeout)
+
+    def measure(self, fields:list=None, timeout:float=None):
+        """Fetches several results with one query at measurement priority.
+
+        Args:
+            fields (list, optional): See Fetch.snapshot(). Defaults to DEFAULT_SNAPSHOT_FIELDS.
+            timeout (float, optional): Seconds to wait. Defaults to None.
+
+        Returns:
+            FetchSnapshot: The results.
+        """
+        return self.call(lambda s: s.fetch.snapshot(fields), MEASUREMENT, timeout)
+
+    def statistics(self)->dict:
+        """Returns service statistics per priority class.
+
+        Returns:
+            dict: ClassStatistics keyed by "measurement", "control" and "housekeeping".
+        """
+        with self._cond:
+            queued = {p: 0 for p in _CLASS_NAMES}
+            for priority, _, _ in self._heap:
+                queued[priority] += 1
+            return {_CLASS_NAMES[p]: ClassStatistics(completed=s[0],
+                                                     failed=s[1],
+                                                     queued=queued[p],
+                                                     mean_wait=s[2] / (s[0] + s[1]) if s[0] + s[1] else 0.0,
+                                                     max_wait=s[3],
+                                                     bus_time=s[4])
+                    for p, s in self._stats.items()}
+
+    def close(self):
+        """Stops the I/O thread once every queued request has been served.
+        The sensor itself is left open.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _refill(self, now:float):
+        self._tokens = min(self._burst, self._tokens + (now - self._refilled) * self._share)
+        self._refilled = now
+
+    def _next_request(self)->_Request:
+        # Called with the condition held; returns None once closed and drained
+        while True:
+            if self._heap:
+                priority, _, request = self._heap[0]
+                if priority != HOUSEKEEPING or self._closed:
+                    return heapq.heappop(self._heap)[2]
+                self._refill(time.monotonic())
+                if self._tokens > 0:
+                    return heapq.heappop(self._heap)[2]
+                # Wait for the bucket to refill, or for more urgent work
+                self._cond.wait(-self._tokens / self._share + 1e-4)
+            elif self._closed:
+                return None
+            else:
+                self._cond.wait()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                request = self._next_request()
+            if request is None:
+                return
+            if not request.future.set_running_or_notify_cancel():
+                continue
+
+            start = time.monotonic()
+            try:
+                result = request.function(self._sensor)
+                error = None
+            except Exception as e:
+                error = e
+            end = time.monotonic()
+
+            with self._cond:
+                stats = self._stats[request.priority]
+                stats[0 if error is None else 1] += 1
+                wait = start - request.submitted
+                stats[2] += wait
+                stats[3] = max(stats[3], wait)
+                stats[4] += end - start
+                if request.priority == HOUSEKEEPING:
+                    # Charge the bus time used; the bucket may go into debt
+                    self._refill(end)
+                    self._tokens -= end - start
+            if error is None:
+                request.future.set_result(result)
+            else:
+                request.future.set_exception(error)
@@ -0,0 +1,243 @@
+"""
+Example Description:
+        This module presents a simulator for the 7027 and 7037 sensors built
+        on pyvisa-sim (pip install pyvisa-sim==0.7.1) and the device
+        definitions in bird_7027_7037_sim.yaml, so Series_7027 and the
+        examples can be exercised without hardware.
+
+        On top of the YAML definitions it parses messages the way the sensor
+        does: compound commands separated by ";" get one joined reply, long
+        and short form headers are both accepted, and errors from commands
+        go to the SYST:ERR? queue. It also adds configurable response delays
+        and a measurement cycle, so repeated fetches within one cycle return
+        the same values and STAT:MEAS:EVEN? reports each new result once.
+
+        It reaches pyvisa-sim only through pyvisa_sim_adapter.py, so scripts
+        using it put the Common folder at the top of the repository on
+        sys.path first. The tests get a connected sensor from the fixtures in
+        conftest.py.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file simulator_7027_7037.py
+
+"""
+
+import math
+import os
+import threading
+import time
+from pyvisa_sim_adapter import NoResponse, SimulatedDevice, open_simulation
+from series_7027_7037 import Series_7027, _short_form
+
+SIM_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bird_7027_7037_sim.yaml")
+SIM_RESOURCE = "USB0::0x1422::0x7029::242104838::INSTR"
+
+# Contents of the simulated Plug and Play file, sent PNP_BLOCK_SIZE bytes
+# per block. It holds a line feed and bytes above 0x7f, which a binary
+# block must carry unchanged. The blocks are sent in the IEEE 488.2 format
+# PnP.download() assumes, which has not been checked against hardware.
+PNP_FILE = bytes.fromhex("8041c2b59f0e2a1c3d4e5f60718293a4b5c6d7e8f90a1b2c3d4e5f6071829304"
+                         "0a0d23ff00fe7f8001020304050607080910111213141516171819202122230a")
+PNP_BLOCK_SIZE = 32
+
+IDENTITIES = {
+    "7027": "Bird Technologies,7027,242104838,1.0.0",
+    "7037": "Bird Technologies,7037,242104839,1.0.0",
+}
+
+
+class _SensorFrontEnd():
+    # Takes over the writes to one simulated device so that messages are
+    # handled the way the sensor's SCPI parser handles them.
+    def __init__(self, device:SimulatedDevice, delay:float, delays:dict, measurement_period:float):
+        self._device = device
+        self._delay = delay
+        self._delays = {_short_form(k.rstrip("?")) + ("?" if k.endswith("?") else ""): v
+                        for k, v in (delays or {}).items()}
+        self._measurement_period = measurement_period
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        self._reported_cycle = 0
+        self._fetch_cycle = -1
+        self._fetch_replies = {}
+        self._triggered = False
+        self._input = bytearray()
+        device.intercept_writes(self.write)
+
+    def cycle_time(self)->float:
+        """Returns the seconds per measurement result at the present averaging."""
+        if int(self._device.get("average_state")):
+            return self._measurement_period * int(self._device.get("average_count"))
+        return self._measurement_period
+
+    def _cycle(self)->int:
+        return int((time.monotonic() - self._start) / self.cycle_time())
+
+    @staticmethod
+    def _normalise(cmd:str)->bytes:
+        # Short form header, and numbers in a form the {:g} setters accept
+        header, _, args = cmd.strip().partition(" ")
+        query = header.endswith("?")
+        header = _short_form(header.rstrip("?")) + ("?" if query else "")
+        if not args:
+            return header.encode()
+        values = []
+        for arg in args.split(","):
+            arg = arg.strip()
+            if arg.upper() in ("ON", "OFF"):
+                arg = "1" if arg.upper() == "ON" else "0"
+            try:
+                arg = f"{float(arg):.9e}"
+            except ValueError:
+                pass
+            values.append(arg)
+        return f"{header} {','.join(values)}".encode()
+
+    def _execute(self, query:bytes):
+        name = query.decode()
+        if name == "STAT:MEAS:EVEN?":
+            cycle = self._cycle()
+            new, self._reported_cycle = cycle > self._reported_cycle, max(cycle, self._reported_cycle)
+            return b"1" if new else b"0"
+        if name in ("INIT", "INIT:IMM"):
+            self._triggered = True
+        if name == "*OPC?" and self._triggered:
+            # Complete once the next measurement cycle has finished
+            self._triggered = False
+            cycle_time = self.cycle_time()
+            elapsed = time.monotonic() - self._start
+            time.sleep((math.floor(elapsed / cycle_time) + 1) * cycle_time - elapsed)
+        if name.startswith("FETC"):
+            cycle = self._cycle()
+            if cycle != self._fetch_cycle:
+                self._fetch_cycle = cycle
+                self._fetch_replies = {}
+            if query not in self._fetch_replies:
+                self._fetch_replies[query] = self._device.match(query)
+            return self._fetch_replies[query]
+        if name == "PNP:FILE:BLOC:DATA?":
+            start = (int(self._device.get("selected_channel")) - 1) * PNP_BLOCK_SIZE
+            block = PNP_FILE[start:start + PNP_BLOCK_SIZE]
+            return f"#{len(str(len(block)))}{len(block)}".encode() + block
+        if name in ("*RST", "*CLS"):
+            self._device.clear_errors()
+        return self._device.match(query)
+
+    def write(self, data:bytes):
+        with self._lock:
+            self._input.extend(data)
+            eom = self._device.query_eom
+            if not self._input.endswith(eom):
+                return
+            message = bytes(self._input[:-len(eom)]).decode("latin-1")
+            self._input = bytearray()
+
+            replies = []
+            delay = self._delay
+            for cmd in message.split(";"):
+                if not cmd.strip():
+                    continue
+                query = self._normalise(cmd)
+                delay += self._delays.get(query.decode().partition(" ")[0], 0.0)
+                response = self._execute(query)
+                if response is None:
+                    self._device.command_error()
+                elif response is NoResponse:
+                    continue
+                elif query.endswith(b"?"):
+                    replies.append(bytes(response))
+                else:
+                    # A command that answered has failed a range check
+                    self._device.push_error(bytes(response))
+
+            if delay > 0:
+                time.sleep(delay)
+            if replies:
+                self._device.send_reply(b";".join(replies))
+
+
+class Simulated7027():
+    """A simulated 7027 or 7037 sensor on its own pyvisa-sim resource manager.
+
+    Args:
+        model (str, optional): "7027" or "7037", which sets the *IDN? reply. Defaults to "7027".
+        delay (float, optional): Seconds added to every message, modelling the
+            USB round trip. Defaults to 0.0.
+        delays (dict, optional): Extra seconds per command header, long or short
+            form, for example {"FETC:AVER?": 0.002}. Defaults to None.
+        measurement_period (float, optional): Seconds per un-averaged result.
+            With averaging on, a result takes this times CALC:AVER:COUN.
+            Defaults to 0.001.
+    """
+    def __init__(self, model:str="7027", delay:float=0.0, delays:dict=None, measurement_period:float=0.001):
+        if model not in IDENTITIES:
+            raise ValueError(f"model must be one of {', '.join(IDENTITIES)}")
+        self.model = model
+        self._delay = delay
+        self._delays = delays
+        self._measurement_period = measurement_period
+        self.resource_manager = None
+        self.resource = SIM_RESOURCE
+        self.front_end = None
+
+    def start(self):
+        """Loads the device definitions and installs the sensor front end."""
+        self.resource_manager = open_simulation(SIM_FILE)
+        device = SimulatedDevice(self.resource_manager, self.resource)
+        device.initialise("identity", IDENTITIES[self.model])
+        self.front_end = _SensorFrontEnd(device, self._delay, self._delays, self._measurement_period)
+        return self
+
+    def connect(self, timeout:int=None, fast:bool=False)->Series_7027:
+        """Connects a new Series_7027 instance to the simulated sensor.
+
+        Args:
+            timeout (int, optional): VISA timeout in milliseconds. Defaults to the driver default.
+            fast (bool, optional): Use the driver's fast-connect mode. Defaults to False.
+
+        Returns:
+            Series_7027: The connected sensor.
+        """
+        if self.resource_manager is None:
+            self.start()
+        sensor = Series_7027(resource_manager=self.resource_manager)
+        sensor.connect(self.resource, timeout, fast=fast)
+        return sensor
+
+    def close(self):
+        """Closes the simulated resource manager."""
+        if self.resource_manager is not None:
+            self.resource_manager.close()
+            self.resource_manager = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
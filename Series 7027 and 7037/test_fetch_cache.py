@@ -0,0 +1,135 @@
+"""
+Example Description:
+        Tests for the FetchCache of series_7027_7037.py against the pyvisa-sim
+        simulator. Repeated fetches within one measurement cycle must be
+        answered from memory without bus traffic, and a new cycle or an
+        intervening write must send the next fetch to the sensor again.
+        With the cache on, a measurement the reader has already fetched must
+        not wake it again, while one detected by another thread's fetch
+        still must.
+
+        The sensors come from the simulated_7027 fixture in conftest.py.
+
+        Run with: python -m pytest test_fetch_cache.py
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file test_fetch_cache.py
+
+"""
+
+import threading
+import time
+import pytest
+
+
+@pytest.fixture
+def connect(simulated_7027):
+    def connect(measurement_period:float, delay:float=0.0, check_interval:float=0.01):
+        sensor = simulated_7027(delay=delay, measurement_period=measurement_period)
+        # One result per measurement period
+        sensor.calculate.average.state = 0
+        sensor.enable_fetch_cache(check_interval)
+        return sensor
+    return connect
+
+
+def fetches_sent(sensor)->int:
+    return sum("FETC" in record.command for record in sensor.io_log.records)
+
+
+def test_repeated_fetches_within_a_cycle_are_hits(connect):
+    sensor = connect(measurement_period=10.0, check_interval=10.0)
+    sensor.start_io_log()
+    cache = sensor.fetch_cache
+    first = sensor.fetch.forward_power()
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert fetches_sent(sensor) == 1
+    cycles = cache.cycles
+    for _ in range(5):
+        assert sensor.fetch.forward_power() == first
+    assert (cache.hits, cache.misses, cache.cycles) == (5, 1, cycles)
+    assert fetches_sent(sensor) == 1
+
+
+def test_new_cycle_invalidates_the_cache(connect):
+    sensor = connect(measurement_period=0.5, check_interval=0.1)
+    sensor.start_io_log()
+    cache = sensor.fetch_cache
+    sensor.fetch.forward_power()
+    sensor.fetch.forward_power()
+    cycles = cache.cycles
+    assert (cache.hits, cache.misses) == (1, 1)
+    time.sleep(0.6)
+    sensor.fetch.forward_power()
+    assert (cache.hits, cache.misses, cache.cycles) == (1, 2, cycles + 1)
+    assert fetches_sent(sensor) == 2
+
+
+def test_write_invalidates_the_cache(connect):
+    sensor = connect(measurement_period=10.0, check_interval=10.0)
+    sensor.start_io_log()
+    cache = sensor.fetch_cache
+    sensor.fetch.forward_power()
+    sensor.fetch.forward_power()
+    cycles = cache.cycles
+    sensor.write("CALC:AVER:CLE")
+    sensor.fetch.forward_power()
+    assert (cache.hits, cache.misses, cache.cycles) == (1, 2, cycles)
+    assert fetches_sent(sensor) == 2
+
+
+def test_measurements_are_not_repeated_with_the_cache_on(connect):
+    sensor = connect(measurement_period=0.003, delay=0.002)
+    readings = []
+    for reading in sensor.measurements(timeout=1.0):
+        readings.append(reading)
+        if len(readings) == 200:
+            break
+    assert len(readings) == 200
+    duplicates = sum(a == b for a, b in zip(readings, readings[1:]))
+    assert duplicates == 0
+
+
+def test_own_fetch_does_not_wake_the_reader(connect):
+    sensor = connect(measurement_period=0.2)
+    sensor.wait_for_measurement()
+    time.sleep(0.25)
+    # This miss reads the event for the measurement that just completed
+    sensor.fetch.forward_power()
+    assert not sensor.wait_for_measurement(timeout=0)
+
+
+def test_fetch_on_another_thread_still_wakes_the_reader(connect):
+    sensor = connect(measurement_period=0.2)
+    sensor.wait_for_measurement()
+    time.sleep(0.25)
+    reader = threading.Thread(target=sensor.fetch.forward_power)
+    reader.start()
+    reader.join()
+    assert sensor.wait_for_measurement(timeout=0)
+    assert not sensor.wait_for_measurement(timeout=0)
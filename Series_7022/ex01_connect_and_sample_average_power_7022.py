@@ -34,10 +34,15 @@ SOFTWARE.
  
 """
 
-import pyvisa as visa
 import csv
 import time
 import math
+import os
+import sys
+# acquisition_clock, used here and by series_7022, is in the shared Common folder
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Common"))
+from acquisition_clock import AcquisitionClock, SKIP
+from series_7022 import Series_7022
 
 def calculate_vswr(fwd_pow:float, rfl_power:float)->float:
     vswr = (1 + (rfl_power/fwd_pow)) / (1 - (rfl_power/fwd_pow))
@@ -64,13 +69,8 @@ def vswr_to_return_loss(VSWR:float) -> float:
     except:
         return 9.999e+37
 
-def sample_measurement_data(instobj:object):
-    response = instobj.query_binary_values(":TRAC:APOW?", datatype='f', is_big_endian=True)
-    dud = response[0]
-    fwd = response[2]
-    rfl = response[4]
-    temp = response[6]
-    freq = response[8]
+def sample_measurement_data(sensor:Series_7022):
+    fwd, rfl, temp, freq = sensor.sample()
     vswr = calculate_vswr(fwd_pow=fwd, rfl_power=rfl)
     rl = vswr_to_return_loss(vswr)
     return fwd, rfl, temp, freq, vswr, rl
@@ -81,14 +81,12 @@ output_data_path = time.strftime("C:\\Temp\\7022_rf_power_data_%Y-%m-%d_%H-%M-%S
 # Instrument resource string
 MY7022 = "USB0::0x1422::0x7022::141100792::INSTR"
 
-# Open the resource manager and instrument
-rm = visa.ResourceManager()
-my7022 = rm.open_resource(MY7022)
-my7022.write("*RST")
-my7022.write("*CLS")
+# Open the instrument
+my7022 = Series_7022()
+my7022.connect(MY7022)
 time.sleep(1.5)
 
-print(my7022.query("*IDN?"))
+print(my7022.identity)
 
 # Define the header for the CSV
 header = ['Time (s)', 'Fwd_Power (W)', 'Refl_Power (W)', 'VSWR', "Return Loss (dB)", "Temperature (deg C)"]
@@ -98,18 +96,21 @@ with open(output_data_path, mode='a', newline='') as file:
     writer = csv.writer(file)
     writer.writerow(header)  # Write the header
 
-    mins_to_log = 1 # since the delay within the loop is 0.5s, it should take approximately 120 samples to fill a minute, so set the minutes here
+    mins_to_log = 1 # since the sample interval is 0.5s, it takes 120 samples to fill a minute, so set the minutes here
     
-    t1 = time.time()
+    clock = AcquisitionClock(interval=0.5, overrun_policy=SKIP)
     for j in range (120*mins_to_log):
         fwd, rfl, temp, freq, vswr, rl = sample_measurement_data(my7022)
-        t2 = time.time()
-        elapsed_time = f"{t2-t1:.3f}"
+        elapsed_time = f"{clock.elapsed():.3f}"
         print(f"MEAS {j} -> FREQ = {freq:3.3f} MHz, FWD_POW = {fwd:0.4f} W, RFL_POW = {rfl:0.4f}, VSWR = {vswr:0.2f}, RET_LOSS = {rl} dBm, TEMP = {temp:0.2f} C, Elapsed Time = {elapsed_time}")
         data = [elapsed_time, f"{fwd:0.3f}", f"{rfl:0.3f}", f"{vswr:0.2f}", rl, f"{temp:0.2f}"]
         writer.writerow(data)   # Write the data
 
-        time.sleep(0.5)
+        # Sleep until the next 0.5 s slot on the absolute schedule
+        clock.wait()
 
-my7022.close()
-rm.close()
+    stats = clock.statistics()
+    print(f"Samples: {stats.ticks}, overruns: {stats.overruns}, skipped: {stats.skipped}")
+    print(f"Jitter mean/std/max: {stats.mean_jitter*1e3:0.3f}/{stats.std_jitter*1e3:0.3f}/{stats.max_jitter*1e3:0.3f} ms")
+
+my7022.disconnect()
@@ -4,6 +4,11 @@ from tkinter import ttk
 import threading
 import time
 import math
+import os
+import sys
+# series_7022 imports acquisition_clock from the shared Common folder
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Common"))
+from series_7022 import Series_7022
 
 class PowerSensorUI:
     def __init__(self, master):
@@ -80,11 +85,11 @@ class PowerSensorUI:
             return
 
         try:
-            self.inst = self.rm.open_resource(resource)
-            self.inst.timeout = 5000
+            self.inst = Series_7022(resource_manager=self.rm)
+            self.inst.connect(resource, timeout=5000, reset=False)
 
             # Get sensor ID for title bar
-            sensor_id = self.query_sensor("*IDN?")
+            sensor_id = self.inst.identity
             if not sensor_id:
                 sensor_id = "Bird 7022 Power Sensor"
             self.master.title(sensor_id[:64])
@@ -103,7 +108,7 @@ class PowerSensorUI:
         self.running = False
         if self.inst:
             try:
-                self.inst.close()
+                self.inst.disconnect()
             except Exception:
                 pass
             self.inst = None
@@ -145,13 +150,8 @@ class PowerSensorUI:
         except:
             return 9.999e+37
 
-    def sample_measurement_data(self, instobj:object):
-        response = instobj.query_binary_values(":TRAC:APOW?", datatype='f', is_big_endian=True)
-        dud = response[0]
-        fwd = response[2]
-        rfl = response[4]
-        temp = response[6]
-        freq = response[8]
+    def sample_measurement_data(self, sensor:Series_7022):
+        fwd, rfl, temp, freq = sensor.sample()
         vswr = self.calculate_vswr(fwd_pow=fwd, rfl_power=rfl)
         rl = self.vswr_to_return_loss(vswr)
         return fwd, rfl, temp, freq, vswr, rl
@@ -0,0 +1,223 @@
+"""
+Example Description:
+        This module presents a driver for the Bird 7022 RF power sensor.
+
+        Results are read with :TRAC:APOW?, which returns one IEEE 488.2
+        definite length block of ten big-endian float32 values. The block is
+        read as raw bytes and decoded with a numpy view straight onto the
+        receive buffer, taking every second value, so no Python list is
+        built for each reading. acquire() fills a preallocated array with a
+        run of readings for logging and analysis.
+
+        acquisition_clock is imported from the Common folder at the top of
+        the repository, which scripts using this module put on sys.path.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file series_7022.py
+
+"""
+
+import time
+from collections import namedtuple
+import numpy as np
+import pyvisa
+from pyvisa import util
+from acquisition_clock import AcquisitionClock, SKIP
+
+Reading = namedtuple("Reading", ["forward_power", "reflected_power", "temperature", "frequency"])
+
+# Layout of the :TRAC:APOW? block: ten big-endian float32 values, of which
+# the even ones hold the results
+APOW_DTYPE = np.dtype(">f4")
+APOW_VALUES = 10
+# Slice of the block holding forward power (W), reflected power (W),
+# temperature (C) and frequency (MHz), in that order
+APOW_FIELDS = slice(2, APOW_VALUES, 2)
+
+# One row of acquire(): seconds since the start of the run, then the Reading fields
+ACQUIRE_DTYPE = np.dtype([("time", "f8")] + [(name, "f8") for name in Reading._fields])
+
+
+class Series_7022():
+    """Driver for the Bird 7022 RF power sensor.
+
+    Args:
+        instrument_resource_string (str, optional): VISA resource string. Can also be given to connect().
+        resource_manager (pyvisa.ResourceManager, optional): The resource manager
+            to open the sensor with, for example one on the pyvisa-sim backend.
+            Defaults to a new pyvisa.ResourceManager() on connect.
+    """
+    def __init__(self, instrument_resource_string:str=None, resource_manager=None):
+        self._instrument_resource_string = instrument_resource_string
+        self._resource_manager = resource_manager
+        self._instr_obj = None
+        self._timeout = 5000
+        self._mfg_id = ""
+        self._model = ""
+        self._sn = ""
+        self._fw = ""
+        self._general = ""
+
+    def connect(self, instrument_resource_string:str=None, timeout:int=None, reset:bool=True):
+        """Opens the connection to the sensor.
+
+        Args:
+            instrument_resource_string (str, optional): VISA resource string. Defaults to the one given to the constructor.
+            timeout (int, optional): VISA timeout in milliseconds. Defaults to 5000.
+            reset (bool, optional): Send *RST and *CLS after opening. Defaults to True.
+        """
+        if instrument_resource_string is not None:
+            self._instrument_resource_string = instrument_resource_string
+        if self._resource_manager is None:
+            self._resource_manager = pyvisa.ResourceManager()
+
+        self._instr_obj = self._resource_manager.open_resource(self._instrument_resource_string)
+        if timeout is not None:
+            self._timeout = timeout
+        self._instr_obj.timeout = self._timeout
+        self._instr_obj.write_termination = "\n"
+        self._instr_obj.read_termination = "\n"
+
+        if reset:
+            self.write("*RST")
+            self.write("*CLS")
+
+        self._general = self.query("*IDN?").rstrip()
+        self._mfg_id, self._model, self._sn, self._fw = self._general.split(',')
+
+    def disconnect(self):
+        """Closes the connection to the sensor."""
+        if self._instr_obj is not None:
+            self._instr_obj.close()
+            self._instr_obj = None
+
+    def write(self, cmd:str):
+        self._instr_obj.write(cmd)
+
+    def query(self, cmd:str)->str:
+        return self._instr_obj.query(cmd)
+
+    def read_block(self)->np.ndarray:
+        """Reads one :TRAC:APOW? result.
+
+        Returns:
+            np.ndarray: The ten big-endian float32 values of the block, as a
+            read-only view onto the bytes received.
+        """
+        instr = self._instr_obj
+        instr.write(":TRAC:APOW?")
+        block = instr.read_raw()
+        offset, length = util.parse_ieee_block_header(block)
+        # A value byte that equals the termination character ends read_raw()
+        # early, so fetch whatever is left of the block and its terminator
+        missing = offset + length + len(instr.read_termination or "") - len(block)
+        if missing > 0:
+            block += instr.read_bytes(missing)
+        if length < APOW_VALUES * APOW_DTYPE.itemsize:
+            raise ValueError(f"Expected {APOW_VALUES} values from :TRAC:APOW?, got {length // APOW_DTYPE.itemsize}")
+        return np.frombuffer(block, dtype=APOW_DTYPE, count=APOW_VALUES, offset=offset)
+
+    def sample(self)->Reading:
+        """Reads forward and reflected power, temperature and frequency in one query.
+
+        Returns:
+            Reading: Forward power (W), reflected power (W), temperature (C) and frequency (MHz).
+        """
+        return Reading._make(self.read_block()[APOW_FIELDS].tolist())
+
+    def acquire(self, n:int, interval:float=None, out:np.ndarray=None)->np.ndarray:
+        """Takes n readings into an array, one :TRAC:APOW? query each.
+
+        Args:
+            n (int): Number of readings.
+            interval (float, optional): Seconds between readings, kept on a
+                drift-free schedule. Defaults to None, which reads back to back.
+            out (np.ndarray, optional): Array of ACQUIRE_DTYPE with at least n
+                rows to fill, so repeated runs reuse one buffer. Defaults to a new array.
+
+        Returns:
+            np.ndarray: The first n rows of out, with fields time, forward_power,
+            reflected_power, temperature and frequency.
+        """
+        if out is None:
+            out = np.empty(n, dtype=ACQUIRE_DTYPE)
+        elif out.dtype != ACQUIRE_DTYPE or len(out) < n:
+            raise ValueError(f"out must be an array of ACQUIRE_DTYPE with at least {n} rows")
+        out = out[:n]
+        # Every field is float64, so the rows can be filled as a plain 2-D array
+        table = out.view(np.float64).reshape(n, len(ACQUIRE_DTYPE.names))
+
+        clock = AcquisitionClock(interval, SKIP) if interval else None
+        start = time.perf_counter()
+        for j in range(n):
+            table[j, 0] = time.perf_counter() - start
+            table[j, 1:] = self.read_block()[APOW_FIELDS]
+            if clock is not None and j + 1 < n:
+                clock.wait()
+        return out
+
+    @property
+    def manufacturer_id(self):
+        """Returns the instrument/sensor manufacturer ID.
+
+        Returns:
+            str: The instrument/sensor manufacturer ID.
+        """
+        return self._mfg_id
+
+    @property
+    def model_number(self):
+        """Returns the instrument/sensor model number.
+
+        Returns:
+            str: The instrument/sensor model number.
+        """
+        return self._model
+
+    @property
+    def firmware_version(self):
+        """Returns the instrument/sensor firmware version.
+
+        Returns:
+            str: The instrument/sensor firmware version.
+        """
+        return self._fw
+
+    @property
+    def serial_number(self):
+        """Returns the instrument/sensor serial number.
+
+        Returns:
+            str: The instrument/sensor serial number.
+        """
+        return self._sn
+
+    @property
+    def identity(self):
+        """Returns the *IDN? reply read on connect."""
+        return self._general
@@ -0,0 +1,95 @@
+"""
+Example Description:
+        This module presents a simulator for the 7022 sensor built on
+        pyvisa-sim (pip install pyvisa-sim==0.7.1) and the device definitions
+        in bird_7022_sim.yaml, so Series_7022 and the examples can be
+        exercised without hardware. A configurable delay on every message
+        models the USB round trip, as in the 7027 and 7037 simulator.
+
+        It reaches pyvisa-sim only through pyvisa_sim_adapter.py, so scripts
+        using it put the Common folder at the top of the repository on
+        sys.path first.
+
+@verbatim
+
+The MIT License (MIT)
+
+Copyright (c) 2026 Bird
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+@endverbatim
+
+@file simulator_7022.py
+
+"""
+
+import os
+from pyvisa_sim_adapter import SimulatedDevice, open_simulation
+from series_7022 import Series_7022
+
+SIM_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bird_7022_sim.yaml")
+SIM_RESOURCE = "USB0::0x1422::0x7022::141100792::INSTR"
+
+
+class Simulated7022():
+    """A simulated 7022 sensor on its own pyvisa-sim resource manager.
+
+    Args:
+        delay (float, optional): Seconds added to every message, modelling the
+            USB round trip. Defaults to 0.0.
+    """
+    def __init__(self, delay:float=0.0):
+        self._delay = delay
+        self.resource_manager = None
+        self.resource = SIM_RESOURCE
+
+    def start(self):
+        """Loads the device definitions and applies the delay."""
+        self.resource_manager = open_simulation(SIM_FILE)
+        if self._delay > 0:
+            SimulatedDevice(self.resource_manager, self.resource).delay_replies(self._delay)
+        return self
+
+    def connect(self, timeout:int=None)->Series_7022:
+        """Connects a new Series_7022 instance to the simulated sensor.
+
+        Args:
+            timeout (int, optional): VISA timeout in milliseconds. Defaults to the driver default.
+
+        Returns:
+            Series_7022: The connected sensor.
+        """
+        if self.resource_manager is None:
+            self.start()
+        sensor = Series_7022(resource_manager=self.resource_manager)
+        sensor.connect(self.resource, timeout)
+        return sensor
+
+    def close(self):
+        """Closes the simulated resource manager."""
+        if self.resource_manager is not None:
+            self.resource_manager.close()
+            self.resource_manager = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()